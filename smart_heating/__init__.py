@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_track_time_interval
 
 from .api import setup_api
+from .api_handlers.devices import async_track_device_cache_invalidation
 from .advanced_metrics_collector import AdvancedMetricsCollector
 from .area_logger import AreaLogger
 from .area_manager import AreaManager
@@ -236,6 +237,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await setup_api(hass, area_manager)
     await setup_websocket(hass)
 
+    # Drop the cached device list whenever HA's registries change
+    hass.data[DOMAIN]["device_cache_unsub"] = async_track_device_cache_invalidation(
+        hass
+    )
+
     # Discover OpenTherm Gateway capabilities if configured
     if area_manager.opentherm_gateway_id:
 
@@ -660,6 +666,10 @@ async def _shutdown_components(hass: HomeAssistant, entry: ConfigEntry) -> None:
         hass.data[DOMAIN]["climate_unsub"]()
         _LOGGER.debug("Climate controller stopped")
 
+    # Stop device cache invalidation
+    if "device_cache_unsub" in hass.data[DOMAIN]:
+        hass.data[DOMAIN]["device_cache_unsub"]()
+
     # Stop schedule executor
     if "schedule_executor" in hass.data[DOMAIN]:
         await call_maybe_async(hass.data[DOMAIN]["schedule_executor"].async_stop)
@@ -682,6 +692,7 @@ async def _cleanup_tasks(hass: HomeAssistant) -> None:
         "advanced_metrics_task",
         "initial_control_task",
         "discover_capabilities_task",
+        "refresh_task",
     ):
         try:
             t = hass.data[DOMAIN].get(task_key)
@@ -1,6 +1,8 @@
 """Flask API server for Smart Heating - Refactored to use modular handlers."""
 
+import functools
 import logging
+from collections.abc import Awaitable, Callable
 
 import aiofiles
 from aiohttp import web
@@ -104,7 +106,7 @@ from .api_handlers.opentherm import (
 )
 from .area_manager import AreaManager
 from .const import DOMAIN
-from .coordinator import SmartHeatingCoordinator
+from .utils.coordinator_helpers import get_entry_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -114,6 +116,111 @@ ENDPOINT_PREFIX_AREAS = "areas/"
 _USERS_PATH = "users/"
 
 
+def _api_error_boundary(
+    method: Callable[..., Awaitable[web.Response]],
+) -> Callable[..., Awaitable[web.Response]]:
+    """Turn unhandled handler exceptions into JSON 500 responses.
+
+    Single error boundary for all API methods, so individual handlers only
+    need to catch the errors they map to a specific status code.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(
+        self: "SmartHeatingAPIView", request: web.Request, endpoint: str
+    ) -> web.Response:
+        try:
+            return await method(self, request, endpoint)
+        except Exception as err:
+            _LOGGER.error("Error handling %s %s: %s", request.method, endpoint, err)
+            return web.json_response({"error": str(err)}, status=500)
+
+    return wrapper
+
+
+# Endpoint dispatch tables, built once at import. Handlers that take the
+# view's attributes are wrapped in lambdas; the rest are referenced directly.
+
+# Global configuration GET endpoints: endpoint -> handler(view)
+_CONFIG_GET_HANDLERS: dict[str, Callable[..., Awaitable[web.Response]]] = {
+    "config": lambda view: handle_get_config(view.hass, view.area_manager),
+    "global_presets": lambda view: handle_get_global_presets(view.area_manager),
+    "global_presence": lambda view: handle_get_global_presence(view.area_manager),
+    "hysteresis": lambda view: handle_get_hysteresis(view.area_manager),
+    "vacation_mode": lambda view: handle_get_vacation_mode(view.hass),
+    "safety_sensor": lambda view: handle_get_safety_sensor(view.area_manager),
+    "config/advanced_control": lambda view: handle_get_config(
+        view.hass, view.area_manager
+    ),
+    "history/config": lambda view: handle_get_history_config(view.hass),
+    "history/storage/info": lambda view: handle_get_history_storage_info(view.hass),
+    "history/storage/database/stats": lambda view: handle_get_database_stats(view.hass),
+}
+
+# Area action POST endpoints without a body: action -> handler(hass,
+# area_manager, area_id)
+_AREA_ACTION_POST_HANDLERS: dict[str, Callable[..., Awaitable[web.Response]]] = {
+    "enable": handle_enable_area,
+    "disable": handle_disable_area,
+    "hide": handle_hide_area,
+    "unhide": handle_unhide_area,
+    "cancel_boost": handle_cancel_boost,
+}
+
+# Area POST endpoints with a body: last path segment -> handler(hass,
+# area_manager, area_id, data)
+_AREA_DATA_POST_HANDLERS: dict[str, Callable[..., Awaitable[web.Response]]] = {
+    "devices": handle_add_device,
+    "schedules": handle_add_schedule,
+    "temperature": handle_set_temperature,
+    "preset_mode": handle_set_preset_mode,
+    "boost": handle_set_boost_mode,
+    "window_sensors": handle_add_window_sensor,
+    "presence_sensors": handle_add_presence_sensor,
+    "hvac_mode": handle_set_hvac_mode,
+    "heating_curve": handle_set_area_heating_curve,
+    "switch_shutdown": handle_set_switch_shutdown,
+    "hysteresis": handle_set_area_hysteresis,
+    "heating_type": handle_set_heating_type,
+    "auto_preset": handle_set_auto_preset,
+    "preset_config": handle_set_area_preset_config,
+    "manual_override": handle_set_manual_override,
+    "primary_temp_sensor": handle_set_primary_temperature_sensor,
+}
+
+# Global configuration POST endpoints: endpoint -> handler(view, data)
+_GLOBAL_CONFIG_POST_HANDLERS: dict[str, Callable[..., Awaitable[web.Response]]] = {
+    "frost_protection": lambda view, data: handle_set_frost_protection(
+        view.area_manager, data
+    ),
+    "history/config": lambda view, data: handle_set_history_config(view.hass, data),
+    "history/storage/migrate": lambda view, data: handle_migrate_history_storage(
+        view.hass, data
+    ),
+    "history/cleanup": lambda view, data: handle_cleanup_history(view.hass),
+    "global_presets": lambda view, data: handle_set_global_presets(
+        view.area_manager, data
+    ),
+    "global_presence": lambda view, data: handle_set_global_presence(
+        view.area_manager, data
+    ),
+    "hide_devices_panel": lambda view, data: handle_set_hide_devices_panel(
+        view.area_manager, data
+    ),
+    "config/advanced_control": lambda view, data: handle_set_advanced_control_config(
+        view.area_manager, data
+    ),
+    "vacation_mode": lambda view, data: handle_enable_vacation_mode(view.hass, data),
+    "safety_sensor": lambda view, data: handle_set_safety_sensor(
+        view.hass, view.area_manager, data
+    ),
+    "call_service": lambda view, data: handle_call_service(view.hass, data),
+    "hysteresis": lambda view, data: handle_set_hysteresis_value(
+        view.hass, view.area_manager, view._get_coordinator(), data
+    ),
+}
+
+
 class SmartHeatingAPIView(HomeAssistantView):
     """API view for Smart Heating - uses modular handlers."""
 
@@ -131,14 +238,6 @@ class SmartHeatingAPIView(HomeAssistantView):
         self.hass = hass
         self.area_manager = area_manager
 
-    def _get_coordinator(self) -> SmartHeatingCoordinator | None:
-        """Return first SmartHeatingCoordinator instance stored in hass.data for this domain."""
-        domain_data = self.hass.data.get(DOMAIN, {})
-        for v in domain_data.values():
-            if isinstance(v, SmartHeatingCoordinator):
-                return v
-        return None
-
     async def _handle_area_endpoints_get(
         self, request: web.Request, endpoint: str
     ) -> web.Response | None:
@@ -152,7 +251,7 @@ class SmartHeatingAPIView(HomeAssistantView):
             Response if handled, None otherwise
         """
         if endpoint == "areas":
-            return await handle_get_areas(self.hass, self.area_manager)
+            return await handle_get_areas(self.hass, self.area_manager, request)
 
         if not endpoint.startswith(ENDPOINT_PREFIX_AREAS):
             return None
@@ -185,25 +284,8 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             Response if handled, None otherwise
         """
-        config_handlers = {
-            "config": lambda: handle_get_config(self.hass, self.area_manager),
-            "global_presets": lambda: handle_get_global_presets(self.area_manager),
-            "global_presence": lambda: handle_get_global_presence(self.area_manager),
-            "hysteresis": lambda: handle_get_hysteresis(self.area_manager),
-            "vacation_mode": lambda: handle_get_vacation_mode(self.hass),
-            "safety_sensor": lambda: handle_get_safety_sensor(self.area_manager),
-            "config/advanced_control": lambda: handle_get_config(
-                self.hass, self.area_manager
-            ),
-            "history/config": lambda: handle_get_history_config(self.hass),
-            "history/storage/info": lambda: handle_get_history_storage_info(self.hass),
-            "history/storage/database/stats": lambda: handle_get_database_stats(
-                self.hass
-            ),
-        }
-
-        handler = config_handlers.get(endpoint)
-        return await handler() if handler else None
+        handler = _CONFIG_GET_HANDLERS.get(endpoint)
+        return await handler(self) if handler else None
 
     async def _handle_user_endpoints_get(
         self, request: web.Request, endpoint: str
@@ -302,7 +384,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         # Device endpoints
         if endpoint == "devices":
-            return await handle_get_devices(self.hass, self.area_manager)
+            return await handle_get_devices(self.hass, self.area_manager, request)
         elif endpoint == "devices/refresh":
             return await handle_refresh_devices(self.hass, self.area_manager)
 
@@ -382,12 +464,12 @@ class SmartHeatingAPIView(HomeAssistantView):
         """
         # Devices and sensors
         response = await self._handle_devices_sensors_get(request, endpoint)
-        if response:
+        if response is not None:
             return response
 
         # Config endpoints
         response = await self._handle_config_endpoints_get(request, endpoint)
-        if response:
+        if response is not None:
             return response
 
         # Import/Export endpoints
@@ -401,12 +483,12 @@ class SmartHeatingAPIView(HomeAssistantView):
 
         # User endpoints
         response = await self._handle_user_endpoints_get(request, endpoint)
-        if response:
+        if response is not None:
             return response
 
         # Efficiency endpoints
         response = await self._handle_efficiency_endpoints_get(request, endpoint)
-        if response:
+        if response is not None:
             return response
 
         # Comparison endpoints
@@ -425,11 +507,12 @@ class SmartHeatingAPIView(HomeAssistantView):
 
         # OpenTherm and metrics
         response = await self._handle_opentherm_metrics_get(request, endpoint)
-        if response:
+        if response is not None:
             return response
 
         return None
 
+    @_api_error_boundary
     async def get(self, request: web.Request, endpoint: str) -> web.Response:
         """Handle GET requests.
 
@@ -440,35 +523,27 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        try:
-            # System endpoints
-            if endpoint == "status":
-                return await handle_get_status(self.area_manager)
-
-            # Area endpoints
-            response = await self._handle_area_endpoints_get(request, endpoint)
-            if response:
-                return response
-
-            # Try all other endpoint handlers
-            response = await self._handle_other_endpoints_get(request, endpoint)
-            if response:
-                return response
-
-            else:
-                return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
-        except Exception as err:
-            _LOGGER.error("Error handling GET %s: %s", endpoint, err)
-            return web.json_response({"error": str(err)}, status=500)
+        # System endpoints
+        if endpoint == "status":
+            return await handle_get_status(self.area_manager)
 
-    async def _handle_area_action_post(
-        self, endpoint: str, action: str
-    ) -> web.Response | None:
+        # Area endpoints
+        response = await self._handle_area_endpoints_get(request, endpoint)
+        if response is not None:
+            return response
+
+        # Try all other endpoint handlers
+        response = await self._handle_other_endpoints_get(request, endpoint)
+        if response is not None:
+            return response
+
+        return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
+
+    async def _handle_area_action_post(self, endpoint: str) -> web.Response | None:
         """Handle area action endpoints (no body required).
 
         Args:
             endpoint: Full endpoint path
-            action: Action name (enable, disable, hide, unhide, cancel_boost)
 
         Returns:
             Response if handled, None otherwise
@@ -476,18 +551,10 @@ class SmartHeatingAPIView(HomeAssistantView):
         if not endpoint.startswith(ENDPOINT_PREFIX_AREAS):
             return None
 
-        if endpoint.endswith(f"/{action}"):
+        handler = _AREA_ACTION_POST_HANDLERS.get(endpoint.rpartition("/")[2])
+        if handler:
             area_id = endpoint.split("/")[1]
-            handlers = {
-                "enable": handle_enable_area,
-                "disable": handle_disable_area,
-                "hide": handle_hide_area,
-                "unhide": handle_unhide_area,
-                "cancel_boost": handle_cancel_boost,
-            }
-            handler = handlers.get(action)
-            if handler:
-                return await handler(self.hass, self.area_manager, area_id)
+            return await handler(self.hass, self.area_manager, area_id)
         return None
 
     async def _handle_area_data_post(
@@ -507,61 +574,9 @@ class SmartHeatingAPIView(HomeAssistantView):
 
         area_id = endpoint.split("/")[1]
 
-        # Map endpoint suffixes to handlers
-        endpoint_handlers = {
-            "/devices": lambda: handle_add_device(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/schedules": lambda: handle_add_schedule(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/temperature": lambda: handle_set_temperature(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/preset_mode": lambda: handle_set_preset_mode(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/boost": lambda: handle_set_boost_mode(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/window_sensors": lambda: handle_add_window_sensor(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/presence_sensors": lambda: handle_add_presence_sensor(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/hvac_mode": lambda: handle_set_hvac_mode(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/heating_curve": lambda: handle_set_area_heating_curve(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/switch_shutdown": lambda: handle_set_switch_shutdown(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/hysteresis": lambda: handle_set_area_hysteresis(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/heating_type": lambda: handle_set_heating_type(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/auto_preset": lambda: handle_set_auto_preset(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/preset_config": lambda: handle_set_area_preset_config(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/manual_override": lambda: handle_set_manual_override(
-                self.hass, self.area_manager, area_id, data
-            ),
-            "/primary_temp_sensor": lambda: handle_set_primary_temperature_sensor(
-                self.hass, self.area_manager, area_id, data
-            ),
-        }
-
-        for suffix, handler in endpoint_handlers.items():
-            if endpoint.endswith(suffix):
-                return await handler()
+        handler = _AREA_DATA_POST_HANDLERS.get(endpoint.rpartition("/")[2])
+        if handler:
+            return await handler(self.hass, self.area_manager, area_id, data)
 
         return None
 
@@ -571,25 +586,7 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             Coordinator instance or None
         """
-        entry_ids = [
-            key
-            for key in self.hass.data[DOMAIN].keys()
-            if key
-            not in [
-                "history",
-                "climate_controller",
-                "schedule_executor",
-                "climate_unsub",
-                "learning_engine",
-                "area_logger",
-                "vacation_manager",
-                "safety_monitor",
-                "config_manager",
-                "user_manager",
-                "comparison_engine",
-            ]
-        ]
-        return self.hass.data[DOMAIN][entry_ids[0]] if entry_ids else None
+        return get_entry_coordinator(self.hass)
 
     async def _handle_global_config_post(
         self, endpoint: str, data: dict
@@ -603,45 +600,12 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             Response if handled, None otherwise
         """
-        handlers = {
-            "frost_protection": lambda: handle_set_frost_protection(
-                self.area_manager, data
-            ),
-            "history/config": lambda: handle_set_history_config(self.hass, data),
-            "history/storage/migrate": lambda: handle_migrate_history_storage(
-                self.hass, data
-            ),
-            "history/cleanup": lambda: handle_cleanup_history(self.hass),
-            "global_presets": lambda: handle_set_global_presets(
-                self.area_manager, data
-            ),
-            "global_presence": lambda: handle_set_global_presence(
-                self.area_manager, data
-            ),
-            "hide_devices_panel": lambda: handle_set_hide_devices_panel(
-                self.area_manager, data
-            ),
-            "config/advanced_control": lambda: handle_set_advanced_control_config(
-                self.area_manager, data
-            ),
-            "vacation_mode": lambda: handle_enable_vacation_mode(self.hass, data),
-            "safety_sensor": lambda: handle_set_safety_sensor(
-                self.hass, self.area_manager, data
-            ),
-            "call_service": lambda: handle_call_service(self.hass, data),
-        }
-
-        handler = handlers.get(endpoint)
+        handler = _GLOBAL_CONFIG_POST_HANDLERS.get(endpoint)
         if handler:
-            return await handler()
+            return await handler(self, data)
 
-        # Special cases with coordinator
-        if endpoint == "hysteresis":
-            coordinator = self._get_coordinator()
-            return await handle_set_hysteresis_value(
-                self.hass, self.area_manager, coordinator, data
-            )
-        elif endpoint == "opentherm_gateway":
+        # Special case with coordinator
+        if endpoint == "opentherm_gateway":
             entry_ids = [
                 entry.entry_id
                 for entry in self.hass.config_entries.async_entries(DOMAIN)
@@ -709,6 +673,7 @@ class SmartHeatingAPIView(HomeAssistantView):
 
         return None
 
+    @_api_error_boundary
     async def post(self, request: web.Request, endpoint: str) -> web.Response:
         """Handle POST requests.
 
@@ -719,41 +684,35 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        try:
-            _LOGGER.debug("POST request to endpoint: %s", endpoint)
-
-            # Try area action endpoints (no body required)
-            for action in ["enable", "disable", "hide", "unhide", "cancel_boost"]:
-                response = await self._handle_area_action_post(endpoint, action)
-                if response:
-                    return response
-
-            # Parse JSON for endpoints that need data
-            data = await request.json()
-            _LOGGER.debug("POST data: %s", data)
-
-            # Try area endpoints with data
-            response = await self._handle_area_data_post(endpoint, data)
-            if response:
-                return response
-
-            # Try global config endpoints
-            response = await self._handle_global_config_post(endpoint, data)
-            if response:
-                return response
-
-            # Try special endpoints (users, backups, comparison, opentherm)
-            response = await self._handle_special_endpoints_post(
-                request, endpoint, data
-            )
-            if response:
-                return response
+        _LOGGER.debug("POST request to endpoint: %s", endpoint)
 
-            return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
-        except Exception as err:
-            _LOGGER.error("Error handling POST %s: %s", endpoint, err)
-            return web.json_response({"error": str(err)}, status=500)
+        # Try area action endpoints (no body required)
+        response = await self._handle_area_action_post(endpoint)
+        if response is not None:
+            return response
 
+        # Parse JSON for endpoints that need data
+        data = await request.json()
+        _LOGGER.debug("POST data: %s", data)
+
+        # Try area endpoints with data
+        response = await self._handle_area_data_post(endpoint, data)
+        if response is not None:
+            return response
+
+        # Try global config endpoints
+        response = await self._handle_global_config_post(endpoint, data)
+        if response is not None:
+            return response
+
+        # Try special endpoints (users, backups, comparison, opentherm)
+        response = await self._handle_special_endpoints_post(request, endpoint, data)
+        if response is not None:
+            return response
+
+        return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
+
+    @_api_error_boundary
     async def delete(self, request: web.Request, endpoint: str) -> web.Response:
         """Handle DELETE requests.
 
@@ -764,65 +723,57 @@ class SmartHeatingAPIView(HomeAssistantView):
         Returns:
             JSON response
         """
-        try:
-            if endpoint == "vacation_mode":
-                return await handle_disable_vacation_mode(self.hass)
-            elif endpoint == "safety_sensor":
-                # Get sensor_id from query parameter
-                sensor_id = request.query.get("sensor_id")
-                if not sensor_id:
-                    return web.json_response(
-                        {"error": "sensor_id query parameter is required"}, status=400
-                    )
-                return await handle_remove_safety_sensor(
-                    self.hass, self.area_manager, sensor_id
-                )
-            elif endpoint.startswith(ENDPOINT_PREFIX_AREAS) and "/devices/" in endpoint:
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                device_id = parts[3]
-                return await handle_remove_device(self.area_manager, area_id, device_id)
-            elif (
-                endpoint.startswith(ENDPOINT_PREFIX_AREAS) and "/schedules/" in endpoint
-            ):
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                schedule_id = parts[3]
-                return await handle_remove_schedule(
-                    self.hass, self.area_manager, area_id, schedule_id
-                )
-            elif (
-                endpoint.startswith(ENDPOINT_PREFIX_AREAS)
-                and "/window_sensors/" in endpoint
-            ):
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                entity_id = "/".join(parts[3:])  # Reconstruct entity_id
-                return await handle_remove_window_sensor(
-                    self.hass, self.area_manager, area_id, entity_id
-                )
-            elif (
-                endpoint.startswith(ENDPOINT_PREFIX_AREAS)
-                and "/presence_sensors/" in endpoint
-            ):
-                parts = endpoint.split("/")
-                area_id = parts[1]
-                entity_id = "/".join(parts[3:])  # Reconstruct entity_id
-                return await handle_remove_presence_sensor(
-                    self.hass, self.area_manager, area_id, entity_id
-                )
-            # User endpoints
-            elif endpoint.startswith(_USERS_PATH):
-                user_id = endpoint.split("/")[1]
-                user_manager = self.hass.data[DOMAIN]["user_manager"]
-                return await handle_delete_user(
-                    self.hass, user_manager, request, user_id
+        if endpoint == "vacation_mode":
+            return await handle_disable_vacation_mode(self.hass)
+        elif endpoint == "safety_sensor":
+            # Get sensor_id from query parameter
+            sensor_id = request.query.get("sensor_id")
+            if not sensor_id:
+                return web.json_response(
+                    {"error": "sensor_id query parameter is required"}, status=400
                 )
-            else:
-                return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
-        except Exception as err:
-            _LOGGER.error("Error handling DELETE %s: %s", endpoint, err)
-            return web.json_response({"error": str(err)}, status=500)
+            return await handle_remove_safety_sensor(
+                self.hass, self.area_manager, sensor_id
+            )
+        elif endpoint.startswith(ENDPOINT_PREFIX_AREAS) and "/devices/" in endpoint:
+            parts = endpoint.split("/")
+            area_id = parts[1]
+            device_id = parts[3]
+            return await handle_remove_device(self.area_manager, area_id, device_id)
+        elif endpoint.startswith(ENDPOINT_PREFIX_AREAS) and "/schedules/" in endpoint:
+            parts = endpoint.split("/")
+            area_id = parts[1]
+            schedule_id = parts[3]
+            return await handle_remove_schedule(
+                self.hass, self.area_manager, area_id, schedule_id
+            )
+        elif (
+            endpoint.startswith(ENDPOINT_PREFIX_AREAS)
+            and "/window_sensors/" in endpoint
+        ):
+            parts = endpoint.split("/")
+            area_id = parts[1]
+            entity_id = "/".join(parts[3:])  # Reconstruct entity_id
+            return await handle_remove_window_sensor(
+                self.hass, self.area_manager, area_id, entity_id
+            )
+        elif (
+            endpoint.startswith(ENDPOINT_PREFIX_AREAS)
+            and "/presence_sensors/" in endpoint
+        ):
+            parts = endpoint.split("/")
+            area_id = parts[1]
+            entity_id = "/".join(parts[3:])  # Reconstruct entity_id
+            return await handle_remove_presence_sensor(
+                self.hass, self.area_manager, area_id, entity_id
+            )
+        # User endpoints
+        elif endpoint.startswith(_USERS_PATH):
+            user_id = endpoint.split("/")[1]
+            user_manager = self.hass.data[DOMAIN]["user_manager"]
+            return await handle_delete_user(self.hass, user_manager, request, user_id)
+        else:
+            return web.json_response({"error": ERROR_UNKNOWN_ENDPOINT}, status=404)
 
 
 class SmartHeatingUIView(HomeAssistantView):
@@ -1,39 +1,146 @@
 """Area API handlers for Smart Heating."""
 
 import logging
+from types import MappingProxyType
 
 from aiohttp import web
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers.json import json_bytes
 
 from ..area_manager import AreaManager
-from ..const import DOMAIN
+from ..const import MAX_HYSTERESIS, MIN_HYSTERESIS
 from ..models import Area
 from ..utils import (
     build_area_response,
     build_device_info,
+    etag_for,
+    etag_matches,
+    get_climate_controller,
     get_coordinator,
-    get_coordinator_devices,
+    get_coordinator_devices_by_area,
+    get_domain_data,
+    json_response,
+    validate_area_id,
+    validate_temperature,
 )
+from ..utils.coordinator_helpers import call_maybe_async
 
 _LOGGER = logging.getLogger(__name__)
 
+# Area attributes accepted by handle_set_area_preset_config (key == attribute name)
+_GLOBAL_FLAG_KEYS = frozenset(
+    {
+        "use_global_away",
+        "use_global_eco",
+        "use_global_comfort",
+        "use_global_home",
+        "use_global_sleep",
+        "use_global_activity",
+        "use_global_presence",
+    }
+)
+_PRESET_TEMP_KEYS = frozenset(
+    {
+        "away_temp",
+        "eco_temp",
+        "comfort_temp",
+        "home_temp",
+        "sleep_temp",
+        "activity_temp",
+    }
+)
+_PRESET_CONFIG_KEYS = _GLOBAL_FLAG_KEYS | _PRESET_TEMP_KEYS
+
+# Response fields for HA areas without stored settings (id/name added per area).
+# The empty lists are shared between responses and must never be mutated.
+_DEFAULT_AREA_RESPONSE = MappingProxyType(
+    {
+        "enabled": True,
+        "hidden": False,
+        "state": "idle",
+        "target_temperature": 20.0,
+        "current_temperature": None,
+        "devices": [],
+        "schedules": [],
+        "manual_override": False,
+    }
+)
 
-# noqa: ASYNC109 - Web API handlers must be async per aiohttp convention
-async def handle_get_areas(  # NOSONAR
-    hass: HomeAssistant, area_manager: AreaManager
-) -> web.Response:
-    """Get all Home Assistant areas.
+# Fixed validation errors, encoded once instead of on every rejected request
+_ERROR_HYSTERESIS_REQUIRED = json_bytes(
+    {"error": "hysteresis value required when use_global is false"}
+)
+_ERROR_HYSTERESIS_RANGE = json_bytes(
+    {"error": f"Hysteresis must be between {MIN_HYSTERESIS} and {MAX_HYSTERESIS}°C"}
+)
+_ERROR_HEATING_TYPE = json_bytes(
+    {"error": "heating_type must be 'radiator' or 'floor_heating'"}
+)
+_ERROR_OVERHEAD_RANGE = json_bytes(
+    {"error": "custom_overhead_temp must be between 0 and 30°C"}
+)
+_ERROR_ENABLED_REQUIRED = json_bytes({"error": "enabled field is required"})
+
+
+async def _async_control_heating(hass: HomeAssistant) -> None:
+    """Run the climate controller so a change takes effect immediately."""
+    climate_controller = get_climate_controller(hass)
+    if climate_controller:
+        await climate_controller.async_control_heating()
+
+
+def _schedule_coordinator_refresh(hass: HomeAssistant) -> None:
+    """Schedule a coordinator refresh so the frontend sees a change.
+
+    Every change requests its own refresh in a background task; the
+    coordinator's debouncer coalesces a burst of UI toggles and queues a
+    trailing refresh for changes made while one is running.
+    """
+    domain_data = get_domain_data(hass)
+    coordinator = get_coordinator(hass)
+    if not coordinator:
+        return
+    # A coordinator was found, so domain_data is the live hass.data dict.
+    # The latest task is kept so unloading the entry can cancel it.
+    domain_data["refresh_task"] = hass.async_create_background_task(
+        call_maybe_async(coordinator.async_request_refresh),
+        name="smart_heating_coordinator_refresh",
+    )
+
+
+def _is_same_cache_key(cached_key: tuple, cache_key: tuple) -> bool:
+    """Check whether a cached GET /areas body is still current.
+
+    The key holds the area manager's saved and live state versions, the
+    coordinator data snapshot and the HA area registry entries. Coordinator
+    data is compared by identity: the coordinator replaces it on every
+    refresh, which is when live temperatures and device states change.
+    """
+    return (
+        cached_key[0] == cache_key[0]
+        and cached_key[1] == cache_key[1]
+        and cached_key[2] is cache_key[2]
+        and cached_key[3] == cache_key[3]
+    )
+
+
+def _build_areas_body(
+    hass: HomeAssistant, area_manager: AreaManager, area_registry: ar.AreaRegistry
+) -> bytes:
+    """Build the encoded GET /areas payload.
 
     Args:
         hass: Home Assistant instance
         area_manager: Area manager instance
+        area_registry: Home Assistant area registry
 
     Returns:
-        JSON response with HA areas
+        JSON-encoded response body
     """
-    # Get Home Assistant's area registry
-    area_registry = ar.async_get(hass)
+    devices_by_area = get_coordinator_devices_by_area(hass)
+    # Bound once: the device loop below runs for every device of every area
+    get_state = hass.states.get
 
     areas_data = []
     for area in area_registry.areas.values():
@@ -45,15 +152,18 @@ async def handle_get_areas(  # NOSONAR
 
         if stored_area:
             # Build devices list with coordinator data
-            devices_list = []
-            coordinator_devices = get_coordinator_devices(hass, area_id)
-
-            for dev_id, dev_data in stored_area.devices.items():
-                state = hass.states.get(dev_id)
-                coord_device = coordinator_devices.get(dev_id)
-                devices_list.append(
-                    build_device_info(dev_id, dev_data, state, coord_device)
+            coordinator_devices = devices_by_area.get(area_id, {})
+            devices = stored_area.devices
+            # Parallel lookups over the same key order, zipped by map() in C
+            devices_list = list(
+                map(
+                    build_device_info,
+                    devices,
+                    devices.values(),
+                    map(get_state, devices),
+                    map(coordinator_devices.get, devices),
                 )
+            )
 
             # Build area response using utility
             area_response = build_area_response(stored_area, devices_list)
@@ -63,21 +173,66 @@ async def handle_get_areas(  # NOSONAR
         else:
             # Default data for HA area without stored settings
             areas_data.append(
-                {
-                    "id": area_id,
-                    "name": area_name,
-                    "enabled": True,
-                    "hidden": False,
-                    "state": "idle",
-                    "target_temperature": 20.0,
-                    "current_temperature": None,
-                    "devices": [],
-                    "schedules": [],
-                    "manual_override": False,
-                }
+                {"id": area_id, "name": area_name, **_DEFAULT_AREA_RESPONSE}
             )
 
-    return web.json_response({"areas": areas_data})
+    return json_bytes({"areas": areas_data})
+
+
+# noqa: ASYNC109 - Web API handlers must be async per aiohttp convention
+async def handle_get_areas(  # NOSONAR
+    hass: HomeAssistant,
+    area_manager: AreaManager,
+    request: web.Request | None = None,
+) -> web.Response:
+    """Get all Home Assistant areas.
+
+    Responses carry an ETag; polls with a matching If-None-Match get an
+    empty 304 instead of the full payload.
+
+    Args:
+        hass: Home Assistant instance
+        area_manager: Area manager instance
+        request: Request object, used for conditional GETs
+
+    Returns:
+        JSON response with HA areas
+    """
+    # Get Home Assistant's area registry
+    area_registry = ar.async_get(hass)
+
+    # Reuse the previous body while nothing it was built from has changed.
+    # Without a coordinator there is no refresh signal, so never cache.
+    coordinator = get_coordinator(hass)
+    cache_key = None
+    cached = None
+    if coordinator is not None:
+        cache_key = (
+            area_manager.version,
+            area_manager.live_version,
+            coordinator.data,
+            tuple(area_registry.areas.values()),
+        )
+        cached = area_manager.areas_response_cache
+        if cached is not None and not _is_same_cache_key(cached[0], cache_key):
+            cached = None
+
+    if cached is not None:
+        _, body, etag = cached
+    else:
+        body = _build_areas_body(hass, area_manager, area_registry)
+        etag = etag_for(body)
+        if cache_key is not None:
+            area_manager.areas_response_cache = (cache_key, body, etag)
+
+    if etag_matches(request, etag):
+        response = web.Response(status=304)
+        response.etag = etag
+        return response
+
+    response = json_response(body)
+    response.etag = etag
+    return response
 
 
 # noqa: ASYNC109 - Web API handlers must be async per aiohttp convention
@@ -97,18 +252,19 @@ async def handle_get_area(
     area = area_manager.get_area(area_id)
 
     if area is None:
-        return web.json_response({"error": f"Zone {area_id} not found"}, status=404)
+        return json_response({"error": f"Zone {area_id} not found"}, status=404)
 
     # Build devices list
-    devices_list = []
-    for dev_id, dev_data in area.devices.items():
-        state = hass.states.get(dev_id)
-        devices_list.append(build_device_info(dev_id, dev_data, state))
+    get_state = hass.states.get
+    devices_list = [
+        build_device_info(dev_id, dev_data, get_state(dev_id))
+        for dev_id, dev_data in area.devices.items()
+    ]
 
     # Build area response using utility
     area_data = build_area_response(area, devices_list)
 
-    return web.json_response(area_data)
+    return json_response(area_data)
 
 
 async def handle_set_temperature(
@@ -125,73 +281,57 @@ async def handle_set_temperature(
     Returns:
         JSON response
     """
-    from ..utils import validate_area_id, validate_temperature
-
     # Validate area_id
     is_valid, error_msg = validate_area_id(area_id)
     if not is_valid:
-        return web.json_response({"error": error_msg}, status=400)
+        return json_response({"error": error_msg}, status=400)
 
     # Validate temperature
     temperature = data.get("temperature")
     is_valid, error_msg = validate_temperature(temperature)
     if not is_valid:
-        return web.json_response({"error": error_msg}, status=400)
+        return json_response({"error": error_msg}, status=400)
 
     try:
         area = area_manager.get_area(area_id)
         if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
+            return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-        old_temp = area.target_temperature
-        old_effective = area.get_effective_target_temperature()
-        preset_context = (
-            f", preset={area.preset_mode}" if area.preset_mode != "none" else ""
-        )
-
-        _LOGGER.warning(
-            "🌡️ API: SET TEMPERATURE for %s: %.1f°C → %.1f°C%s | Effective: %.1f°C → ?",
-            area.name,
-            old_temp,
-            temperature,
-            preset_context,
-            old_effective,
-        )
-
-        area_manager.set_area_target_temperature(area_id, temperature)
+        old_target = area.target_temperature
+        area.set_target_temperature(temperature)
 
         # Clear manual override mode when user controls temperature via app
-        if area and hasattr(area, "manual_override") and area.manual_override:
-            _LOGGER.warning(
+        if area.manual_override:
+            _LOGGER.info(
                 "🔓 Clearing manual override for %s - app now in control", area.name
             )
             area.manual_override = False
 
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
-        new_effective = area.get_effective_target_temperature()
-        _LOGGER.warning(
-            "✓ Temperature set: %s | Effective: %.1f°C → %.1f°C",
-            area.name,
-            old_effective,
-            new_effective,
-        )
+        # Only compute the effective temperature when it will actually be logged
+        if _LOGGER.isEnabledFor(logging.INFO):
+            preset_context = (
+                f", preset={area.preset_mode}" if area.preset_mode != "none" else ""
+            )
+            _LOGGER.info(
+                "🌡️ API: SET TEMPERATURE for %s: %.1f°C → %.1f°C%s | Effective: %.1f°C",
+                area.name,
+                old_target,
+                temperature,
+                preset_context,
+                area.get_effective_target_temperature(),
+            )
 
         # Trigger immediate climate control
-        climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
-        if climate_controller:
-            await climate_controller.async_control_heating()
+        await _async_control_heating(hass)
 
         # Request coordinator refresh
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
-
-            await call_maybe_async(coordinator.async_request_refresh)
+        _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
+        return web.Response(status=204)
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+        return json_response({"error": str(err)}, status=400)
 
 
 async def handle_enable_area(
@@ -207,12 +347,16 @@ async def handle_enable_area(
     Returns:
         JSON response
     """
+    area = area_manager.get_area(area_id)
+    if area is not None and area.enabled:
+        return web.Response(status=204)
+
     try:
         area_manager.enable_area(area_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Check if this was the area that triggered a safety alert
-        safety_monitor = hass.data.get(DOMAIN, {}).get("safety_monitor")
+        safety_monitor = get_domain_data(hass).get("safety_monitor")
         if safety_monitor and area_manager.is_safety_alert_active():
             # If area being enabled, check if we should clear global safety alert
             area_manager.set_safety_alert_active(False)
@@ -221,20 +365,14 @@ async def handle_enable_area(
             )
 
         # Trigger immediate climate control
-        climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
-        if climate_controller:
-            await climate_controller.async_control_heating()
+        await _async_control_heating(hass)
 
         # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
-
-            await call_maybe_async(coordinator.async_request_refresh)
+        _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
+        return web.Response(status=204)
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=404)
+        return json_response({"error": str(err)}, status=404)
 
 
 async def handle_disable_area(
@@ -250,25 +388,67 @@ async def handle_disable_area(
     Returns:
         JSON response
     """
+    area = area_manager.get_area(area_id)
+    if area is not None and not area.enabled:
+        return web.Response(status=204)
+
     try:
         area_manager.disable_area(area_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Trigger immediate climate control to turn off devices
-        climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
-        if climate_controller:
-            await climate_controller.async_control_heating()
+        await _async_control_heating(hass)
 
         # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
-
-            await call_maybe_async(coordinator.async_request_refresh)
+        _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
+        return web.Response(status=204)
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=404)
+        return json_response({"error": str(err)}, status=404)
+
+
+def _get_ha_area(hass: HomeAssistant, area_id: str) -> ar.AreaEntry | None:
+    """Get an area from the Home Assistant area registry.
+
+    Args:
+        hass: Home Assistant instance
+        area_id: Area identifier
+
+    Returns:
+        Area registry entry, or None if HA has no such area
+    """
+    return ar.async_get(hass).async_get_area(area_id)
+
+
+def _create_area_from_registry(
+    hass: HomeAssistant, area_manager: AreaManager, area_id: str
+) -> tuple[Area | None, web.Response | None]:
+    """Create a stored area for a Home Assistant area that has no settings yet.
+
+    Args:
+        hass: Home Assistant instance
+        area_manager: Area manager instance
+        area_id: Area identifier
+
+    Returns:
+        Tuple of (area, error_response); error_response is set when the area
+        does not exist in Home Assistant either
+    """
+    ha_area = _get_ha_area(hass, area_id)
+    if not ha_area:
+        return None, json_response(
+            {"error": f"Area {area_id} not found in Home Assistant"}, status=404
+        )
+
+    # Create area with default settings
+    area = Area(
+        area_id=area_id,
+        name=ha_area.name,
+        target_temperature=20.0,
+        enabled=True,
+    )
+    area_manager.add_area(area)
+    return area, None
 
 
 async def handle_hide_area(
@@ -284,41 +464,21 @@ async def handle_hide_area(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            # Area doesn't exist in storage yet - create it
-            # Get area name from HA registry
-            area_registry = ar.async_get(hass)
-            ha_area = area_registry.async_get_area(area_id)
-            if not ha_area:
-                return web.json_response(
-                    {"error": f"Area {area_id} not found in Home Assistant"}, status=404
-                )
-
-            # Create area with default settings
-            area = Area(
-                area_id=area_id,
-                name=ha_area.name,
-                target_temperature=20.0,
-                enabled=True,
-            )
-            area.area_manager = area_manager
-            area_manager.areas[area_id] = area
-
-        area.hidden = True
-        await area_manager.async_save()
+    area = area_manager.get_area(area_id)
+    if area is None:
+        area, error_response = _create_area_from_registry(hass, area_manager, area_id)
+        if error_response is not None:
+            return error_response
+    elif area.hidden:
+        return web.Response(status=204)
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    area.hidden = True
+    area_manager.async_save_soon()
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 async def handle_unhide_area(
@@ -334,41 +494,21 @@ async def handle_unhide_area(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            # Area doesn't exist in storage yet - create it
-            # Get area name from HA registry
-            area_registry = ar.async_get(hass)
-            ha_area = area_registry.async_get_area(area_id)
-            if not ha_area:
-                return web.json_response(
-                    {"error": f"Area {area_id} not found in Home Assistant"}, status=404
-                )
-
-            # Create area with default settings
-            area = Area(
-                area_id=area_id,
-                name=ha_area.name,
-                target_temperature=20.0,
-                enabled=True,
-            )
-            area.area_manager = area_manager
-            area_manager.areas[area_id] = area
+    area = area_manager.get_area(area_id)
+    if area is None:
+        area, error_response = _create_area_from_registry(hass, area_manager, area_id)
+        if error_response is not None:
+            return error_response
+    elif not area.hidden:
+        return web.Response(status=204)
 
-        area.hidden = False
-        await area_manager.async_save()
+    area.hidden = False
+    area_manager.async_save_soon()
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
-
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 async def handle_set_switch_shutdown(
@@ -385,30 +525,23 @@ async def handle_set_switch_shutdown(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-        shutdown = data.get("shutdown", True)
-        area.shutdown_switches_when_idle = shutdown
-        await area_manager.async_save()
+    shutdown = data.get("shutdown", True)
+    if area.shutdown_switches_when_idle == shutdown:
+        return web.Response(status=204)
 
-        _LOGGER.info(
-            "Area %s: shutdown_switches_when_idle set to %s", area_id, shutdown
-        )
+    area.shutdown_switches_when_idle = shutdown
+    area_manager.async_save_soon()
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    _LOGGER.info("Area %s: shutdown_switches_when_idle set to %s", area_id, shutdown)
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        _LOGGER.error("Error setting switch shutdown for area %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 async def handle_set_area_hysteresis(
@@ -425,52 +558,37 @@ async def handle_set_area_hysteresis(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
-
-        use_global = data.get("use_global", False)
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-        if use_global:
-            # Use global hysteresis setting
-            area.hysteresis_override = None
-            _LOGGER.info(
-                "Area %s: Setting hysteresis_override to None (global)", area_id
-            )
-        else:
-            # Use area-specific hysteresis
-            hysteresis = data.get("hysteresis")
-            if hysteresis is None:
-                return web.json_response(
-                    {"error": "hysteresis value required when use_global is false"},
-                    status=400,
-                )
+    use_global = data.get("use_global", False)
 
-            # Validate range
-            if hysteresis < 0.1 or hysteresis > 2.0:
-                return web.json_response(
-                    {"error": "Hysteresis must be between 0.1 and 2.0°C"}, status=400
-                )
+    if use_global:
+        # Use global hysteresis setting
+        area.hysteresis_override = None
+        _LOGGER.info("Area %s: Setting hysteresis_override to None (global)", area_id)
+    else:
+        # Use area-specific hysteresis
+        hysteresis = data.get("hysteresis")
+        if hysteresis is None:
+            return json_response(_ERROR_HYSTERESIS_REQUIRED, status=400)
 
-            area.hysteresis_override = float(hysteresis)
-            _LOGGER.info(
-                "Area %s: Setting hysteresis_override to %.1f°C", area_id, hysteresis
-            )
+        # Validate range
+        if not MIN_HYSTERESIS <= hysteresis <= MAX_HYSTERESIS:
+            return json_response(_ERROR_HYSTERESIS_RANGE, status=400)
 
-        await area_manager.async_save()
+        area.hysteresis_override = float(hysteresis)
+        _LOGGER.info(
+            "Area %s: Setting hysteresis_override to %.1f°C", area_id, hysteresis
+        )
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    area_manager.async_save_soon()
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        _LOGGER.error("Error setting hysteresis for area %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 async def handle_set_auto_preset(
@@ -487,41 +605,33 @@ async def handle_set_auto_preset(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
-
-        # Update auto preset settings (support both 'enabled' and 'auto_preset_enabled')
-        if "auto_preset_enabled" in data:
-            area.auto_preset_enabled = bool(data["auto_preset_enabled"])
-        elif "enabled" in data:
-            area.auto_preset_enabled = bool(data["enabled"])
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-        # Update preset selections
-        if "auto_preset_home" in data:
-            area.auto_preset_home = str(data["auto_preset_home"])
-        elif "home_preset" in data:
-            area.auto_preset_home = str(data["home_preset"])
+    # Update auto preset settings (support both 'enabled' and 'auto_preset_enabled')
+    if "auto_preset_enabled" in data:
+        area.auto_preset_enabled = bool(data["auto_preset_enabled"])
+    elif "enabled" in data:
+        area.auto_preset_enabled = bool(data["enabled"])
 
-        if "auto_preset_away" in data:
-            area.auto_preset_away = str(data["auto_preset_away"])
-        elif "away_preset" in data:
-            area.auto_preset_away = str(data["away_preset"])
+    # Update preset selections
+    if "auto_preset_home" in data:
+        area.auto_preset_home = str(data["auto_preset_home"])
+    elif "home_preset" in data:
+        area.auto_preset_home = str(data["home_preset"])
 
-        await area_manager.async_save()
+    if "auto_preset_away" in data:
+        area.auto_preset_away = str(data["auto_preset_away"])
+    elif "away_preset" in data:
+        area.auto_preset_away = str(data["away_preset"])
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    area_manager.async_save_soon()
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        _LOGGER.error("Error setting auto preset for area %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 async def handle_set_heating_type(
@@ -538,55 +648,41 @@ async def handle_set_heating_type(
     Returns:
         JSON response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
-
-        # Validate and set heating type
-        if "heating_type" in data:
-            heating_type = data["heating_type"]
-            if heating_type not in ["radiator", "floor_heating"]:
-                return web.json_response(
-                    {"error": "heating_type must be 'radiator' or 'floor_heating'"},
-                    status=400,
-                )
-            area.heating_type = heating_type
-            _LOGGER.info("Area %s: Setting heating_type to %s", area_id, heating_type)
-
-        # Set custom overhead temperature (optional)
-        if "custom_overhead_temp" in data:
-            custom_overhead = data["custom_overhead_temp"]
-            if custom_overhead is not None:
-                # Validate range
-                if custom_overhead < 0 or custom_overhead > 30:
-                    return web.json_response(
-                        {"error": "custom_overhead_temp must be between 0 and 30°C"},
-                        status=400,
-                    )
-                area.custom_overhead_temp = float(custom_overhead)
-                _LOGGER.info(
-                    "Area %s: Setting custom_overhead_temp to %.1f°C",
-                    area_id,
-                    custom_overhead,
-                )
-            else:
-                area.custom_overhead_temp = None
-                _LOGGER.info("Area %s: Clearing custom_overhead_temp", area_id)
-
-        await area_manager.async_save()
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
+
+    # Validate and set heating type
+    if "heating_type" in data:
+        heating_type = data["heating_type"]
+        if heating_type not in ["radiator", "floor_heating"]:
+            return json_response(_ERROR_HEATING_TYPE, status=400)
+        area.heating_type = heating_type
+        _LOGGER.info("Area %s: Setting heating_type to %s", area_id, heating_type)
+
+    # Set custom overhead temperature (optional)
+    if "custom_overhead_temp" in data:
+        custom_overhead = data["custom_overhead_temp"]
+        if custom_overhead is not None:
+            # Validate range
+            if custom_overhead < 0 or custom_overhead > 30:
+                return json_response(_ERROR_OVERHEAD_RANGE, status=400)
+            area.custom_overhead_temp = float(custom_overhead)
+            _LOGGER.info(
+                "Area %s: Setting custom_overhead_temp to %.1f°C",
+                area_id,
+                custom_overhead,
+            )
+        else:
+            area.custom_overhead_temp = None
+            _LOGGER.info("Area %s: Clearing custom_overhead_temp", area_id)
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    area_manager.async_save_soon()
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        _LOGGER.error("Error setting heating type for area %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 def _validate_heating_curve_coefficient(coeff_str: str) -> tuple[bool, str | float]:
@@ -620,75 +716,46 @@ async def handle_set_area_heating_curve(
     Returns:
         web.Response
     """
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            return web.json_response({"error": f"Area {area_id} not found"}, status=404)
-
-        # Handle use_global flag
-        if "use_global" in data:
-            use_global = bool(data["use_global"])
-            if use_global:
-                area.heating_curve_coefficient = None
-            elif area.heating_curve_coefficient is None:
-                # If toggling off and we have no existing coefficient, use global default
-                area.heating_curve_coefficient = float(
-                    area_manager.default_heating_curve_coefficient
-                )
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-        # Handle coefficient value
-        if "coefficient" in data:
-            is_valid, result = _validate_heating_curve_coefficient(data["coefficient"])
-            if not is_valid:
-                return web.json_response({"error": result}, status=400)
-            area.heating_curve_coefficient = result
+    # Handle use_global flag
+    if "use_global" in data:
+        use_global = bool(data["use_global"])
+        if use_global:
+            area.heating_curve_coefficient = None
+        elif area.heating_curve_coefficient is None:
+            # If toggling off and we have no existing coefficient, use global default
+            area.heating_curve_coefficient = float(
+                area_manager.default_heating_curve_coefficient
+            )
 
-        await area_manager.async_save()
+    # Handle coefficient value
+    if "coefficient" in data:
+        is_valid, result = _validate_heating_curve_coefficient(data["coefficient"])
+        if not is_valid:
+            return json_response({"error": result}, status=400)
+        area.heating_curve_coefficient = result
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            from ..utils.coordinator_helpers import call_maybe_async
+    area_manager.async_save_soon()
 
-            await call_maybe_async(coordinator.async_request_refresh)
+    # Refresh coordinator
+    _schedule_coordinator_refresh(hass)
 
-        return web.json_response({"success": True})
-    except Exception as err:
-        _LOGGER.error("Error setting area heating curve for %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+    return web.Response(status=204)
 
 
 def _update_area_global_flags(area: Area, data: dict) -> None:
     """Update use_global_* flags on an area."""
-    flag_mapping = {
-        "use_global_away": "use_global_away",
-        "use_global_eco": "use_global_eco",
-        "use_global_comfort": "use_global_comfort",
-        "use_global_home": "use_global_home",
-        "use_global_sleep": "use_global_sleep",
-        "use_global_activity": "use_global_activity",
-        "use_global_presence": "use_global_presence",
-    }
-
-    for key, attr in flag_mapping.items():
-        if key in data:
-            setattr(area, attr, bool(data[key]))
+    for key in data.keys() & _GLOBAL_FLAG_KEYS:
+        setattr(area, key, bool(data[key]))
 
 
 def _update_area_preset_temps(area: Area, data: dict) -> None:
     """Update preset temperature values on an area."""
-    temp_mapping = {
-        "away_temp": "away_temp",
-        "eco_temp": "eco_temp",
-        "comfort_temp": "comfort_temp",
-        "home_temp": "home_temp",
-        "sleep_temp": "sleep_temp",
-        "activity_temp": "activity_temp",
-    }
-
-    for key, attr in temp_mapping.items():
-        if key in data:
-            setattr(area, attr, float(data[key]))
+    for key in data.keys() & _PRESET_TEMP_KEYS:
+        setattr(area, key, float(data[key]))
 
 
 async def handle_set_area_preset_config(
@@ -707,32 +774,32 @@ async def handle_set_area_preset_config(
     """
     area = area_manager.get_area(area_id)
     if not area:
-        return web.json_response({"error": f"Area {area_id} not found"}, status=404)
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
-    changes = {
-        k: v
-        for k, v in data.items()
-        if k.startswith("use_global_") or k.endswith("_temp")
-    }
-    _LOGGER.warning("⚙️  API: SET PRESET CONFIG for %s: %s", area.name, changes)
+    if _LOGGER.isEnabledFor(logging.INFO):
+        changes = {k: v for k, v in data.items() if k in _PRESET_CONFIG_KEYS}
+        _LOGGER.info("⚙️  API: SET PRESET CONFIG for %s: %s", area.name, changes)
+
+    # Snapshot the affected values so resent configurations can be skipped
+    keys = data.keys() & _PRESET_CONFIG_KEYS
+    previous = {key: getattr(area, key) for key in keys}
 
     # Update use_global_* flags and temperature values
     _update_area_global_flags(area, data)
     _update_area_preset_temps(area, data)
 
+    if all(getattr(area, key) == value for key, value in previous.items()):
+        return web.Response(status=204)
+
     # Save to storage
-    await area_manager.async_save()
+    area_manager.async_save_soon()
 
-    _LOGGER.warning("✓ Preset config saved for %s", area.name)
+    _LOGGER.info("✓ Preset config saved for %s", area.name)
 
     # Refresh coordinator to update frontend
-    coordinator = get_coordinator(hass)
-    if coordinator:
-        from ..utils.coordinator_helpers import call_maybe_async
-
-        await call_maybe_async(coordinator.async_request_refresh)
+    _schedule_coordinator_refresh(hass)
 
-    return web.json_response({"success": True})
+    return web.Response(status=204)
 
 
 async def handle_set_manual_override(
@@ -751,21 +818,25 @@ async def handle_set_manual_override(
     """
     area = area_manager.get_area(area_id)
     if not area:
-        return web.json_response({"error": f"Area {area_id} not found"}, status=404)
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
     enabled = data.get("enabled")
     if enabled is None:
-        return web.json_response({"error": "enabled field is required"}, status=400)
+        return json_response(_ERROR_ENABLED_REQUIRED, status=400)
 
     old_state = area.manual_override
+    if old_state == bool(enabled):
+        return web.Response(status=204)
+
     area.manual_override = bool(enabled)
 
-    _LOGGER.warning(
-        "🎛️ API: MANUAL OVERRIDE for %s: %s → %s",
-        area.name,
-        "ON" if old_state else "OFF",
-        "ON" if area.manual_override else "OFF",
-    )
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "🎛️ API: MANUAL OVERRIDE for %s: %s → %s",
+            area.name,
+            "ON" if old_state else "OFF",
+            "ON" if area.manual_override else "OFF",
+        )
 
     # If turning off manual override and there's an active preset, update target to preset temp
     if not area.manual_override and area.preset_mode and area.preset_mode != "none":
@@ -774,7 +845,7 @@ async def handle_set_manual_override(
         # Update the base target temperature to match the preset temperature
         # This ensures the UI shows the correct temperature
         area.target_temperature = effective_temp
-        _LOGGER.warning(
+        _LOGGER.info(
             "✓ %s now using preset mode '%s': %.1f°C → %.1f°C",
             area.name,
             area.preset_mode,
@@ -783,21 +854,15 @@ async def handle_set_manual_override(
         )
 
     # Save to storage
-    await area_manager.async_save()
+    area_manager.async_save_soon()
 
     # Trigger climate control to apply changes
-    climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
-    if climate_controller:
-        await climate_controller.async_control_heating()
+    await _async_control_heating(hass)
 
     # Refresh coordinator
-    coordinator = get_coordinator(hass)
-    if coordinator:
-        from ..utils.coordinator_helpers import call_maybe_async
-
-        await call_maybe_async(coordinator.async_request_refresh)
+    _schedule_coordinator_refresh(hass)
 
-    return web.json_response({"success": True})
+    return web.Response(status=204)
 
 
 async def handle_set_primary_temperature_sensor(
@@ -816,7 +881,7 @@ async def handle_set_primary_temperature_sensor(
     """
     area = area_manager.get_area(area_id)
     if not area:
-        return web.json_response({"error": f"Area {area_id} not found"}, status=404)
+        return json_response({"error": f"Area {area_id} not found"}, status=404)
 
     sensor_id = data.get("sensor_id")
 
@@ -824,34 +889,31 @@ async def handle_set_primary_temperature_sensor(
     if sensor_id is not None:
         all_temp_devices = area.get_temperature_sensors() + area.get_thermostats()
         if sensor_id not in all_temp_devices:
-            return web.json_response(
+            return json_response(
                 {"error": f"Device {sensor_id} not found in area {area_id}"}, status=400
             )
 
     old_sensor = area.primary_temperature_sensor
     area.primary_temperature_sensor = sensor_id
 
-    _LOGGER.warning(
-        "🌡️ API: PRIMARY TEMP SENSOR for %s: %s → %s",
-        area.name,
-        old_sensor or "Auto (all sensors)",
-        sensor_id or "Auto (all sensors)",
-    )
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "🌡️ API: PRIMARY TEMP SENSOR for %s: %s → %s",
+            area.name,
+            old_sensor or "Auto (all sensors)",
+            sensor_id or "Auto (all sensors)",
+        )
 
     # Save to storage
-    await area_manager.async_save()
+    area_manager.async_save_soon()
 
     # Update temperatures immediately
-    climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
+    climate_controller = get_climate_controller(hass)
     if climate_controller:
         await climate_controller.async_update_area_temperatures()
         await climate_controller.async_control_heating()
 
     # Refresh coordinator
-    coordinator = get_coordinator(hass)
-    if coordinator:
-        from ..utils.coordinator_helpers import call_maybe_async
-
-        await call_maybe_async(coordinator.async_request_refresh)
+    _schedule_coordinator_refresh(hass)
 
-    return web.json_response({"success": True})
+    return web.Response(status=204)
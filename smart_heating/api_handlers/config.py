@@ -1,13 +1,26 @@
 """Configuration API handlers for Smart Heating."""
 
 import logging
+from collections.abc import Callable
+from typing import Any
 
 from aiohttp import web
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
 from ..area_manager import AreaManager
-from ..const import DOMAIN
-from ..utils import get_coordinator
+from ..const import (
+    DOMAIN,
+    HVAC_MODE_AUTO,
+    HVAC_MODE_COOL,
+    HVAC_MODE_HEAT,
+    HVAC_MODE_HEAT_COOL,
+    HVAC_MODE_OFF,
+    MAX_HYSTERESIS,
+    MIN_HYSTERESIS,
+)
+from ..utils import get_coordinator, get_domain_data, json_response
+from ..utils.coordinator_helpers import call_maybe_async
 import asyncio
 
 _LOGGER = logging.getLogger(__name__)
@@ -15,6 +28,106 @@ _LOGGER = logging.getLogger(__name__)
 # Constants
 ERROR_VACATION_MANAGER_NOT_INITIALIZED = "Vacation manager not initialized"
 
+# Fixed response bodies, encoded once instead of on every request
+_SUCCESS_BODY = json_bytes({"success": True})
+_ERROR_HYSTERESIS_RANGE = json_bytes(
+    {"error": f"Hysteresis must be between {MIN_HYSTERESIS} and {MAX_HYSTERESIS}°C"}
+)
+_ERROR_HYSTERESIS_MISSING = json_bytes({"error": "Missing hysteresis value"})
+_ERROR_VACATION_MANAGER_NOT_INITIALIZED = json_bytes(
+    {"error": ERROR_VACATION_MANAGER_NOT_INITIALIZED}
+)
+_ERROR_HIDE_DEVICES_PANEL_MISSING = json_bytes(
+    {"error": "Missing hide_devices_panel value"}
+)
+_ERROR_INVALID_COEFFICIENT = json_bytes({"error": "Invalid coefficient"})
+_ERROR_NO_RECOGNIZED_FIELDS = json_bytes({"error": "No recognized fields provided"})
+_ERROR_SENSOR_ID_REQUIRED = json_bytes({"error": "sensor_id is required"})
+_ERROR_ALERT_VALUE_REQUIRED = json_bytes({"error": "alert_value is required"})
+_ERROR_HVAC_MODE_REQUIRED = json_bytes({"error": "hvac_mode required"})
+_ERROR_HVAC_MODE_INVALID = json_bytes({"error": "invalid hvac_mode"})
+_ERROR_VACATION_DATES_REQUIRED = json_bytes(
+    {"error": "start_date and end_date are required"}
+)
+
+_VALID_HVAC_MODES = frozenset(
+    (
+        HVAC_MODE_OFF,
+        HVAC_MODE_HEAT,
+        HVAC_MODE_COOL,
+        HVAC_MODE_HEAT_COOL,
+        HVAC_MODE_AUTO,
+    )
+)
+
+# Marks an absent request key, so explicit nulls are still applied
+_MISSING = object()
+
+# Setter field tables: (request key, AreaManager attribute, caster)
+_ADVANCED_CONTROL_FIELDS = (
+    ("advanced_control_enabled", "advanced_control_enabled", bool),
+    ("heating_curve_enabled", "heating_curve_enabled", bool),
+    ("pwm_enabled", "pwm_enabled", bool),
+    ("pid_enabled", "pid_enabled", bool),
+    ("overshoot_protection_enabled", "overshoot_protection_enabled", bool),
+    (
+        "default_heating_curve_coefficient",
+        "default_heating_curve_coefficient",
+        float,
+    ),
+)
+_GLOBAL_PRESET_FIELDS = (
+    ("away_temp", "global_away_temp", float),
+    ("eco_temp", "global_eco_temp", float),
+    ("comfort_temp", "global_comfort_temp", float),
+    ("home_temp", "global_home_temp", float),
+    ("sleep_temp", "global_sleep_temp", float),
+    ("activity_temp", "global_activity_temp", float),
+)
+_GLOBAL_PRESET_KEYS = frozenset(key for key, _attr, _caster in _GLOBAL_PRESET_FIELDS)
+_HIDE_DEVICES_PANEL_FIELDS = (("hide_devices_panel", "hide_devices_panel", bool),)
+
+
+def _log_preset_change(name: str, old: float, new: float) -> None:
+    """Log a single global preset change at DEBUG."""
+    _LOGGER.debug("  Global %s: %.1f°C → %.1f°C", name, old, new)
+
+
+def _apply_updates(
+    area_manager: AreaManager,
+    data: dict,
+    fields: tuple[tuple[str, str, Callable[[Any], Any]], ...],
+) -> list[tuple[str, Any, Any]]:
+    """Copy the request fields present in data onto the area manager.
+
+    Args:
+        area_manager: Area manager instance
+        data: Request data
+        fields: (request key, AreaManager attribute, caster) entries
+
+    Returns:
+        (request key, old value, new value) for each field that was applied
+
+    Raises:
+        ValueError/TypeError: If a caster rejects a value; nothing is applied
+            in that case.
+    """
+    # Cast every field before touching the manager so a bad value leaves
+    # the configuration unchanged
+    pending = []
+    for key, attr, caster in fields:
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            # JSON bodies usually carry the right type already
+            new = value if type(value) is caster else caster(value)
+            pending.append((key, attr, new))
+
+    applied = []
+    for key, attr, new in pending:
+        applied.append((key, getattr(area_manager, attr), new))
+        setattr(area_manager, attr, new)
+    return applied
+
 
 async def handle_get_config(  # NOSONAR
     _hass: HomeAssistant, area_manager: AreaManager
@@ -28,13 +141,20 @@ async def handle_get_config(  # NOSONAR
     Returns:
         JSON response with configuration
     """
+    # Global settings only change through paths that save the area manager,
+    # which bumps its version; the safety alert flag is runtime-only state.
+    cache_key = (area_manager.version, area_manager.is_safety_alert_active())
+    cached = area_manager.config_response_cache
+    if cached is not None and cached[0] == cache_key:
+        return json_response(cached[1])
+
     config = {
         "opentherm_gateway_id": area_manager.opentherm_gateway_id,
         "trv_heating_temp": area_manager.trv_heating_temp,
         "trv_idle_temp": area_manager.trv_idle_temp,
         "trv_temp_offset": area_manager.trv_temp_offset,
         "safety_sensors": area_manager.get_safety_sensors(),
-        "safety_alert_active": area_manager.is_safety_alert_active(),
+        "safety_alert_active": cache_key[1],
         "hide_devices_panel": area_manager.hide_devices_panel,
         "advanced_control_enabled": area_manager.advanced_control_enabled,
         "heating_curve_enabled": area_manager.heating_curve_enabled,
@@ -44,7 +164,9 @@ async def handle_get_config(  # NOSONAR
         "default_heating_curve_coefficient": area_manager.default_heating_curve_coefficient,
     }
 
-    return web.json_response(config)
+    body = json_bytes(config)
+    area_manager.config_response_cache = (cache_key, body)
+    return json_response(body)
 
 
 async def handle_get_global_presets(area_manager: AreaManager) -> web.Response:
@@ -57,16 +179,19 @@ async def handle_get_global_presets(area_manager: AreaManager) -> web.Response:
         JSON response with global preset temperatures
     """
     await asyncio.sleep(0)
-    return web.json_response(
+    version = area_manager.version
+    cached = area_manager.presets_response_cache
+    if cached is not None and cached[0] == version:
+        return json_response(cached[1])
+
+    body = json_bytes(
         {
-            "away_temp": area_manager.global_away_temp,
-            "eco_temp": area_manager.global_eco_temp,
-            "comfort_temp": area_manager.global_comfort_temp,
-            "home_temp": area_manager.global_home_temp,
-            "sleep_temp": area_manager.global_sleep_temp,
-            "activity_temp": area_manager.global_activity_temp,
+            key: getattr(area_manager, attr)
+            for key, attr, _caster in _GLOBAL_PRESET_FIELDS
         }
     )
+    area_manager.presets_response_cache = (version, body)
+    return json_response(body)
 
 
 async def handle_set_global_presets(
@@ -81,54 +206,25 @@ async def handle_set_global_presets(
     Returns:
         JSON response
     """
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
     # Log what's changing
-    changes = {k: v for k, v in data.items() if k.endswith("_temp")}
-    _LOGGER.warning("🌍 API: SET GLOBAL PRESETS: %s", changes)
+    if debug:
+        changes = {k: data[k] for k in data.keys() & _GLOBAL_PRESET_KEYS}
+        _LOGGER.debug("🌍 API: SET GLOBAL PRESETS: %s", changes)
 
     # Update global preset temperatures
-    if "away_temp" in data:
-        old = area_manager.global_away_temp
-        area_manager.global_away_temp = float(data["away_temp"])
-        _LOGGER.warning(
-            "  Global Away: %.1f°C → %.1f°C", old, area_manager.global_away_temp
-        )
-    if "eco_temp" in data:
-        old = area_manager.global_eco_temp
-        area_manager.global_eco_temp = float(data["eco_temp"])
-        _LOGGER.warning(
-            "  Global Eco: %.1f°C → %.1f°C", old, area_manager.global_eco_temp
-        )
-    if "comfort_temp" in data:
-        old = area_manager.global_comfort_temp
-        area_manager.global_comfort_temp = float(data["comfort_temp"])
-        _LOGGER.warning(
-            "  Global Comfort: %.1f°C → %.1f°C", old, area_manager.global_comfort_temp
-        )
-    if "home_temp" in data:
-        old = area_manager.global_home_temp
-        area_manager.global_home_temp = float(data["home_temp"])
-        _LOGGER.warning(
-            "  Global Home: %.1f°C → %.1f°C", old, area_manager.global_home_temp
-        )
-    if "sleep_temp" in data:
-        old = area_manager.global_sleep_temp
-        area_manager.global_sleep_temp = float(data["sleep_temp"])
-        _LOGGER.warning(
-            "  Global Sleep: %.1f°C → %.1f°C", old, area_manager.global_sleep_temp
-        )
-    if "activity_temp" in data:
-        old = area_manager.global_activity_temp
-        area_manager.global_activity_temp = float(data["activity_temp"])
-        _LOGGER.warning(
-            "  Global Activity: %.1f°C → %.1f°C", old, area_manager.global_activity_temp
-        )
+    applied = _apply_updates(area_manager, data, _GLOBAL_PRESET_FIELDS)
+    if debug:
+        for key, old, new in applied:
+            _log_preset_change(key, old, new)
 
     # Save to storage
-    await area_manager.async_save()
+    area_manager.async_save_soon()
 
-    _LOGGER.warning("✓ Global presence saved")
+    _LOGGER.info("✓ Global presets saved")
 
-    return web.json_response({"success": True})
+    return json_response(_SUCCESS_BODY)
 
 
 async def handle_get_hysteresis(area_manager: AreaManager) -> web.Response:
@@ -141,7 +237,11 @@ async def handle_get_hysteresis(area_manager: AreaManager) -> web.Response:
         JSON response with hysteresis value
     """
     await asyncio.sleep(0)
-    return web.json_response({"hysteresis": area_manager.hysteresis})
+    return json_response({"hysteresis": area_manager.hysteresis})
+
+
+# Legacy name, kept as an alias: it always served the hysteresis payload
+handle_get_opentherm_config = handle_get_hysteresis
 
 
 async def handle_set_opentherm_gateway(
@@ -172,15 +272,21 @@ async def handle_set_opentherm_gateway(
     try:
         if coordinator and getattr(coordinator, "config_entry", None):
             entry = coordinator.config_entry
-            hass = coordinator.hass
-            # Build new options preserving existing ones
-            new_options = dict(entry.options or {})
-            new_options["opentherm_gateway_id"] = gateway_id or ""
-            await hass.config_entries.async_update_entry(entry, options=new_options)
-            _LOGGER.debug(
-                "HA ConfigEntry options updated with OpenTherm gateway: %s",
-                gateway_id,
-            )
+            options = entry.options or {}
+            stored_id = gateway_id or ""
+            # Skip the entry write (and the listeners it triggers) when unchanged
+            if options.get("opentherm_gateway_id", "") != stored_id:
+                # Build new options preserving existing ones
+                new_options = {**options, "opentherm_gateway_id": stored_id}
+                await call_maybe_async(
+                    coordinator.hass.config_entries.async_update_entry,
+                    entry,
+                    options=new_options,
+                )
+                _LOGGER.debug(
+                    "HA ConfigEntry options updated with OpenTherm gateway: %s",
+                    gateway_id,
+                )
     except Exception as err:
         _LOGGER.error(
             "Failed to update HA ConfigEntry options for OpenTherm gateway: %s", err
@@ -188,7 +294,7 @@ async def handle_set_opentherm_gateway(
 
     _LOGGER.info("OpenTherm Gateway configured: gateway_id=%s", gateway_id)
 
-    return web.json_response({"success": True})
+    return json_response(_SUCCESS_BODY)
 
 
 async def handle_set_hide_devices_panel(
@@ -203,13 +309,12 @@ async def handle_set_hide_devices_panel(
     Returns:
         JSON response
     """
-    if "hide_devices_panel" in data:
-        area_manager.hide_devices_panel = bool(data["hide_devices_panel"])
-        await area_manager.async_save()
+    if _apply_updates(area_manager, data, _HIDE_DEVICES_PANEL_FIELDS):
+        area_manager.async_save_soon()
         _LOGGER.info("✓ Hide devices panel set to: %s", area_manager.hide_devices_panel)
-        return web.json_response({"success": True})
+        return json_response(_SUCCESS_BODY)
 
-    return web.json_response({"error": "Missing hide_devices_panel value"}, status=400)
+    return json_response(_ERROR_HIDE_DEVICES_PANEL_MISSING, status=400)
 
 
 async def handle_set_advanced_control_config(
@@ -223,51 +328,16 @@ async def handle_set_advanced_control_config(
 
     Returns: web.Response
     """
-    _LOGGER.info("API: SET ADVANCED CONTROL: %s", data)
-    updated = False
-    if "advanced_control_enabled" in data:
-        area_manager.advanced_control_enabled = bool(data["advanced_control_enabled"])
-        updated = True
-    if "heating_curve_enabled" in data:
-        area_manager.heating_curve_enabled = bool(data["heating_curve_enabled"])
-        updated = True
-    if "pwm_enabled" in data:
-        area_manager.pwm_enabled = bool(data["pwm_enabled"])
-        updated = True
-    if "pid_enabled" in data:
-        area_manager.pid_enabled = bool(data["pid_enabled"])
-        updated = True
-    if "overshoot_protection_enabled" in data:
-        area_manager.overshoot_protection_enabled = bool(
-            data["overshoot_protection_enabled"]
-        )
-        updated = True
-    if "default_heating_curve_coefficient" in data:
-        try:
-            area_manager.default_heating_curve_coefficient = float(
-                data["default_heating_curve_coefficient"]
-            )
-        except Exception:
-            return web.json_response({"error": "Invalid coefficient"}, status=400)
-        updated = True
+    _LOGGER.debug("API: SET ADVANCED CONTROL: %s", data)
+    try:
+        updated = _apply_updates(area_manager, data, _ADVANCED_CONTROL_FIELDS)
+    except (TypeError, ValueError):
+        return json_response(_ERROR_INVALID_COEFFICIENT, status=400)
 
     if updated:
-        await area_manager.async_save()
-        return web.json_response({"success": True})
-    return web.json_response({"error": "No recognized fields provided"}, status=400)
-
-
-async def handle_get_opentherm_config(area_manager: AreaManager) -> web.Response:
-    """Get global hysteresis value.
-
-    Args:
-        area_manager: Area manager instance
-
-    Returns:
-        JSON response with hysteresis value
-    """
-    await asyncio.sleep(0)
-    return web.json_response({"hysteresis": area_manager.hysteresis})
+        area_manager.async_save_soon()
+        return json_response(_SUCCESS_BODY)
+    return json_response(_ERROR_NO_RECOGNIZED_FIELDS, status=400)
 
 
 async def handle_set_hysteresis_value(
@@ -284,35 +354,27 @@ async def handle_set_hysteresis_value(
     Returns:
         JSON response
     """
-    _LOGGER.info("🌡️ API: SET HYSTERESIS: %s", data)
+    _LOGGER.debug("🌡️ API: SET HYSTERESIS: %s", data)
 
     if "hysteresis" in data:
         hysteresis = float(data["hysteresis"])
         # Validate range
-        if hysteresis < 0.1 or hysteresis > 2.0:
-            return web.json_response(
-                {"error": "Hysteresis must be between 0.1 and 2.0°C"}, status=400
-            )
+        if not MIN_HYSTERESIS <= hysteresis <= MAX_HYSTERESIS:
+            return json_response(_ERROR_HYSTERESIS_RANGE, status=400)
 
-        # Update area manager
+        # The climate controller reads the global value from the area manager
         area_manager.hysteresis = hysteresis
-        await area_manager.async_save()
-
-        # Update all climate controllers
-        for area in area_manager.areas.values():
-            if hasattr(area, "climate_controller") and area.climate_controller:
-                area.climate_controller._hysteresis = hysteresis
 
-            # Request coordinator update
-            if coordinator:
-                from ..utils.coordinator_helpers import call_maybe_async
+        area_manager.async_save_soon()
 
-                await call_maybe_async(coordinator.async_request_refresh)
+        # Request coordinator update
+        if coordinator:
+            await call_maybe_async(coordinator.async_request_refresh)
 
         _LOGGER.info("✅ Hysteresis updated to %.1f°C", hysteresis)
-        return web.json_response({"success": True})
+        return json_response(_SUCCESS_BODY)
 
-    return web.json_response({"error": "Missing hysteresis value"}, status=400)
+    return json_response(_ERROR_HYSTERESIS_MISSING, status=400)
 
 
 async def handle_get_global_presence(area_manager: AreaManager) -> web.Response:
@@ -325,7 +387,7 @@ async def handle_get_global_presence(area_manager: AreaManager) -> web.Response:
         JSON response with global presence sensors
     """
     await asyncio.sleep(0)
-    return web.json_response({"sensors": area_manager.global_presence_sensors})
+    return json_response({"sensors": area_manager.global_presence_sensors})
 
 
 async def handle_set_global_presence(
@@ -340,21 +402,21 @@ async def handle_set_global_presence(
     Returns:
         JSON response
     """
-    _LOGGER.warning("🌍 API: SET GLOBAL PRESENCE: %s", data)
+    _LOGGER.debug("🌍 API: SET GLOBAL PRESENCE: %s", data)
 
     if "sensors" in data:
         area_manager.global_presence_sensors = data["sensors"]
-        _LOGGER.warning(
+        _LOGGER.debug(
             "  Global presence sensors updated: %d sensors",
             len(area_manager.global_presence_sensors),
         )
 
     # Save to storage
-    await area_manager.async_save()
+    area_manager.async_save_soon()
 
-    _LOGGER.warning("✓ Global presence saved")
+    _LOGGER.info("✓ Global presence saved")
 
-    return web.json_response({"success": True})
+    return json_response(_SUCCESS_BODY)
 
 
 async def handle_set_frost_protection(
@@ -378,9 +440,9 @@ async def handle_set_frost_protection(
         if temp is not None:
             area_manager.frost_protection_temp = temp
 
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
-        return web.json_response(
+        return json_response(
             {
                 "success": True,
                 "enabled": area_manager.frost_protection_enabled,
@@ -388,7 +450,7 @@ async def handle_set_frost_protection(
             }
         )
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+        return json_response({"error": str(err)}, status=400)
 
 
 async def handle_get_vacation_mode(hass: HomeAssistant) -> web.Response:
@@ -401,13 +463,11 @@ async def handle_get_vacation_mode(hass: HomeAssistant) -> web.Response:
         JSON response with vacation mode data
     """
     await asyncio.sleep(0)
-    vacation_manager = hass.data[DOMAIN].get("vacation_manager")
+    vacation_manager = get_domain_data(hass).get("vacation_manager")
     if not vacation_manager:
-        return web.json_response(
-            {"error": ERROR_VACATION_MANAGER_NOT_INITIALIZED}, status=500
-        )
+        return json_response(_ERROR_VACATION_MANAGER_NOT_INITIALIZED, status=500)
 
-    return web.json_response(vacation_manager.get_data())
+    return json_response(vacation_manager.get_data())
 
 
 async def handle_enable_vacation_mode(hass: HomeAssistant, data: dict) -> web.Response:
@@ -420,29 +480,25 @@ async def handle_enable_vacation_mode(hass: HomeAssistant, data: dict) -> web.Re
     Returns:
         JSON response with updated vacation mode data
     """
-    vacation_manager = hass.data[DOMAIN].get("vacation_manager")
+    vacation_manager = get_domain_data(hass).get("vacation_manager")
     if not vacation_manager:
-        return web.json_response(
-            {"error": ERROR_VACATION_MANAGER_NOT_INITIALIZED}, status=500
-        )
+        return json_response(_ERROR_VACATION_MANAGER_NOT_INITIALIZED, status=500)
 
     start_date = data.get("start_date")
     end_date = data.get("end_date")
     temperature = data.get("temperature")
 
     if not start_date or not end_date:
-        return web.json_response(
-            {"error": "start_date and end_date are required"}, status=400
-        )
+        return json_response(_ERROR_VACATION_DATES_REQUIRED, status=400)
 
     try:
         await vacation_manager.async_enable(
             start_date=start_date, end_date=end_date, temperature=temperature
         )
 
-        return web.json_response(vacation_manager.get_data())
+        return json_response(vacation_manager.get_data())
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+        return json_response({"error": str(err)}, status=400)
 
 
 async def handle_disable_vacation_mode(hass: HomeAssistant) -> web.Response:
@@ -454,15 +510,27 @@ async def handle_disable_vacation_mode(hass: HomeAssistant) -> web.Response:
     Returns:
         JSON response
     """
-    vacation_manager = hass.data[DOMAIN].get("vacation_manager")
+    vacation_manager = get_domain_data(hass).get("vacation_manager")
     if not vacation_manager:
-        return web.json_response(
-            {"error": ERROR_VACATION_MANAGER_NOT_INITIALIZED}, status=500
-        )
+        return json_response(_ERROR_VACATION_MANAGER_NOT_INITIALIZED, status=500)
 
     await vacation_manager.async_disable()
 
-    return web.json_response({"success": True})
+    return json_response(_SUCCESS_BODY)
+
+
+async def _async_save_and_reconfigure_safety(
+    hass: HomeAssistant, area_manager: AreaManager
+) -> None:
+    """Schedule a save of safety sensor changes and reconfigure the monitor.
+
+    The monitor works from the in-memory sensor list, so it does not wait
+    for the debounced write.
+    """
+    area_manager.async_save_soon()
+    safety_monitor = get_domain_data(hass).get("safety_monitor")
+    if safety_monitor:
+        await safety_monitor.async_reconfigure()
 
 
 async def handle_get_safety_sensor(area_manager: AreaManager) -> web.Response:
@@ -478,7 +546,7 @@ async def handle_get_safety_sensor(area_manager: AreaManager) -> web.Response:
     sensors = area_manager.get_safety_sensors()
     first = sensors[0] if sensors else None
 
-    return web.json_response(
+    return json_response(
         {
             "sensors": sensors,
             # Backwards compatible fields for single-sensor setups
@@ -504,7 +572,7 @@ async def handle_set_safety_sensor(
     """
     sensor_id = data.get("sensor_id")
     if not sensor_id:
-        return web.json_response({"error": "sensor_id is required"}, status=400)
+        return json_response(_ERROR_SENSOR_ID_REQUIRED, status=400)
 
     attribute = data.get("attribute", "state")
     alert_value = data.get("alert_value")
@@ -512,7 +580,7 @@ async def handle_set_safety_sensor(
 
     # Validate required fields
     if not alert_value:
-        return web.json_response({"error": "alert_value is required"}, status=400)
+        return json_response(_ERROR_ALERT_VALUE_REQUIRED, status=400)
 
     # Clear existing sensors (single-sensor mode replacement)
     if hasattr(area_manager, "clear_safety_sensors"):
@@ -527,12 +595,7 @@ async def handle_set_safety_sensor(
         alert_value=alert_value,
         enabled=bool(enabled),
     )
-    await area_manager.async_save()
-
-    # Reconfigure safety monitor
-    safety_monitor = hass.data[DOMAIN].get("safety_monitor")
-    if safety_monitor:
-        await safety_monitor.async_reconfigure()
+    await _async_save_and_reconfigure_safety(hass, area_manager)
 
     # Broadcast configuration change via WebSocket
     hass.bus.async_fire(
@@ -541,7 +604,7 @@ async def handle_set_safety_sensor(
     )
 
     _LOGGER.info("Safety sensor added: %s via API", sensor_id)
-    return web.json_response({"success": True, "sensor_id": sensor_id})
+    return json_response({"success": True, "sensor_id": sensor_id})
 
 
 async def handle_remove_safety_sensor(
@@ -560,23 +623,8 @@ async def handle_remove_safety_sensor(
     if sensor_id:
         area_manager.remove_safety_sensor(sensor_id)
     else:
-        # Prefer clear_safety_sensors if available (backwards-compat)
-        if hasattr(area_manager, "clear_safety_sensors"):
-            area_manager.clear_safety_sensors()
-        else:
-            if getattr(area_manager, "safety_sensors", None):
-                # We iterate over a copy here because `remove_safety_sensor`
-                # mutates `area_manager.safety_sensors` while iterating.
-                for s in list(
-                    area_manager.safety_sensors
-                ):  # NOSONAR - list() is required to avoid mutation during iteration
-                    area_manager.remove_safety_sensor(s["sensor_id"])
-    await area_manager.async_save()
-
-    # Reconfigure safety monitor
-    safety_monitor = hass.data[DOMAIN].get("safety_monitor")
-    if safety_monitor:
-        await safety_monitor.async_reconfigure()
+        area_manager.clear_safety_sensors()
+    await _async_save_and_reconfigure_safety(hass, area_manager)
 
     # Broadcast configuration change via WebSocket
     hass.bus.async_fire(
@@ -584,7 +632,7 @@ async def handle_remove_safety_sensor(
     )
 
     _LOGGER.info("Safety sensor removed: %s via API", sensor_id)
-    return web.json_response({"success": True})
+    return json_response(_SUCCESS_BODY)
 
 
 async def handle_set_hvac_mode(
@@ -603,21 +651,20 @@ async def handle_set_hvac_mode(
     """
     hvac_mode = data.get("hvac_mode")
     if not hvac_mode:
-        return web.json_response({"error": "hvac_mode required"}, status=400)
+        return json_response(_ERROR_HVAC_MODE_REQUIRED, status=400)
+    if not isinstance(hvac_mode, str) or hvac_mode not in _VALID_HVAC_MODES:
+        return json_response(_ERROR_HVAC_MODE_INVALID, status=400)
 
-    try:
-        area = area_manager.get_area(area_id)
-        if not area:
-            raise ValueError(f"Area {area_id} not found")
+    area = area_manager.get_area(area_id)
+    if not area:
+        return json_response({"error": f"Area {area_id} not found"}, status=400)
 
-        area.hvac_mode = hvac_mode
-        await area_manager.async_save()
+    area.hvac_mode = hvac_mode
+    area_manager.async_save_soon()
 
-        # Refresh coordinator
-        coordinator = get_coordinator(hass)
-        if coordinator:
-            await coordinator.async_request_refresh()
+    # Refresh coordinator
+    coordinator = get_coordinator(hass)
+    if coordinator:
+        await coordinator.async_request_refresh()
 
-        return web.json_response({"success": True, "hvac_mode": hvac_mode})
-    except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+    return json_response({"success": True, "hvac_mode": hvac_mode})
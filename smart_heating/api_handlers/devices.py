@@ -1,62 +1,199 @@
 """Device API handlers for Smart Heating."""
 
-import asyncio
 import logging
 import time
+from collections import Counter
 
 from aiohttp import web
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
 
 from ..area_manager import AreaManager
+from ..const import DEVICE_CACHE_TTL
 from ..models import Area
+from ..utils import etag_for, etag_matches, json_response
 
 _LOGGER = logging.getLogger(__name__)
 
-# Device discovery cache
+# Device discovery cache; the timestamp is time.monotonic() at discovery
 _devices_cache = None
 _cache_timestamp = None
+# Encoded response body and its ETag for the cached list, keyed by the list it
+# was built from
+_devices_body_cache: tuple[list, bytes, str] | None = None
+
+# Entity registry entries in the discoverable domains, in registry order.
+# Only entity registry changes can alter it, so it outlives the device cache.
+# It is only kept while the registry listeners are installed.
+_discoverable_entries: list[er.RegistryEntry] | None = None
+_tracking_registry = False
+
+_DISCOVERABLE_DOMAINS = frozenset(("climate", "switch", "sensor"))
+
+# (device name, area id, area name) for entities without a registered device
+_NO_DEVICE_INFO = (None, None, None)
+
+# Registry changes that can add, remove or rename discoverable devices
+_REGISTRY_UPDATE_EVENTS = (
+    er.EVENT_ENTITY_REGISTRY_UPDATED,
+    dr.EVENT_DEVICE_REGISTRY_UPDATED,
+    ar.EVENT_AREA_REGISTRY_UPDATED,
+)
+
+
+def invalidate_device_cache() -> None:
+    """Drop the cached device list so the next request rediscovers."""
+    global _devices_cache, _cache_timestamp, _devices_body_cache
+    _devices_cache = None
+    _cache_timestamp = None
+    _devices_body_cache = None
+
+
+@callback
+def async_track_device_cache_invalidation(hass: HomeAssistant) -> CALLBACK_TYPE:
+    """Invalidate the device cache whenever a relevant HA registry entry changes.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Callback that removes the listeners and clears the cache
+    """
+
+    @callback
+    def _handle_registry_update(event: Event) -> None:
+        global _discoverable_entries
+        if event.event_type == er.EVENT_ENTITY_REGISTRY_UPDATED:
+            # Entities outside the discoverable domains can't change the list
+            data = event.data
+            entity_ids = (data.get("entity_id"), data.get("old_entity_id"))
+            if not any(
+                entity_id and split_entity_id(entity_id)[0] in _DISCOVERABLE_DOMAINS
+                for entity_id in entity_ids
+            ):
+                return
+            _discoverable_entries = None
+        invalidate_device_cache()
+
+    global _tracking_registry
+    unsubs = [
+        hass.bus.async_listen(event_type, _handle_registry_update)
+        for event_type in _REGISTRY_UPDATE_EVENTS
+    ]
+    _tracking_registry = True
+
+    @callback
+    def _unsubscribe() -> None:
+        global _discoverable_entries, _tracking_registry
+        for unsub in unsubs:
+            unsub()
+        _tracking_registry = False
+        _discoverable_entries = None
+        invalidate_device_cache()
+
+    return _unsubscribe
 
 
 async def handle_get_devices(
-    hass: HomeAssistant, area_manager: AreaManager
+    hass: HomeAssistant,
+    area_manager: AreaManager,
+    request: web.Request | None = None,
 ) -> web.Response:
     """Get available devices from Home Assistant.
 
-    Returns cached device list if available. Use /devices/refresh for fresh discovery.
+    Returns the cached device list while it is younger than DEVICE_CACHE_TTL.
+    Use /devices/refresh for fresh discovery. Responses carry an ETag, and a
+    matching If-None-Match gets a 304 without a body.
 
     Args:
         hass: Home Assistant instance
         area_manager: Area manager instance
+        request: Request, used for conditional GET handling
 
     Returns:
         JSON response with available devices
     """
-    # Return cached devices if available
-    if _devices_cache is not None:
+    # Return cached devices if still fresh
+    if (
+        _devices_cache is not None
+        and _cache_timestamp is not None
+        and time.monotonic() - _cache_timestamp < DEVICE_CACHE_TTL
+    ):
         _LOGGER.debug("Returning cached device list (%d devices)", len(_devices_cache))
-        return web.json_response({"devices": _devices_cache})
+        return _devices_response(_devices_cache, request)
 
     # No cache, perform discovery
-    _LOGGER.info("No device cache available, performing initial discovery")
-    return await _discover_devices(hass, area_manager)
+    _LOGGER.info("No fresh device cache available, performing discovery")
+    return await _discover_devices(hass, area_manager, request)
 
 
 async def _discover_devices(
-    hass: HomeAssistant, area_manager: AreaManager
+    hass: HomeAssistant,
+    area_manager: AreaManager,
+    request: web.Request | None = None,
 ) -> web.Response:
-    """Discover climate, switch, and temperature sensor devices from Home Assistant.
+    """Discover devices and return them as a JSON response.
 
     Args:
         hass: Home Assistant instance
         area_manager: Area manager instance
+        request: Request, used for conditional GET handling
 
     Returns:
         JSON response with discovered devices
     """
-    await asyncio.sleep(0)  # Minimal async operation to satisfy async requirement
+    devices = await _discover_devices_list(hass, area_manager)
+    return _devices_response(devices, request)
+
+
+def _devices_response(devices: list[dict], request: web.Request | None) -> web.Response:
+    """Build the devices response, or a 304 if the client's copy is current."""
+    body, etag = _encode_devices(devices)
+    if etag_matches(request, etag):
+        response = web.Response(status=304)
+        response.etag = etag
+        return response
+
+    response = json_response(body)
+    response.etag = etag
+    return response
+
+
+def _encode_devices(devices: list[dict]) -> tuple[bytes, str]:
+    """Return the encoded devices body and its ETag, reused for the cached list."""
+    global _devices_body_cache
+    if _devices_body_cache is not None and _devices_body_cache[0] is devices:
+        return _devices_body_cache[1], _devices_body_cache[2]
+    body = json_bytes({"devices": devices})
+    etag = etag_for(body)
+    if devices is _devices_cache:
+        _devices_body_cache = (devices, body, etag)
+    return body, etag
+
+
+async def _discover_devices_list(
+    hass: HomeAssistant, area_manager: AreaManager
+) -> list[dict]:
+    """Discover climate, switch, and temperature sensor devices from Home Assistant.
+
+    Updates the module-level device cache.
+
+    Args:
+        hass: Home Assistant instance
+        area_manager: Area manager instance
+
+    Returns:
+        List of discovered device payloads
+    """
     global _devices_cache, _cache_timestamp
 
     entity_reg = er.async_get(hass)
@@ -66,66 +203,127 @@ async def _discover_devices(
     # Get all climate, switch, and temperature sensor entities
     all_entities = _get_discoverable_entities(entity_reg, hass)
 
-    devices = []
-
-    for entry in all_entities:
-        devices.append(
-            _build_device_payload(entry, device_reg, area_registry, hass, area_manager)
-        )
+    entity_to_area = _build_entity_area_index(area_manager)
+    device_info = _build_device_info_index(all_entities, device_reg, area_registry)
+    build_payload = _build_device_payload
+    devices = [
+        build_payload(entry, state, device_info, entity_to_area)
+        for entry, state in all_entities
+    ]
 
     # Cache the results
     _devices_cache = devices
-    _cache_timestamp = time.time()
-
-    # Count by type
-    thermostat_count = sum(1 for d in devices if d["type"] == "climate")
-    switch_count = sum(1 for d in devices if d["type"] == "switch")
-    temp_sensor_count = sum(1 for d in devices if d["type"] == "temperature_sensor")
-
-    _LOGGER.info(
-        "Discovered %d devices (%d thermostats, %d switches, %d temperature sensors)",
-        len(devices),
-        thermostat_count,
-        switch_count,
-        temp_sensor_count,
-    )
+    _cache_timestamp = time.monotonic()
+
+    # Count by type; only needed for the log line
+    if _LOGGER.isEnabledFor(logging.INFO):
+        type_counts = Counter(d["type"] for d in devices)
+        _LOGGER.info(
+            "Discovered %d devices (%d thermostats, %d switches, %d temperature sensors)",
+            len(devices),
+            type_counts["climate"],
+            type_counts["switch"],
+            type_counts["temperature_sensor"],
+        )
 
-    return web.json_response({"devices": devices})
+    return devices
 
 
 def _get_discoverable_entities(entity_reg, hass):
-    """Return a list of entities that we should consider for discovery.
+    """Return (entry, state) pairs for entities we should consider for discovery.
 
     This includes climate and switch entities and sensors with the temperature device class.
+    Each state is fetched once here and reused when building the payload.
     """
+    global _discoverable_entries
+    entries = _discoverable_entries
+    if entries is None:
+        entries = [
+            entry
+            for entry in entity_reg.entities.values()
+            if entry.domain in _DISCOVERABLE_DOMAINS
+        ]
+        if _tracking_registry:
+            _discoverable_entries = entries
+
+    # One pass over the sensor states picks out the temperature sensors, so
+    # other sensors in the registry are skipped without a state lookup
+    temperature_states = {
+        state.entity_id: state
+        for state in hass.states.async_all("sensor")
+        if state.attributes.get("device_class") == "temperature"
+    }
+
+    get_state = hass.states.get
     result = []
-    for entry in entity_reg.entities.values():
-        if entry.domain in ("climate", "switch"):
-            result.append(entry)
-        elif entry.domain == "sensor":
-            state = hass.states.get(entry.entity_id)
-            if state and state.attributes.get("device_class") == "temperature":
-                result.append(entry)
+    for entry in entries:
+        if entry.domain != "sensor":
+            result.append((entry, get_state(entry.entity_id)))
+        else:
+            state = temperature_states.get(entry.entity_id)
+            if state:
+                result.append((entry, state))
     return result
 
 
-def _build_device_payload(entry, device_reg, area_registry, hass, area_manager):
+def _build_device_info_index(
+    entities, device_reg, area_registry
+) -> dict[str, tuple[str | None, str | None, str | None]]:
+    """Look up each referenced HA device and its area once.
+
+    Entities of the same device (e.g. a thermostat's climate entity and its
+    temperature sensor) share one registry lookup.
+
+    Returns:
+        Mapping of device id to (device name, area id, area name)
+    """
+    index = {}
+    for entry, _state in entities:
+        device_id = entry.device_id
+        if not device_id or device_id in index:
+            continue
+        device_name = None
+        device_area_id = None
+        device_area_name = None
+        device = device_reg.async_get(device_id)
+        if device:
+            device_name = device.name_by_user or device.name
+            if device.area_id:
+                device_area_id = device.area_id
+                area = area_registry.async_get_area(device_area_id)
+                if area:
+                    device_area_name = area.name
+        index[device_id] = (device_name, device_area_id, device_area_name)
+    return index
+
+
+def _build_device_payload(entry, state, device_info, entity_to_area):
     """Build a device payload dict for a given registry entry.
 
     Returns a dictionary suitable for API responses.
     """
-    device_type = _determine_device_type(entry)
-
-    device_name, device_area_id, device_area_name = _get_device_name_and_area(
-        entry, device_reg, area_registry
+    domain = entry.domain
+    if domain == "climate":
+        device_type = "climate"
+    elif domain == "switch":
+        device_type = "switch"
+    else:
+        device_type = "temperature_sensor"
+
+    device_name, device_area_id, device_area_name = device_info.get(
+        entry.device_id, _NO_DEVICE_INFO
     )
-
     if not device_name:
         device_name = entry.original_name or entry.entity_id
 
-    current_state, current_temp = _get_current_state_and_temperature(entry, hass)
-
-    assigned_to_area = _find_assigned_to_area(entry.entity_id, area_manager)
+    if state:
+        current_state = state.state
+        current_temp = (
+            state.attributes.get("current_temperature") if domain == "climate" else None
+        )
+    else:
+        current_state = "unavailable"
+        current_temp = None
 
     return {
         "id": entry.entity_id,
@@ -135,53 +333,17 @@ def _build_device_payload(entry, device_reg, area_registry, hass, area_manager):
         "current_temperature": current_temp,
         "area_id": device_area_id,
         "area_name": device_area_name,
-        "assigned_to_area": assigned_to_area,
+        "assigned_to_area": entity_to_area.get(entry.entity_id),
     }
 
 
-def _determine_device_type(entry):
-    if entry.domain == "climate":
-        return "climate"
-    if entry.domain == "switch":
-        return "switch"
-    return "temperature_sensor"
-
-
-def _get_device_name_and_area(entry, device_reg, area_registry):
-    device_name = None
-    device_area_id = None
-    device_area_name = None
-
-    if entry.device_id:
-        device = device_reg.async_get(entry.device_id)
-        if device:
-            device_name = device.name_by_user or device.name
-            if device.area_id:
-                device_area_id = device.area_id
-                area = area_registry.async_get_area(device.area_id)
-                if area:
-                    device_area_name = area.name
-
-    if not device_name:
-        device_name = entry.original_name or entry.entity_id
-
-    return device_name, device_area_id, device_area_name
-
-
-def _get_current_state_and_temperature(entry, hass):
-    state = hass.states.get(entry.entity_id)
-    current_state = state.state if state else "unavailable"
-    current_temp = None
-    if entry.domain == "climate" and state:
-        current_temp = state.attributes.get("current_temperature")
-    return current_state, current_temp
-
-
-def _find_assigned_to_area(entity_id, area_manager: AreaManager):
+def _build_entity_area_index(area_manager: AreaManager) -> dict[str, str]:
+    """Map each assigned entity id to its area id (first area wins)."""
+    index: dict[str, str] = {}
     for area_id, area in area_manager.get_all_areas().items():
-        if entity_id in area.devices:
-            return area_id
-    return None
+        for entity_id in area.devices:
+            index.setdefault(entity_id, area_id)
+    return index
 
 
 async def handle_refresh_devices(
@@ -196,21 +358,13 @@ async def handle_refresh_devices(
     Returns:
         JSON response with refresh results
     """
-    global _devices_cache, _cache_timestamp
-
     try:
         _LOGGER.info("Refreshing device discovery...")
 
         # Clear cache and rediscover
-        _devices_cache = None
-        _cache_timestamp = None
-        response = await _discover_devices(hass, area_manager)
-
-        # Parse the response to get device list
-        import json
-
-        devices_data = json.loads(response.text)
-        devices = devices_data.get("devices", [])
+        invalidate_device_cache()
+        devices = await _discover_devices_list(hass, area_manager)
+        devices_by_id = {d["id"]: d for d in devices}
 
         # Update assigned devices with latest info
         updated_count = 0
@@ -219,7 +373,7 @@ async def handle_refresh_devices(
         for area in area_manager.get_all_areas().values():
             for device_id in area.devices.keys():
                 # Find device in discovered list
-                device_info = next((d for d in devices if d["id"] == device_id), None)
+                device_info = devices_by_id.get(device_id)
                 if device_info:
                     # Update device type if changed
                     if area.devices[device_id].get("type") != device_info["type"]:
@@ -234,9 +388,9 @@ async def handle_refresh_devices(
 
         # Save if anything changed
         if updated_count > 0:
-            await area_manager.async_save()
+            area_manager.async_save_soon()
 
-        return web.json_response(
+        return json_response(
             {
                 "success": True,
                 "updated": updated_count,
@@ -248,7 +402,7 @@ async def handle_refresh_devices(
 
     except Exception as err:
         _LOGGER.error("Error refreshing devices: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_add_device(
@@ -270,7 +424,7 @@ async def handle_add_device(
     mqtt_topic = data.get("mqtt_topic")
 
     if not device_id or not device_type:
-        return web.json_response(
+        return json_response(
             {"error": "device_id and device_type are required"}, status=400
         )
 
@@ -282,20 +436,18 @@ async def handle_add_device(
             ha_area = area_registry.async_get_area(area_id)
             if ha_area:
                 # Create internal storage for this HA area
-                area = Area(area_id, ha_area.name)
-                area.area_manager = area_manager
-                area_manager.areas[area_id] = area
+                area_manager.add_area(Area(area_id, ha_area.name))
             else:
-                return web.json_response(
-                    {"error": f"Area {area_id} not found"}, status=404
-                )
+                return json_response({"error": f"Area {area_id} not found"}, status=404)
 
         area_manager.add_device_to_area(area_id, device_id, device_type, mqtt_topic)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
+        # Cached payloads carry assigned_to_area
+        invalidate_device_cache()
 
-        return web.json_response({"success": True})
+        return web.Response(status=204)
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+        return json_response({"error": str(err)}, status=400)
 
 
 async def handle_remove_device(
@@ -314,8 +466,10 @@ async def handle_remove_device(
     """
     try:
         area_manager.remove_device_from_area(area_id, device_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
+        # Cached payloads carry assigned_to_area
+        invalidate_device_cache()
 
-        return web.json_response({"success": True})
+        return json_response({"success": True})
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=404)
+        return json_response({"error": str(err)}, status=404)
@@ -1,13 +1,16 @@
 """Efficiency report API handlers."""
 
 import logging
+from datetime import timedelta
+from typing import Any, Tuple
 
 from aiohttp import web
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 
 from ..area_manager import AreaManager
 from ..efficiency_calculator import EfficiencyCalculator
-from typing import Any, Tuple
+from ..utils import json_response
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,46 +20,45 @@ def _build_single_area_response(area_metrics: dict[str, Any]) -> dict[str, Any]:
 
     This helps keep the main API handler concise and reduces cognitive complexity.
     """
+    get = area_metrics.get
     return {
-        "area_id": area_metrics.get("area_id"),
-        "period": area_metrics.get("period"),
-        "start_date": area_metrics.get("start_time", ""),
-        "end_date": area_metrics.get("end_time", ""),
+        "area_id": get("area_id"),
+        "period": get("period"),
+        "start_date": get("start_time", ""),
+        "end_date": get("end_time", ""),
         "metrics": {
-            "energy_score": area_metrics.get("energy_score", 0),
-            "heating_time_percentage": area_metrics.get("heating_time_percentage", 0),
-            "heating_cycles": area_metrics.get("heating_cycles", 0),
-            "avg_temp_delta": area_metrics.get("average_temperature_delta", 0),
+            "energy_score": get("energy_score", 0),
+            "heating_time_percentage": get("heating_time_percentage", 0),
+            "heating_cycles": get("heating_cycles", 0),
+            "avg_temp_delta": get("average_temperature_delta", 0),
         },
-        "recommendations": area_metrics.get("recommendations", []),
+        "recommendations": get("recommendations", []),
     }
 
 
 def _transform_raw_report(
-    raw_report: dict[str, Any], area_manager: AreaManager
+    raw_report: dict[str, Any], area_names: dict[str, str]
 ) -> dict[str, Any]:
     """Transform a raw report dictionary into the API response structure.
 
     This abstracts away repeated mapping logic and keeps the handler smaller.
     """
-    area_id = raw_report.get("area_id")
-    area = area_manager.get_area(area_id) if area_id else None
-    raw_area_name = getattr(area, "name", None) if area else None
-    area_name = raw_area_name if isinstance(raw_area_name, str) else area_id
+    get = raw_report.get
+    area_id = get("area_id")
 
     return {
         "area_id": area_id,
-        "area_name": area_name,
-        "period": raw_report.get("period"),
-        "start_date": raw_report.get("start_time", ""),
-        "end_date": raw_report.get("end_time", ""),
+        "area_name": area_names.get(area_id, area_id),
+        "period": get("period"),
+        "start_date": get("start_time", ""),
+        "end_date": get("end_time", ""),
         "metrics": {
-            "energy_score": raw_report.get("energy_score", 0),
-            "heating_time_percentage": raw_report.get("heating_time_percentage", 0),
-            "heating_cycles": raw_report.get("heating_cycles", 0),
-            "avg_temp_delta": raw_report.get("average_temperature_delta", 0),
+            "energy_score": get("energy_score", 0),
+            "heating_time_percentage": get("heating_time_percentage", 0),
+            "heating_cycles": get("heating_cycles", 0),
+            "avg_temp_delta": get("average_temperature_delta", 0),
         },
-        "recommendations": raw_report.get("recommendations", []),
+        "recommendations": get("recommendations", []),
     }
 
 
@@ -67,14 +69,16 @@ def _calculate_summary_metrics(
 
     Returning a tuple keeps the callsites concise and easy to read.
     """
-    total_energy_score = sum(r.get("energy_score", 0) for r in area_reports_raw)
-    total_heating_time = sum(
-        r.get("heating_time_percentage", 0) for r in area_reports_raw
-    )
-    total_cycles = sum(r.get("heating_cycles", 0) for r in area_reports_raw)
-    total_temp_delta = sum(
-        r.get("average_temperature_delta", 0) for r in area_reports_raw
-    )
+    total_energy_score = 0
+    total_heating_time = 0
+    total_cycles = 0
+    total_temp_delta = 0
+    for report in area_reports_raw:
+        total_energy_score += report.get("energy_score", 0)
+        total_heating_time += report.get("heating_time_percentage", 0)
+        total_cycles += report.get("heating_cycles", 0)
+        total_temp_delta += report.get("average_temperature_delta", 0)
+    # Callers only summarize non-empty report lists
     count = len(area_reports_raw)
 
     summary_metrics = {
@@ -107,7 +111,13 @@ async def _handle_all_areas_report(
         area_manager, period
     )
 
-    area_reports = [_transform_raw_report(r, area_manager) for r in area_reports_raw]
+    # Resolve area names once for all reports
+    area_names = {
+        area_id: area.name
+        for area_id, area in area_manager.get_all_areas().items()
+        if isinstance(area.name, str)
+    }
+    area_reports = [_transform_raw_report(r, area_names) for r in area_reports_raw]
 
     if area_reports_raw:
         summary_metrics, recommendations = _calculate_summary_metrics(area_reports_raw)
@@ -158,17 +168,17 @@ async def handle_get_efficiency_report(
                 area_id, period
             )
             # Build response using helper
-            return web.json_response(_build_single_area_response(area_metrics))
+            return json_response(_build_single_area_response(area_metrics))
         else:
             # All areas report - delegate to helper to reduce complexity
             payload = await _handle_all_areas_report(
                 area_manager, efficiency_calculator, period
             )
-            return web.json_response(payload)
+            return json_response(payload)
 
     except Exception as e:
         _LOGGER.error("Error getting efficiency report: %s", e, exc_info=True)
-        return web.json_response({"error": str(e)}, status=500)
+        return json_response({"error": str(e)}, status=500)
 
 
 async def handle_get_area_efficiency_history(
@@ -193,37 +203,29 @@ async def handle_get_area_efficiency_history(
         periods = int(request.query.get("periods", "7"))  # Default 7 days
         period_type = request.query.get("period_type", "day")
 
-        history_data = []
-
         # Calculate efficiency for each period
-        from datetime import timedelta
-        from homeassistant.util import dt as dt_util
+        if period_type == "week":
+            step = timedelta(weeks=1)
+        elif period_type == "month":
+            step = timedelta(days=30)
+        else:  # Default to "day" for any other period_type
+            step = timedelta(days=1)
 
         end = dt_util.now()
+        history_data = []
 
-        for i in range(periods):
-            if period_type == "week":
-                period_end = end - timedelta(weeks=i)
-                period_start = period_end - timedelta(weeks=1)
-            elif period_type == "month":
-                period_end = end - timedelta(days=30 * i)
-                period_start = period_end - timedelta(days=30)
-            else:  # Default to "day" for any other period_type
-                period_end = end - timedelta(days=i)
-                period_start = period_end - timedelta(days=1)
-
+        # Oldest period first
+        for i in range(periods - 1, -1, -1):
+            period_end = end - step * i
             metrics = await efficiency_calculator.calculate_area_efficiency(
-                area_id, period_type, period_start, period_end
+                area_id, period_type, period_end - step, period_end
             )
             history_data.append(metrics)
 
-        # Reverse to show oldest first
-        history_data.reverse()
-
-        return web.json_response({"history": history_data})
+        return json_response({"history": history_data})
 
     except Exception as e:
         _LOGGER.error(
             "Error getting efficiency history for %s: %s", area_id, e, exc_info=True
         )
-        return web.json_response({"error": str(e)}, status=500)
+        return json_response({"error": str(e)}, status=500)
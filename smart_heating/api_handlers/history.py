@@ -5,14 +5,21 @@ from datetime import datetime
 
 from aiohttp import web
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
 from ..const import DOMAIN, HISTORY_RECORD_INTERVAL_SECONDS
+from ..utils import json_response
 import asyncio
 
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_HISTORY_NOT_AVAILABLE = "History not available"
 
+_RECORD_INTERVAL_MINUTES = HISTORY_RECORD_INTERVAL_SECONDS / 60
+
+# (retention days, storage backend) and the encoded history config response
+_history_config_cache: tuple[tuple[int, str], bytes] | None = None
+
 
 async def handle_get_history(
     hass: HomeAssistant, area_id: str, request
@@ -36,7 +43,14 @@ async def handle_get_history(
 
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+
+    # Dashboards poll the same window repeatedly; serve it from memory until
+    # the history changes or the record interval passes
+    cache_key = (area_id, hours, start_time, end_time)
+    cached = history_tracker.get_cached_response(cache_key)
+    if cached is not None:
+        return json_response(cached)
 
     try:
         # Parse time parameters
@@ -60,7 +74,7 @@ async def handle_get_history(
             hours_int = 24
             history = history_tracker.get_history(area_id, hours=hours_int)
 
-        return web.json_response(
+        body = json_bytes(
             {
                 "area_id": area_id,
                 "hours": hours_int,
@@ -70,10 +84,10 @@ async def handle_get_history(
                 "count": len(history),
             }
         )
+        history_tracker.cache_response(cache_key, body)
+        return json_response(body)
     except ValueError as err:
-        return web.json_response(
-            {"error": f"Invalid time parameter: {err}"}, status=400
-        )
+        return json_response({"error": f"Invalid time parameter: {err}"}, status=400)
 
 
 async def handle_get_learning_stats(hass: HomeAssistant, area_id: str) -> web.Response:
@@ -88,11 +102,11 @@ async def handle_get_learning_stats(hass: HomeAssistant, area_id: str) -> web.Re
     """
     learning_engine = hass.data.get(DOMAIN, {}).get("learning_engine")
     if not learning_engine:
-        return web.json_response({"error": "Learning engine not available"}, status=503)
+        return json_response({"error": "Learning engine not available"}, status=503)
 
     stats = await learning_engine.async_get_learning_stats(area_id)
 
-    return web.json_response({"area_id": area_id, "stats": stats})
+    return json_response({"area_id": area_id, "stats": stats})
 
 
 async def handle_get_history_config(hass: HomeAssistant) -> web.Response:
@@ -107,16 +121,29 @@ async def handle_get_history_config(hass: HomeAssistant) -> web.Response:
     await asyncio.sleep(0)
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+
+    global _history_config_cache
+    # Retention and backend can change through several endpoints, so the
+    # cached body is keyed on their current values rather than invalidated
+    cache_key = (
+        history_tracker.get_retention_days(),
+        history_tracker.get_storage_backend(),
+    )
+    cached = _history_config_cache
+    if cached is not None and cached[0] == cache_key:
+        return json_response(cached[1])
 
-    return web.json_response(
+    body = json_bytes(
         {
-            "retention_days": history_tracker.get_retention_days(),
-            "storage_backend": history_tracker.get_storage_backend(),
+            "retention_days": cache_key[0],
+            "storage_backend": cache_key[1],
             "record_interval_seconds": HISTORY_RECORD_INTERVAL_SECONDS,
-            "record_interval_minutes": HISTORY_RECORD_INTERVAL_SECONDS / 60,
+            "record_interval_minutes": _RECORD_INTERVAL_MINUTES,
         }
     )
+    _history_config_cache = (cache_key, body)
+    return json_response(body)
 
 
 async def handle_set_history_config(hass: HomeAssistant, data: dict) -> web.Response:
@@ -131,13 +158,13 @@ async def handle_set_history_config(hass: HomeAssistant, data: dict) -> web.Resp
     """
     retention_days = data.get("retention_days")
     if not retention_days:
-        return web.json_response({"error": "retention_days required"}, status=400)
+        return json_response({"error": "retention_days required"}, status=400)
 
     try:
         await asyncio.sleep(0)
         history_tracker = hass.data.get(DOMAIN, {}).get("history")
         if not history_tracker:
-            return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+            return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
 
         history_tracker.set_retention_days(int(retention_days))
 
@@ -156,7 +183,7 @@ async def handle_set_history_config(hass: HomeAssistant, data: dict) -> web.Resp
         # Trigger cleanup if retention was reduced
         await history_tracker._async_cleanup_old_entries()
 
-        return web.json_response(
+        return json_response(
             {
                 "success": True,
                 "retention_days": history_tracker.get_retention_days(),
@@ -164,7 +191,7 @@ async def handle_set_history_config(hass: HomeAssistant, data: dict) -> web.Resp
             }
         )
     except ValueError as err:
-        return web.json_response({"error": str(err)}, status=400)
+        return json_response({"error": str(err)}, status=400)
 
 
 async def handle_get_history_storage_info(hass: HomeAssistant) -> web.Response:
@@ -179,7 +206,7 @@ async def handle_get_history_storage_info(hass: HomeAssistant) -> web.Response:
     await asyncio.sleep(0)
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
 
     storage_backend = history_tracker.get_storage_backend()
     response = {
@@ -192,7 +219,7 @@ async def handle_get_history_storage_info(hass: HomeAssistant) -> web.Response:
         stats = await history_tracker.async_get_database_stats()
         response["database_stats"] = stats
 
-    return web.json_response(response)
+    return json_response(response)
 
 
 async def handle_migrate_history_storage(
@@ -209,22 +236,22 @@ async def handle_migrate_history_storage(
     """
     target_backend = data.get("target_backend")
     if not target_backend:
-        return web.json_response({"error": "target_backend required"}, status=400)
+        return json_response({"error": "target_backend required"}, status=400)
 
     if target_backend not in ["json", "database"]:
-        return web.json_response(
+        return json_response(
             {"error": "target_backend must be 'json' or 'database'"}, status=400
         )
 
     await asyncio.sleep(0)
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
 
     result = await history_tracker.async_migrate_storage(target_backend)
 
     status_code = 200 if result["success"] else 400
-    return web.json_response(result, status=status_code)
+    return json_response(result, status=status_code)
 
 
 async def handle_get_database_stats(hass: HomeAssistant) -> web.Response:
@@ -239,10 +266,10 @@ async def handle_get_database_stats(hass: HomeAssistant) -> web.Response:
     await asyncio.sleep(0)
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
 
     stats = await history_tracker.async_get_database_stats()
-    return web.json_response(stats)
+    return json_response(stats)
 
 
 async def handle_cleanup_history(hass: HomeAssistant) -> web.Response:
@@ -256,11 +283,11 @@ async def handle_cleanup_history(hass: HomeAssistant) -> web.Response:
     """
     history_tracker = hass.data.get(DOMAIN, {}).get("history")
     if not history_tracker:
-        return web.json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
+        return json_response({"error": ERROR_HISTORY_NOT_AVAILABLE}, status=503)
 
     await history_tracker._async_cleanup_old_entries()
 
-    return web.json_response(
+    return json_response(
         {
             "success": True,
             "message": "History cleanup completed",
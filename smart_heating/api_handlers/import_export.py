@@ -1,13 +1,18 @@
 """Import/Export API handlers for Smart Heating."""
 
-import asyncio
-import json
 import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
 
+import orjson
 from aiohttp import web
 from homeassistant.core import HomeAssistant
 
 from ..config_manager import ConfigManager
+from ..const import MAX_BACKUP_SIZE
+from ..utils import json_response
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,18 +33,18 @@ async def handle_export_config(
         # Export configuration
         config_data = await config_manager.async_export_config()
 
-        # Convert to JSON string with nice formatting
-        json_str = json.dumps(config_data, indent=2, ensure_ascii=False)
+        # Convert to JSON with nice formatting
+        body = orjson.dumps(
+            config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
 
         # Create filename with timestamp
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"smart_heating_backup_{timestamp}.json"
 
         # Return as downloadable file
         return web.Response(
-            body=json_str.encode("utf-8"),
+            body=body,
             headers={
                 "Content-Type": "application/json",
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -48,7 +53,7 @@ async def handle_export_config(
 
     except Exception as err:
         _LOGGER.error("Failed to export configuration: %s", err)
-        return web.json_response({"error": f"Export failed: {str(err)}"}, status=500)
+        return json_response({"error": f"Export failed: {str(err)}"}, status=500)
 
 
 async def handle_import_config(
@@ -75,7 +80,7 @@ async def handle_import_config(
 
         _LOGGER.info("Configuration imported successfully: %s", changes)
 
-        return web.json_response(
+        return json_response(
             {
                 "success": True,
                 "message": "Configuration imported successfully",
@@ -85,12 +90,12 @@ async def handle_import_config(
 
     except ValueError as err:
         _LOGGER.error("Invalid configuration data: %s", err)
-        return web.json_response(
+        return json_response(
             {"error": f"Invalid configuration: {str(err)}"}, status=400
         )
     except Exception as err:
         _LOGGER.error("Failed to import configuration: %s", err)
-        return web.json_response({"error": f"Import failed: {str(err)}"}, status=500)
+        return json_response({"error": f"Import failed: {str(err)}"}, status=500)
 
 
 async def handle_validate_config(
@@ -127,19 +132,49 @@ async def handle_validate_config(
             "vacation_mode_included": "vacation_mode" in data,
         }
 
-        return web.json_response(preview)
+        return json_response(preview)
 
     except ValueError as err:
-        return web.json_response({"valid": False, "error": str(err)}, status=400)
+        return json_response({"valid": False, "error": str(err)}, status=400)
     except Exception as err:
         _LOGGER.error("Failed to validate configuration: %s", err)
-        return web.json_response(
+        return json_response(
             {"valid": False, "error": f"Validation failed: {str(err)}"}, status=500
         )
 
 
+def _scan_backups(backup_dir: Path) -> list[dict]:
+    """Collect backup file details, newest first (runs in the executor).
+
+    Args:
+        backup_dir: Backup directory
+
+    Returns:
+        List of backup file details
+    """
+    if not backup_dir.exists():
+        return []
+
+    with os.scandir(backup_dir) as entries:
+        backups = [
+            {
+                "filename": entry.name,
+                "size": (stat := entry.stat()).st_size,
+                "created": stat.st_mtime,
+            }
+            for entry in entries
+            if entry.name.startswith("backup_")
+            and entry.name.endswith(".json")
+            and entry.is_file()
+        ]
+
+    # Filenames carry the backup timestamp
+    backups.sort(key=lambda backup: backup["filename"], reverse=True)
+    return backups
+
+
 async def handle_list_backups(
-    _hass: HomeAssistant, config_manager: ConfigManager
+    hass: HomeAssistant, config_manager: ConfigManager
 ) -> web.Response:
     """List available backup files.
 
@@ -150,35 +185,40 @@ async def handle_list_backups(
     Returns:
         JSON response with list of backups
     """
-    await asyncio.sleep(0)  # Minimal async operation to satisfy async requirement
     try:
-        backup_dir = config_manager.backup_dir
-
-        if not backup_dir.exists():
-            return web.json_response({"backups": []})
-
-        backups = []
-        for backup_file in sorted(backup_dir.glob("backup_*.json"), reverse=True):
-            stat = backup_file.stat()
-            backups.append(
-                {
-                    "filename": backup_file.name,
-                    "size": stat.st_size,
-                    "created": stat.st_mtime,
-                }
-            )
-
-        return web.json_response({"backups": backups})
+        backups = await hass.async_add_executor_job(
+            _scan_backups, config_manager.backup_dir
+        )
+        return json_response({"backups": backups})
 
     except Exception as err:
         _LOGGER.error("Failed to list backups: %s", err)
-        return web.json_response(
+        return json_response(
             {"error": f"Failed to list backups: {str(err)}"}, status=500
         )
 
 
+def _read_backup(backup_file: Path) -> Any:
+    """Read and parse a backup file (runs in the executor).
+
+    Args:
+        backup_file: Backup file path
+
+    Returns:
+        Parsed backup data
+
+    Raises:
+        FileNotFoundError: If the backup file does not exist
+        ValueError: If the file is too large or not valid JSON
+    """
+    size = backup_file.stat().st_size
+    if size > MAX_BACKUP_SIZE:
+        raise ValueError(f"Backup file too large ({size} bytes)")
+    return orjson.loads(backup_file.read_bytes())
+
+
 async def handle_restore_backup(
-    _hass: HomeAssistant, config_manager: ConfigManager, backup_filename: str
+    hass: HomeAssistant, config_manager: ConfigManager, backup_filename: str
 ) -> web.Response:
     """Restore from a specific backup file.
 
@@ -193,14 +233,17 @@ async def handle_restore_backup(
     try:
         backup_file = config_manager.backup_dir / backup_filename
 
-        if not backup_file.exists():
-            return web.json_response(
+        # Load backup data off the event loop
+        try:
+            config_data = await hass.async_add_executor_job(_read_backup, backup_file)
+        except FileNotFoundError:
+            return json_response(
                 {"error": f"Backup file not found: {backup_filename}"}, status=404
             )
-
-        # Load backup data
-        with open(backup_file, "r", encoding="utf-8") as f:
-            config_data = json.load(f)
+        except ValueError as err:
+            return json_response(
+                {"error": f"Invalid backup file: {str(err)}"}, status=400
+            )
 
         # Import configuration (creates another backup before restore)
         changes = await config_manager.async_import_config(
@@ -209,7 +252,7 @@ async def handle_restore_backup(
 
         _LOGGER.info("Backup restored successfully: %s", backup_filename)
 
-        return web.json_response(
+        return json_response(
             {
                 "success": True,
                 "message": f"Backup {backup_filename} restored successfully",
@@ -219,4 +262,4 @@ async def handle_restore_backup(
 
     except Exception as err:
         _LOGGER.error("Failed to restore backup: %s", err)
-        return web.json_response({"error": f"Restore failed: {str(err)}"}, status=500)
+        return json_response({"error": f"Restore failed: {str(err)}"}, status=500)
@@ -6,6 +6,7 @@ from aiohttp import web
 from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN
+from ..utils import json_response
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,15 +32,15 @@ async def handle_get_area_logs(
         # Get area logger from hass data
         area_logger = hass.data[DOMAIN].get("area_logger")
         if not area_logger:
-            return web.json_response({"logs": []})
+            return json_response({"logs": []})
 
         # Get logs (async)
         logs = await area_logger.async_get_logs(
             area_id=area_id, limit=int(limit) if limit else None, event_type=event_type
         )
 
-        return web.json_response({"logs": logs})
+        return json_response({"logs": logs})
 
     except Exception as err:
         _LOGGER.error("Error getting logs for area %s: %s", area_id, err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
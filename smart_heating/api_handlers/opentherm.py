@@ -7,6 +7,7 @@ from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN
 from ..overshoot_protection import OvershootProtection
+from ..utils import json_response
 import asyncio
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,16 +33,16 @@ async def handle_get_opentherm_logs(
         # Get OpenTherm logger from hass data
         opentherm_logger = hass.data[DOMAIN].get("opentherm_logger")
         if not opentherm_logger:
-            return web.json_response({"logs": []})
+            return json_response({"logs": []})
 
         # Get logs
         logs = opentherm_logger.get_logs(limit=int(limit) if limit else None)
 
-        return web.json_response({"logs": logs, "count": len(logs)})
+        return json_response({"logs": logs, "count": len(logs)})
 
     except Exception as err:
         _LOGGER.error("Error getting OpenTherm logs: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_get_opentherm_capabilities(
@@ -59,15 +60,15 @@ async def handle_get_opentherm_capabilities(
         await asyncio.sleep(0)
         opentherm_logger = hass.data[DOMAIN].get("opentherm_logger")
         if not opentherm_logger:
-            return web.json_response({"capabilities": {}})
+            return json_response({"capabilities": {}})
 
         capabilities = opentherm_logger.get_gateway_capabilities()
 
-        return web.json_response(capabilities)
+        return json_response(capabilities)
 
     except Exception as err:
         _LOGGER.error("Error getting OpenTherm capabilities: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_get_opentherm_gateways(hass: HomeAssistant) -> web.Response:  # NOSONAR
@@ -92,10 +93,10 @@ async def handle_get_opentherm_gateways(hass: HomeAssistant) -> web.Response:  #
                 or entry.entry_id
             )
             gateways.append({"gateway_id": gw_id, "title": entry.title})
-        return web.json_response({"gateways": gateways})
+        return json_response({"gateways": gateways})
     except Exception as err:
         _LOGGER.error("Error listing OpenTherm gateways: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_discover_opentherm_capabilities(
@@ -113,13 +114,13 @@ async def handle_discover_opentherm_capabilities(
     try:
         opentherm_logger = hass.data[DOMAIN].get("opentherm_logger")
         if not opentherm_logger:
-            return web.json_response(
+            return json_response(
                 {"error": "OpenTherm logger not available"}, status=503
             )
 
         gateway_id = area_manager.opentherm_gateway_id
         if not gateway_id:
-            return web.json_response(
+            return json_response(
                 {"error": "No OpenTherm Gateway configured"}, status=400
             )
 
@@ -127,11 +128,11 @@ async def handle_discover_opentherm_capabilities(
             gateway_id
         )
 
-        return web.json_response(capabilities)
+        return json_response(capabilities)
 
     except Exception as err:
         _LOGGER.error("Error discovering OpenTherm capabilities: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_clear_opentherm_logs(hass: HomeAssistant) -> web.Response:  # NOSONAR
@@ -147,17 +148,17 @@ async def handle_clear_opentherm_logs(hass: HomeAssistant) -> web.Response:  # N
         await asyncio.sleep(0)
         opentherm_logger = hass.data[DOMAIN].get("opentherm_logger")
         if not opentherm_logger:
-            return web.json_response(
+            return json_response(
                 {"error": "OpenTherm logger not available"}, status=503
             )
 
         opentherm_logger.clear_logs()
 
-        return web.json_response({"success": True, "message": "Logs cleared"})
+        return json_response({"success": True, "message": "Logs cleared"})
 
     except Exception as err:
         _LOGGER.error("Error clearing OpenTherm logs: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
 
 
 async def handle_calibrate_opentherm(
@@ -177,7 +178,7 @@ async def handle_calibrate_opentherm(
     """
     try:
         if not area_manager.opentherm_gateway_id:
-            return web.json_response(
+            return json_response(
                 {"error": "No OpenTherm Gateway configured"}, status=400
             )
 
@@ -185,7 +186,7 @@ async def handle_calibrate_opentherm(
         op = OvershootProtection(coordinator, "radiator")
         value = await op.calculate()
         if value is None:
-            return web.json_response(
+            return json_response(
                 {"error": "Calibration failed or timed out"}, status=500
             )
 
@@ -193,7 +194,7 @@ async def handle_calibrate_opentherm(
         area_manager.default_opv = value
         await area_manager.async_save()
 
-        return web.json_response({"opv": value})
+        return json_response({"opv": value})
     except Exception as err:
         _LOGGER.error("Error during OPV calibration: %s", err)
-        return web.json_response({"error": str(err)}, status=500)
+        return json_response({"error": str(err)}, status=500)
@@ -10,7 +10,12 @@ from homeassistant.helpers import area_registry as ar
 from ..area_manager import AreaManager
 from ..const import DOMAIN
 from ..models import Area, Schedule
-from ..utils import get_coordinator, validate_area_id, validate_temperature
+from ..utils import (
+    get_climate_controller,
+    get_coordinator,
+    validate_area_id,
+    validate_temperature,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,9 +63,7 @@ async def handle_add_schedule(
             ha_area = area_registry.async_get_area(area_id)
             if ha_area:
                 # Create internal storage for this HA area
-                area = Area(area_id, ha_area.name)
-                area.area_manager = area_manager
-                area_manager.areas[area_id] = area
+                area_manager.add_area(Area(area_id, ha_area.name))
             else:
                 return web.json_response(
                     {"error": f"Area {area_id} not found"}, status=404
@@ -92,7 +95,7 @@ async def handle_add_schedule(
             return web.json_response({"error": f"Area {area_id} not found"}, status=404)
 
         area.add_schedule(schedule)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         return web.json_response({"success": True, "schedule": schedule.to_dict()})
     except ValueError as err:
@@ -115,7 +118,7 @@ async def handle_remove_schedule(
     """
     try:
         area_manager.remove_schedule_from_area(area_id, schedule_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Clear the schedule cache so the scheduler re-evaluates immediately
         schedule_executor = hass.data[DOMAIN].get("schedule_executor")
@@ -151,44 +154,36 @@ async def handle_set_preset_mode(
             raise ValueError(f"Area {area_id} not found")
 
         old_preset = area.preset_mode
-        old_target = area.target_temperature
-        old_effective = area.get_effective_target_temperature()
-
-        _LOGGER.warning(
-            "🎛️  API: SET PRESET MODE for %s: '%s' → '%s' | Current temp: %.1f°C, Effective: %.1f°C",
-            area.name,
-            old_preset,
-            preset_mode,
-            old_target,
-            old_effective,
-        )
+        # Only compute effective temperatures when they will actually be logged
+        log_info = _LOGGER.isEnabledFor(logging.INFO)
+        old_effective = area.get_effective_target_temperature() if log_info else None
 
         area.set_preset_mode(preset_mode)
 
         # Clear manual override mode when user sets preset via app
-        if hasattr(area, "manual_override") and area.manual_override:
-            _LOGGER.warning(
+        if area.manual_override:
+            _LOGGER.info(
                 "🔓 Clearing manual override for %s - preset mode now in control",
                 area.name,
             )
             area.manual_override = False
 
-        await area_manager.async_save()
-
-        # Get new effective temperature
-        new_effective = area.get_effective_target_temperature()
+        area_manager.async_save_soon()
 
-        _LOGGER.warning(
-            "✓ Preset applied: %s → '%s' | Effective temp: %.1f°C → %.1f°C (base: %.1f°C)",
-            area.name,
-            preset_mode,
-            old_effective,
-            new_effective,
-            old_target,
-        )
+        if log_info:
+            _LOGGER.info(
+                "🎛️  API: SET PRESET MODE for %s: '%s' → '%s' | "
+                "Effective temp: %.1f°C → %.1f°C (base: %.1f°C)",
+                area.name,
+                old_preset,
+                preset_mode,
+                old_effective,
+                area.get_effective_target_temperature(),
+                area.target_temperature,
+            )
 
         # Trigger immediate climate control to apply new temperature
-        climate_controller = hass.data.get(DOMAIN, {}).get("climate_controller")
+        climate_controller = get_climate_controller(hass)
         if climate_controller:
             await climate_controller.async_control_heating()
             _LOGGER.info("Triggered immediate climate control after preset change")
@@ -228,7 +223,7 @@ async def handle_set_boost_mode(
             raise ValueError(f"Area {area_id} not found")
 
         area.set_boost_mode(duration, temp)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -268,7 +263,7 @@ async def handle_cancel_boost(
             raise ValueError(f"Area {area_id} not found")
 
         area.cancel_boost_mode()
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -40,7 +40,7 @@ async def handle_add_window_sensor(
         temp_drop = data.get("temp_drop")
 
         area.add_window_sensor(entity_id, action_when_open, temp_drop)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -74,7 +74,7 @@ async def handle_remove_window_sensor(
             raise ValueError(f"Area {area_id} not found")
 
         area.remove_window_sensor(entity_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -116,7 +116,7 @@ async def handle_add_presence_sensor(
             raise ValueError(f"Area {area_id} not found")
 
         area.add_presence_sensor(entity_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -150,7 +150,7 @@ async def handle_remove_presence_sensor(
             raise ValueError(f"Area {area_id} not found")
 
         area.remove_presence_sensor(entity_id)
-        await area_manager.async_save()
+        area_manager.async_save_soon()
 
         # Refresh coordinator
         coordinator = get_coordinator(hass)
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -111,8 +112,8 @@ class AreaLogger:
 
         def _write():
             try:
-                with open(log_file, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(entry) + "\n")
+                with open(log_file, "ab") as f:
+                    f.write(json_bytes(entry) + b"\n")
             except Exception as err:
                 _LOGGER.error("Failed to write log for area %s: %s", area_id, err)
 
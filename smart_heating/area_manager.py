@@ -3,7 +3,7 @@
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import (
@@ -18,6 +18,7 @@ from .const import (
     DEFAULT_TRV_IDLE_TEMP,
     DEFAULT_TRV_TEMP_OFFSET,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 from .models import Area, Schedule
@@ -95,8 +96,34 @@ class AreaManager:
         self._safety_alert_active: bool = False  # Current alert state
         self._safety_state_unsub = None  # State listener unsubscribe callback
 
+        # Bumped whenever area data is saved, so API caches know to rebuild
+        self._version: int = 0
+        # Bumped by the climate controller after each control cycle, which
+        # updates runtime area state (heating/idle/...) without saving
+        self._live_version: int = 0
+        # (cache key, encoded body, ETag) of the last GET /areas response
+        self.areas_response_cache: tuple[tuple, bytes, str] | None = None
+        # (cache key, encoded body) of the last GET /config and /global_presets
+        self.config_response_cache: tuple[tuple, bytes] | None = None
+        self.presets_response_cache: tuple[int, bytes] | None = None
+
         _LOGGER.debug("AreaManager initialized")
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes every time area data is saved."""
+        return self._version
+
+    @property
+    def live_version(self) -> int:
+        """Return a counter that changes whenever runtime area state may change."""
+        return self._live_version
+
+    @callback
+    def mark_live_state_changed(self) -> None:
+        """Signal that runtime area state changed without a save."""
+        self._live_version += 1
+
     async def async_load(self) -> None:
         """Load areas from storage."""
         _LOGGER.debug("Loading areas from storage")
@@ -170,9 +197,7 @@ class AreaManager:
             # Load areas
             if "areas" in data:
                 for area_data in data["areas"]:
-                    area = Area.from_dict(area_data)
-                    area.area_manager = self  # Store reference to area_manager
-                    self.areas[area.area_id] = area
+                    self.add_area(Area.from_dict(area_data))
                 _LOGGER.info("Loaded %d areas from storage", len(self.areas))
         else:
             _LOGGER.debug("No areas found in storage")
@@ -180,7 +205,23 @@ class AreaManager:
     async def async_save(self) -> None:
         """Save areas to storage."""
         _LOGGER.debug("Saving areas to storage")
-        data = {
+        self._version += 1
+        await self._store.async_save(self._data_to_save())
+        _LOGGER.info("Saved %d areas and global config to storage", len(self.areas))
+
+    @callback
+    def async_save_soon(self) -> None:
+        """Schedule a debounced save to storage.
+
+        Repeated calls within STORAGE_SAVE_DELAY are coalesced into a single
+        write. Pending writes are flushed by the store when Home Assistant stops.
+        """
+        self._version += 1
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Build the storage payload for areas and global config."""
+        return {
             "opentherm_gateway_id": self.opentherm_gateway_id,
             # opentherm_enabled removed: whether control is active is determined by gateway existence
             "trv_heating_temp": self.trv_heating_temp,
@@ -211,8 +252,6 @@ class AreaManager:
             "default_boiler_capacity": self.default_boiler_capacity,
             "default_opv": self.default_opv,
         }
-        await self._store.async_save(data)
-        _LOGGER.info("Saved %d areas and global config to storage", len(self.areas))
 
     def get_area(self, area_id: str) -> Area | None:
         """Get a area by ID.
@@ -225,6 +264,15 @@ class AreaManager:
         """
         return self.areas.get(area_id)
 
+    def add_area(self, area: Area) -> None:
+        """Register an area with the manager.
+
+        Args:
+            area: Area instance
+        """
+        area.area_manager = self
+        self.areas[area.area_id] = area
+
     def get_all_areas(self) -> dict[str, Area]:
         """Get all areas.
 
@@ -304,15 +352,7 @@ class AreaManager:
         if area is None:
             raise ValueError(f"Area {area_id} does not exist")
 
-        old_temp = area.target_temperature
-        area.target_temperature = temperature
-        _LOGGER.warning(
-            "TARGET TEMP CHANGE for %s: %.1f°C → %.1f°C (preset: %s)",
-            area_id,
-            old_temp,
-            temperature,
-            area.preset_mode,
-        )
+        area.set_target_temperature(temperature)
 
     def enable_area(self, area_id: str) -> None:
         """Enable a area.
@@ -34,7 +34,6 @@ class ClimateController:
         self.hass = hass
         self.area_manager = area_manager
         self.learning_engine = learning_engine
-        self._hysteresis = 0.5  # Temperature hysteresis in °C
 
         # Initialize handlers
         self.temp_handler = TemperatureSensorHandler(hass)
@@ -43,6 +42,15 @@ class ClimateController:
         self.protection_handler = None  # Set by set_area_logger
         self.cycle_handler = None  # Set by set_area_logger
 
+    @property
+    def _hysteresis(self) -> float:
+        """Global temperature hysteresis in °C, owned by the area manager."""
+        return self.area_manager.hysteresis
+
+    @_hysteresis.setter
+    def _hysteresis(self, value: float) -> None:
+        self.area_manager.hysteresis = value
+
     def set_area_logger(self, area_logger) -> None:
         """Set area logger and reinitialize handlers that need it.
 
@@ -240,7 +248,7 @@ class ClimateController:
             return None, None
 
         # Check for manual override mode
-        if hasattr(area, "manual_override") and area.manual_override:
+        if area.manual_override:
             await self.protection_handler.async_handle_manual_override(
                 area_id, area, self.device_handler
             )
@@ -495,6 +503,9 @@ class ClimateController:
             if area_max_temp:
                 max_target_temp = max(max_target_temp, area_max_temp)
 
+        # Area states were updated in place, so let API caches rebuild
+        self.area_manager.mark_live_state_changed()
+
         # Control OpenTherm gateway
         await self.device_handler.async_control_opentherm_gateway(
             len(heating_areas) > 0, max_target_temp
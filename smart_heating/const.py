@@ -84,10 +84,15 @@ HVAC_MODE_COOL: Final = "cool"
 HVAC_MODE_HEAT_COOL: Final = "heat_cool"
 HVAC_MODE_AUTO: Final = "auto"
 
+# Hysteresis limits (°C)
+MIN_HYSTERESIS: Final = 0.1
+MAX_HYSTERESIS: Final = 2.0
+
 # History settings
 DEFAULT_HISTORY_RETENTION_DAYS: Final = 30  # Keep 30 days by default
 MAX_HISTORY_RETENTION_DAYS: Final = 365  # Maximum 1 year retention
 HISTORY_RECORD_INTERVAL_SECONDS: Final = 300  # Record every 5 minutes
+HISTORY_RESPONSE_CACHE_SIZE: Final = 256  # Encoded history responses kept in memory
 
 # History storage backends
 HISTORY_STORAGE_JSON: Final = "json"  # JSON file storage (default)
@@ -115,6 +120,35 @@ PLATFORMS: Final = ["sensor", "switch"]
 # Storage
 STORAGE_VERSION: Final = 1
 STORAGE_KEY: Final = f"{DOMAIN}_storage"
+STORAGE_SAVE_DELAY: Final = 0.25  # seconds to coalesce bursts of API writes
+DEVICE_CACHE_TTL: Final = 60  # seconds a discovered device list is served as-is
+MAX_BACKUP_SIZE: Final = 10 * 1024 * 1024  # bytes; exports we write are a few KB
+
+# Keys in hass.data[DOMAIN] that hold shared services, not per-entry coordinators
+DOMAIN_SERVICE_KEYS: Final = frozenset(
+    {
+        "area_manager",
+        "history",
+        "area_logger",
+        "opentherm_logger",
+        "vacation_manager",
+        "user_manager",
+        "efficiency_calculator",
+        "comparison_engine",
+        "advanced_metrics_collector",
+        "advanced_metrics_task",
+        "safety_monitor",
+        "learning_engine",
+        "config_manager",
+        "climate_controller",
+        "climate_unsub",
+        "initial_control_task",
+        "schedule_executor",
+        "discover_capabilities_task",
+        "refresh_task",
+        "device_cache_unsub",
+    }
+)
 
 # Attributes
 ATTR_AREA_ID: Final = "area_id"
@@ -4,6 +4,8 @@
 # pragma: no cover
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -25,6 +27,8 @@ from sqlalchemy import (
 
 from .const import (
     DEFAULT_HISTORY_RETENTION_DAYS,
+    HISTORY_RECORD_INTERVAL_SECONDS,
+    HISTORY_RESPONSE_CACHE_SIZE,
     MAX_HISTORY_RETENTION_DAYS,
     HISTORY_STORAGE_JSON,
     HISTORY_STORAGE_DATABASE,
@@ -56,6 +60,9 @@ class HistoryTracker:
         self._storage_backend = storage_backend
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._history: dict[str, list[dict[str, Any]]] = {}
+        # Encoded API responses by query, with their time.monotonic() creation
+        # time; cleared whenever the in-memory history changes
+        self._response_cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
         self._retention_days: int = DEFAULT_HISTORY_RETENTION_DAYS
         self._cleanup_unsub = None
         self._db_table = None
@@ -201,6 +208,7 @@ class HistoryTracker:
         if data is not None:
             if "history" in data:
                 self._history = data["history"]
+                self._response_cache.clear()
             if "retention_days" in data:
                 self._retention_days = data["retention_days"]
             if "storage_backend" in data:
@@ -250,6 +258,7 @@ class HistoryTracker:
                     return history_dict
 
             self._history = await recorder.async_add_executor_job(_load)
+            self._response_cache.clear()
 
             # Load retention setting from JSON store
             data = await self._store.async_load()
@@ -340,6 +349,7 @@ class HistoryTracker:
                 )
 
         if total_removed > 0:
+            self._response_cache.clear()
             _LOGGER.info(
                 "History cleanup: removed %d entries older than %d days (JSON)",
                 total_removed,
@@ -414,6 +424,8 @@ class HistoryTracker:
         if len(self._history[area_id]) > 1000:
             self._history[area_id] = self._history[area_id][-1000:]
 
+        self._response_cache.clear()
+
         # Persist to storage backend
         if (
             self._storage_backend == HISTORY_STORAGE_DATABASE
@@ -505,6 +517,40 @@ class HistoryTracker:
             # Return all available history (within retention period)
             return self._history[area_id]
 
+    def get_cached_response(self, key: tuple) -> bytes | None:
+        """Get a cached encoded history response.
+
+        Entries expire after one record interval so that hours-based windows
+        don't drift too far behind the clock.
+
+        Args:
+            key: Query key the response was cached under
+
+        Returns:
+            Encoded response body, or None if missing or expired
+        """
+        cached = self._response_cache.get(key)
+        if cached is None:
+            return None
+        created, body = cached
+        if time.monotonic() - created >= HISTORY_RECORD_INTERVAL_SECONDS:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return body
+
+    def cache_response(self, key: tuple, body: bytes) -> None:
+        """Cache an encoded history response, evicting the least recently used.
+
+        Args:
+            key: Query key to cache the response under
+            body: Encoded response body
+        """
+        self._response_cache[key] = (time.monotonic(), body)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > HISTORY_RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
     def get_all_history(self) -> dict[str, list[dict[str, Any]]]:
         """Get all history.
 
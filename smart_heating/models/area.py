@@ -71,6 +71,7 @@ class Area:
         self.devices: dict[str, dict[str, Any]] = {}
         self.schedules: dict[str, Schedule] = {}
         self._current_temperature: float | None = None
+        self._state: str | None = None  # Set by the climate controller
         self.hidden: bool = False  # Whether area is hidden from main view
         self.area_manager: "AreaManager | None" = (
             None  # Reference to parent AreaManager
@@ -422,6 +423,22 @@ class Area:
         )
         return result
 
+    def set_target_temperature(self, temperature: float) -> None:
+        """Set the base target temperature for the area.
+
+        Args:
+            temperature: Target temperature
+        """
+        old_temp = self.target_temperature
+        self.target_temperature = temperature
+        _LOGGER.warning(
+            "TARGET TEMP CHANGE for %s: %.1f°C → %.1f°C (preset: %s)",
+            self.area_id,
+            old_temp,
+            temperature,
+            self.preset_mode,
+        )
+
     def set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode for the area.
 
@@ -755,7 +772,7 @@ class Area:
 
         # Check if any thermostat is actively heating
         # This will be updated by the climate controller
-        if hasattr(self, "_state"):
+        if self._state is not None:
             return self._state
 
         # Fallback to temperature-based state
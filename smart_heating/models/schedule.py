@@ -100,7 +100,8 @@ class Schedule:
                     raise ValueError(
                         "Invalid 'days' string format: use numeric indices (0=Monday) or short codes (mon)"
                     )
-                return d
+                # Other numeric input (e.g. a JSON 1.0) is coerced to an index
+                return int(d) % 7
 
             self.days = [normalize_day_item(x) for x in days]
             # Use first day for display (as index)
@@ -163,10 +164,10 @@ class Schedule:
             result["date"] = self.date
         # Add days for recurring weekly schedules
         elif self.days:
-            # Already stored as indices
-            result["days"] = [int(d) for d in self.days]
+            # Already normalized to int indices by __init__
+            result["days"] = list(self.days)
             if self.day is not None:
-                result["day"] = int(self.day)
+                result["day"] = self.day
 
         if self.temperature is not None:
             result["temperature"] = self.temperature
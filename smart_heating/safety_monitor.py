@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 from .const import DOMAIN
+from .utils.coordinator_helpers import call_maybe_async, get_entry_coordinator
 
 if TYPE_CHECKING:
     from .area_manager import AreaManager
@@ -194,26 +195,8 @@ class SafetyMonitor:
         )
 
         # Request coordinator refresh to update frontend immediately
-        from .const import DOMAIN
-
-        entry_ids = [
-            key
-            for key in self.hass.data[DOMAIN].keys()
-            if key
-            not in [
-                "history",
-                "climate_controller",
-                "schedule_executor",
-                "learning_engine",
-                "area_logger",
-                "vacation_manager",
-                "safety_monitor",
-            ]
-        ]
-        if entry_ids:
-            coordinator = self.hass.data[DOMAIN][entry_ids[0]]
-            from smart_heating.utils.coordinator_helpers import call_maybe_async
-
+        coordinator = get_entry_coordinator(self.hass)
+        if coordinator is not None:
             await call_maybe_async(coordinator.async_request_refresh)
             _LOGGER.info("Coordinator refresh requested after emergency shutdown")
 
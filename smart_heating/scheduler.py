@@ -690,7 +690,7 @@ class ScheduleExecutor:
 
         # Clear manual override when schedule applies a preset
         manual_override_cleared = False
-        if hasattr(area, "manual_override") and area.manual_override:
+        if area.manual_override:
             _LOGGER.info(
                 "Clearing manual override for %s - schedule now controls preset",
                 area.name,
@@ -767,7 +767,7 @@ class ScheduleExecutor:
         area.target_temperature = target_temp
 
         # Clear manual override when schedule applies a temperature
-        if hasattr(area, "manual_override") and area.manual_override:
+        if area.manual_override:
             _LOGGER.info(
                 "Clearing manual override for %s - schedule now controls temperature",
                 area.name,
@@ -1,12 +1,22 @@
 """Utility modules for Smart Heating."""
 
 from .coordinator_helpers import (
+    get_climate_controller,
     get_coordinator,
     get_coordinator_devices,
+    get_coordinator_devices_by_area,
+    get_domain_data,
+    get_entry_coordinator,
     safe_coordinator_data,
 )
 from .device_registry import DeviceRegistry, build_device_dict
-from .response_builders import build_area_response, build_device_info
+from .response_builders import (
+    build_area_response,
+    build_device_info,
+    etag_for,
+    etag_matches,
+    json_response,
+)
 from .validators import (
     validate_area_id,
     validate_entity_id,
@@ -17,13 +27,20 @@ from .validators import (
 __all__ = [
     "build_area_response",
     "build_device_info",
+    "etag_for",
+    "etag_matches",
+    "json_response",
     "validate_temperature",
     "validate_schedule_data",
     "validate_area_id",
     "validate_entity_id",
     "DeviceRegistry",
     "build_device_dict",
+    "get_climate_controller",
     "get_coordinator",
     "get_coordinator_devices",
+    "get_coordinator_devices_by_area",
+    "get_domain_data",
+    "get_entry_coordinator",
     "safe_coordinator_data",
 ]
@@ -1,15 +1,59 @@
 """Coordinator data utilities for Smart Heating."""
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 import inspect
 
 from homeassistant.core import HomeAssistant
 
-from ..const import DOMAIN
+from ..const import DOMAIN, DOMAIN_SERVICE_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback so lookups never allocate an empty dict per call
+_EMPTY_DOMAIN_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def get_domain_data(hass: HomeAssistant) -> Mapping[str, Any]:
+    """Get the Smart Heating entry of hass.data.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Domain data dictionary, or an empty read-only mapping if not set up
+    """
+    return hass.data.get(DOMAIN, _EMPTY_DOMAIN_DATA)
+
+
+def get_climate_controller(hass: HomeAssistant) -> Optional[Any]:
+    """Get the Smart Heating climate controller.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Climate controller instance, or None if not set up
+    """
+    return get_domain_data(hass).get("climate_controller")
+
+
+def get_entry_coordinator(hass: HomeAssistant) -> Optional[Any]:
+    """Get the object stored under the first config entry id in hass.data.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        First non-service value in the domain data, or None
+    """
+    for key, value in get_domain_data(hass).items():
+        if key not in DOMAIN_SERVICE_KEYS:
+            return value
+    return None
+
 
 def get_coordinator(hass: HomeAssistant) -> Optional[Any]:
     """Get the Smart Heating coordinator instance.
@@ -20,7 +64,7 @@ def get_coordinator(hass: HomeAssistant) -> Optional[Any]:
     Returns:
         Coordinator instance or None
     """
-    for _key, value in hass.data.get(DOMAIN, {}).items():
+    for value in get_domain_data(hass).values():
         # Ensure value looks like a real coordinator: it must have a dict-like
         # data attribute and an async request refresh method. MagicMock
         # frequently exposes attributes dynamically, so ensure the types to
@@ -73,6 +117,30 @@ def get_coordinator_devices(hass: HomeAssistant, area_id: str) -> Dict[str, Any]
     return device_dict
 
 
+def get_coordinator_devices_by_area(
+    hass: HomeAssistant,
+) -> Dict[str, Dict[str, Any]]:
+    """Get coordinator device data for all areas in one pass.
+
+    Looks up the coordinator once instead of once per area, for callers
+    that need device data for every area (e.g. the areas list endpoint).
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Dictionary mapping area_id -> {device_id -> device_data}
+    """
+    coordinator = get_coordinator(hass)
+    if not coordinator or not coordinator.data:
+        return {}
+
+    return {
+        area_id: {device["id"]: device for device in area_data.get("devices", [])}
+        for area_id, area_data in coordinator.data.get("areas", {}).items()
+    }
+
+
 def safe_coordinator_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Remove learning_engine from coordinator data before returning to API.
 
@@ -1,10 +1,63 @@
 """Response builder utilities for API handlers."""
 
+import hashlib
 from typing import Any, Dict, List, Optional
 
+from aiohttp import web
+from aiohttp.helpers import ETAG_ANY
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.helpers.json import json_bytes
+
 from ..models.area import Area
 
 
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """Build a JSON response serialized with orjson.
+
+    Drop-in replacement for aiohttp's web.json_response, which encodes
+    with the much slower stdlib json module.
+
+    Args:
+        data: JSON-serializable payload, or bytes that are already encoded
+        status: HTTP status code
+
+    Returns:
+        JSON response
+    """
+    body = data if isinstance(data, bytes) else json_bytes(data)
+    return web.Response(body=body, status=status, content_type=CONTENT_TYPE_JSON)
+
+
+def etag_for(body: bytes) -> str:
+    """Compute the ETag value for an encoded response body.
+
+    Args:
+        body: Encoded response body
+
+    Returns:
+        Unquoted ETag value, to be set via web.Response.etag
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def etag_matches(request: web.Request | None, etag: str) -> bool:
+    """Check whether a conditional GET already holds the current representation.
+
+    Args:
+        request: Request object, or None when the caller has no request
+        etag: Unquoted ETag value of the current body
+
+    Returns:
+        True if the request's If-None-Match matches the ETag
+    """
+    if request is None:
+        return False
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    return any(tag.value in (etag, ETAG_ANY) for tag in if_none_match)
+
+
 def build_device_info(
     device_id: str,
     device_data: Dict[str, Any],
@@ -107,23 +160,21 @@ def build_area_response(
         # Hysteresis override
         "hysteresis_override": area.hysteresis_override,
         # Manual override
-        "manual_override": getattr(area, "manual_override", False),
+        "manual_override": area.manual_override,
         # Sensors
         "window_sensors": area.window_sensors,
         "presence_sensors": area.presence_sensors,
         "use_global_presence": area.use_global_presence,
         # Auto preset mode
-        "auto_preset_enabled": getattr(area, "auto_preset_enabled", False),
-        "auto_preset_home": getattr(area, "auto_preset_home", "home"),
-        "auto_preset_away": getattr(area, "auto_preset_away", "away"),
+        "auto_preset_enabled": area.auto_preset_enabled,
+        "auto_preset_home": area.auto_preset_home,
+        "auto_preset_away": area.auto_preset_away,
         # Switch shutdown (use consistent naming)
-        "shutdown_switches_when_idle": bool(
-            getattr(area, "shutdown_switches_when_idle", True)
-        ),
+        "shutdown_switches_when_idle": bool(area.shutdown_switches_when_idle),
         "shutdown_switch_entities": getattr(area, "shutdown_switch_entities", []),
         # Primary temperature sensor
-        "primary_temperature_sensor": getattr(area, "primary_temperature_sensor", None),
+        "primary_temperature_sensor": area.primary_temperature_sensor,
         # Heating type configuration
-        "heating_type": getattr(area, "heating_type", "radiator"),
-        "custom_overhead_temp": getattr(area, "custom_overhead_temp", None),
+        "heating_type": area.heating_type,
+        "custom_overhead_temp": area.custom_overhead_temp,
     }
@@ -14,7 +14,7 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN
+from .const import DOMAIN, DOMAIN_SERVICE_KEYS
 from .coordinator import SmartHeatingCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -124,23 +124,8 @@ def _create_forward_messages_callback(coordinator, connection, msg):
 
 
 def _find_coordinator(hass: HomeAssistant):
-    exclude_keys = {
-        "history",
-        "climate_controller",
-        "schedule_executor",
-        "learning_engine",
-        "area_logger",
-        "opentherm_logger",
-        "vacation_manager",
-        "safety_monitor",
-        "climate_unsub",
-        "user_manager",
-        "efficiency_calculator",
-        "comparison_engine",
-        "config_manager",
-    }
     for key, value in hass.data[DOMAIN].items():
-        if key not in exclude_keys and hasattr(value, "async_add_listener"):
+        if key not in DOMAIN_SERVICE_KEYS and hasattr(value, "async_add_listener"):
             return value
     return None
 
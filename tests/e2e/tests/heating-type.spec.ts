@@ -20,9 +20,7 @@ test.describe('Heating Type Configuration Tests', () => {
       },
     });
 
-    expect(response.status()).toBe(200);
-    const data = await response.json();
-    expect(data.success).toBe(true);
+    expect(response.status()).toBe(204);
 
     // Verify the setting persisted
     const areasResponse = await request.get('http://localhost:8123/api/smart_heating/areas');
@@ -89,9 +87,7 @@ test.describe('Heating Type Configuration Tests', () => {
       },
     });
 
-    expect(response.status()).toBe(200);
-    const data = await response.json();
-    expect(data.success).toBe(true);
+    expect(response.status()).toBe(204);
 
     // Verify it persisted
     const areasResponse = await request.get('http://localhost:8123/api/smart_heating/areas');
@@ -122,7 +118,7 @@ test.describe('Heating Type Configuration Tests', () => {
       },
     });
 
-    expect(response.status()).toBe(200);
+    expect(response.status()).toBe(204);
 
     // Verify it was cleared
     const areasResponse = await request.get('http://localhost:8123/api/smart_heating/areas');
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp.test_utils import make_mocked_request
-from smart_heating.api import SmartHeatingAPIView
+from smart_heating.api import _AREA_ACTION_POST_HANDLERS, SmartHeatingAPIView
 from smart_heating.const import DOMAIN
 
 
@@ -16,3 +16,17 @@ async def test_api_handler_raises_500_on_exception(hass, mock_area_manager):
         resp = await api_view.get(req, "status")
         assert resp.status == 500
         assert "boom" in (resp.text or "")
+
+
+@pytest.mark.asyncio
+async def test_api_post_handler_exception_returns_500(hass, mock_area_manager):
+    hass.data.setdefault(DOMAIN, {})
+    api_view = SmartHeatingAPIView(hass, mock_area_manager)
+
+    with patch.dict(
+        _AREA_ACTION_POST_HANDLERS, {"hide": AsyncMock(side_effect=RuntimeError("hide failed"))}
+    ):
+        req = make_mocked_request("POST", "/api/smart_heating/areas/living_room/hide")
+        resp = await api_view.post(req, "areas/living_room/hide")
+        assert resp.status == 500
+        assert "hide failed" in (resp.text or "")
@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
-from smart_heating.api import SmartHeatingAPIView
+from smart_heating.api import (
+    _AREA_ACTION_POST_HANDLERS,
+    _AREA_DATA_POST_HANDLERS,
+    SmartHeatingAPIView,
+)
 from smart_heating.const import DOMAIN
 
 
@@ -36,8 +40,6 @@ async def test_api_exhaustive_endpoints(hass, mock_area_manager):
     ]
 
     post_endpoints = [
-        ("areas/area1/enable", "smart_heating.api.handle_enable_area"),
-        ("areas/area1/devices", "smart_heating.api.handle_add_device"),
         ("global_presets", "smart_heating.api.handle_set_global_presets"),
         ("import", "smart_heating.api.handle_import_config"),
         ("users", "smart_heating.api.handle_create_user"),
@@ -54,18 +56,28 @@ async def test_api_exhaustive_endpoints(hass, mock_area_manager):
 
     all_handlers = {h for _, h in get_endpoints + post_endpoints + delete_endpoints}
 
+    # Area POST handlers are referenced directly by the dispatch tables
+    area_post_endpoints = [
+        ("areas/area1/enable", _AREA_ACTION_POST_HANDLERS, "enable"),
+        ("areas/area1/devices", _AREA_DATA_POST_HANDLERS, "devices"),
+    ]
+
     with ExitStack() as stack:
         for handler in all_handlers:
             stack.enter_context(
                 patch(handler, AsyncMock(return_value=web.json_response({"ok": True})), create=True)
             )
+        for _, table, key in area_post_endpoints:
+            stack.enter_context(
+                patch.dict(table, {key: AsyncMock(return_value=web.json_response({"ok": True}))})
+            )
 
         for endpoint, _ in get_endpoints:
             req = make_mocked_request("GET", f"/api/smart_heating/{endpoint}")
             resp = await api_view.get(req, endpoint)
             assert resp.status in (200, 404, 503, 400, 500)
 
-        for endpoint, _ in post_endpoints:
+        for endpoint, *_ in post_endpoints + area_post_endpoints:
             req = make_mocked_request("POST", f"/api/smart_heating/{endpoint}")
             req.json = AsyncMock(return_value={})
             resp = await api_view.post(req, endpoint)
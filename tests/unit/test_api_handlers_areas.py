@@ -1,9 +1,11 @@
 """Tests for area API handlers."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp.test_utils import make_mocked_request
 from smart_heating.api_handlers.areas import (
     handle_disable_area,
     handle_enable_area,
@@ -29,6 +31,9 @@ def mock_hass():
     hass.data = {}
     hass.data = {DOMAIN: {"test_coordinator": MagicMock()}}
     hass.states = MagicMock()
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
     return hass
 
 
@@ -92,7 +97,10 @@ class TestAreaHandlers:
         """Test getting all areas."""
         with (
             patch("smart_heating.api_handlers.areas.ar.async_get", return_value=mock_area_registry),
-            patch("smart_heating.api_handlers.areas.get_coordinator_devices", return_value={}),
+            patch(
+                "smart_heating.api_handlers.areas.get_coordinator_devices_by_area",
+                return_value={},
+            ),
             patch(
                 "smart_heating.api_handlers.areas.build_device_info",
                 return_value={"id": "climate.heater"},
@@ -116,6 +124,113 @@ class TestAreaHandlers:
             assert body["areas"][0]["id"] == "living_room"
             assert body["areas"][0]["name"] == "Living Room"
 
+    @pytest.mark.asyncio
+    async def test_handle_get_areas_pairs_device_data(
+        self, mock_hass, mock_area_manager, mock_area_registry
+    ):
+        """Test each device gets its own state and coordinator data."""
+        mock_area_manager.get_area.return_value.devices = {
+            "climate.a": {"type": "thermostat"},
+            "climate.b": {"type": "thermostat"},
+        }
+        states = {
+            "climate.a": MagicMock(attributes={"friendly_name": "A"}),
+            "climate.b": MagicMock(attributes={"friendly_name": "B"}),
+        }
+        mock_hass.states.get.side_effect = states.get
+        coordinator_devices = {"living_room": {"climate.b": {"current_temperature": 19.5}}}
+
+        with (
+            patch("smart_heating.api_handlers.areas.ar.async_get", return_value=mock_area_registry),
+            patch(
+                "smart_heating.api_handlers.areas.get_coordinator_devices_by_area",
+                return_value=coordinator_devices,
+            ),
+            patch(
+                "smart_heating.api_handlers.areas.build_area_response",
+                side_effect=lambda area, devices: {"id": area.id, "devices": devices},
+            ),
+        ):
+            response = await handle_get_areas(mock_hass, mock_area_manager)
+
+        devices = json.loads(response.body.decode())["areas"][0]["devices"]
+        assert [d["name"] for d in devices] == ["A", "B"]
+        assert "current_temperature" not in devices[0]
+        assert devices[1]["current_temperature"] == 19.5
+
+    @pytest.mark.asyncio
+    async def test_handle_get_areas_serves_cached_body(
+        self, mock_hass, mock_area_manager, mock_area_registry
+    ):
+        """Test unchanged areas reuse the encoded body until a save or refresh."""
+        mock_coordinator = MagicMock()
+        mock_coordinator.data = {"areas": {}}
+        mock_coordinator.async_request_refresh = AsyncMock()
+        mock_hass.data[DOMAIN]["test_coordinator"] = mock_coordinator
+        mock_area_manager.version = 1
+        mock_area_manager.live_version = 1
+        mock_area_manager.areas_response_cache = None
+
+        with (
+            patch("smart_heating.api_handlers.areas.ar.async_get", return_value=mock_area_registry),
+            patch(
+                "smart_heating.api_handlers.areas.build_area_response",
+                return_value={"id": "living_room"},
+            ) as mock_build,
+        ):
+            first = await handle_get_areas(mock_hass, mock_area_manager)
+            second = await handle_get_areas(mock_hass, mock_area_manager)
+            assert mock_build.call_count == 1
+            assert second.body == first.body
+
+            # A save bumps the version
+            mock_area_manager.version = 2
+            await handle_get_areas(mock_hass, mock_area_manager)
+            assert mock_build.call_count == 2
+
+            # A coordinator refresh replaces its data
+            mock_coordinator.data = {"areas": {}}
+            await handle_get_areas(mock_hass, mock_area_manager)
+            assert mock_build.call_count == 3
+
+            # A control cycle updates area states in place
+            mock_area_manager.live_version = 2
+            await handle_get_areas(mock_hass, mock_area_manager)
+            assert mock_build.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_handle_get_areas_etag_not_modified(
+        self, mock_hass, mock_area_manager, mock_area_registry
+    ):
+        """Test a poll with the current ETag gets an empty 304."""
+        mock_area_manager.areas_response_cache = None
+
+        with (
+            patch("smart_heating.api_handlers.areas.ar.async_get", return_value=mock_area_registry),
+            patch(
+                "smart_heating.api_handlers.areas.build_area_response",
+                return_value={"id": "living_room"},
+            ),
+        ):
+            first = await handle_get_areas(mock_hass, mock_area_manager)
+            etag = first.headers["ETag"]
+
+            request = make_mocked_request(
+                "GET", "/api/smart_heating/areas", headers={"If-None-Match": etag}
+            )
+            second = await handle_get_areas(mock_hass, mock_area_manager, request)
+
+            request = make_mocked_request(
+                "GET", "/api/smart_heating/areas", headers={"If-None-Match": '"stale"'}
+            )
+            third = await handle_get_areas(mock_hass, mock_area_manager, request)
+
+        assert second.status == 304
+        assert second.headers["ETag"] == etag
+        assert not second.body
+        assert third.status == 200
+        assert third.body == first.body
+
     @pytest.mark.asyncio
     async def test_handle_get_areas_no_stored_data(self, mock_hass, mock_area_registry):
         """Test getting areas with no stored data."""
@@ -180,21 +295,21 @@ class TestAreaHandlers:
         data = {"temperature": 22.5}
 
         with (
-            patch("smart_heating.utils.validators.validate_area_id", return_value=(True, None)),
-            patch("smart_heating.utils.validators.validate_temperature", return_value=(True, None)),
+            patch("smart_heating.api_handlers.areas.validate_area_id", return_value=(True, None)),
+            patch(
+                "smart_heating.api_handlers.areas.validate_temperature", return_value=(True, None)
+            ),
         ):
             response = await handle_set_temperature(
                 mock_hass, mock_area_manager, "living_room", data
             )
 
-            assert response.status == 200
-            body = json.loads(response.body.decode())
-            assert body["success"]
+            assert response.status == 204
 
-            mock_area_manager.set_area_target_temperature.assert_called_once_with(
-                "living_room", 22.5
+            mock_area_manager.get_area.return_value.set_target_temperature.assert_called_once_with(
+                22.5
             )
-            mock_area_manager.async_save.assert_called_once()
+            mock_area_manager.async_save_soon.assert_called_once()
             mock_climate.async_control_heating.assert_called_once()
 
     @pytest.mark.asyncio
@@ -203,7 +318,7 @@ class TestAreaHandlers:
         data = {"temperature": 22.5}
 
         with patch(
-            "smart_heating.utils.validators.validate_area_id",
+            "smart_heating.api_handlers.areas.validate_area_id",
             return_value=(False, "Invalid area ID"),
         ):
             response = await handle_set_temperature(mock_hass, mock_area_manager, "", data)
@@ -218,9 +333,9 @@ class TestAreaHandlers:
         data = {"temperature": 100}
 
         with (
-            patch("smart_heating.utils.validators.validate_area_id", return_value=(True, None)),
+            patch("smart_heating.api_handlers.areas.validate_area_id", return_value=(True, None)),
             patch(
-                "smart_heating.utils.validators.validate_temperature",
+                "smart_heating.api_handlers.areas.validate_temperature",
                 return_value=(False, "Temperature out of range"),
             ),
         ):
@@ -241,8 +356,10 @@ class TestAreaHandlers:
         data = {"temperature": 22.5}
 
         with (
-            patch("smart_heating.utils.validators.validate_area_id", return_value=(True, None)),
-            patch("smart_heating.utils.validators.validate_temperature", return_value=(True, None)),
+            patch("smart_heating.api_handlers.areas.validate_area_id", return_value=(True, None)),
+            patch(
+                "smart_heating.api_handlers.areas.validate_temperature", return_value=(True, None)
+            ),
         ):
             response = await handle_set_temperature(mock_hass, area_manager, "nonexistent", data)
 
@@ -267,19 +384,52 @@ class TestAreaHandlers:
         data = {"temperature": 22.5}
 
         with (
-            patch("smart_heating.utils.validators.validate_area_id", return_value=(True, None)),
-            patch("smart_heating.utils.validators.validate_temperature", return_value=(True, None)),
+            patch("smart_heating.api_handlers.areas.validate_area_id", return_value=(True, None)),
+            patch(
+                "smart_heating.api_handlers.areas.validate_temperature", return_value=(True, None)
+            ),
         ):
             response = await handle_set_temperature(
                 mock_hass, mock_area_manager, "living_room", data
             )
 
-            assert response.status == 200
+            assert response.status == 204
             assert not mock_area_manager.get_area.return_value.manual_override
 
+    @pytest.mark.asyncio
+    async def test_handle_set_temperature_computes_effective_once(
+        self, mock_hass, mock_area_manager
+    ):
+        """Test effective temperature is computed once, after the change."""
+        area = mock_area_manager.get_area.return_value
+
+        with patch("smart_heating.api_handlers.areas._LOGGER.isEnabledFor", return_value=True):
+            response = await handle_set_temperature(
+                mock_hass, mock_area_manager, "living_room", {"temperature": 22.5}
+            )
+
+        assert response.status == 204
+        area.get_effective_target_temperature.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_set_temperature_skips_log_context_when_disabled(
+        self, mock_hass, mock_area_manager
+    ):
+        """Test effective temperature is not computed when INFO logging is off."""
+        area = mock_area_manager.get_area.return_value
+
+        with patch("smart_heating.api_handlers.areas._LOGGER.isEnabledFor", return_value=False):
+            response = await handle_set_temperature(
+                mock_hass, mock_area_manager, "living_room", {"temperature": 22.5}
+            )
+
+        assert response.status == 204
+        area.get_effective_target_temperature.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_enable_area_success(self, mock_hass, mock_area_manager):
         """Test enabling an area."""
+        mock_area_manager.get_area.return_value.enabled = False
         mock_coordinator = MagicMock()
         mock_coordinator.data = {}
         mock_coordinator.async_request_refresh = AsyncMock()
@@ -289,17 +439,44 @@ class TestAreaHandlers:
 
         response = await handle_enable_area(mock_hass, mock_area_manager, "living_room")
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         mock_area_manager.enable_area.assert_called_once_with("living_room")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_climate.async_control_heating.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_handle_enable_area_refreshes_during_refresh(self, mock_hass, mock_area_manager):
+        """Test a change made while a refresh is in flight requests another one."""
+        mock_area_manager.get_area.return_value.enabled = False
+        release = asyncio.Event()
+
+        async def slow_refresh():
+            await release.wait()
+
+        mock_coordinator = MagicMock()
+        mock_coordinator.data = {}
+        mock_coordinator.async_request_refresh = AsyncMock(side_effect=slow_refresh)
+        mock_hass.data[DOMAIN]["test_coordinator"] = mock_coordinator
+        mock_hass.data[DOMAIN]["climate_controller"] = AsyncMock()
+
+        await handle_enable_area(mock_hass, mock_area_manager, "living_room")
+        first = mock_hass.data[DOMAIN]["refresh_task"]
+        await asyncio.sleep(0)
+        assert not first.done()
+
+        await handle_enable_area(mock_hass, mock_area_manager, "living_room")
+        release.set()
+        await asyncio.gather(first, mock_hass.data[DOMAIN]["refresh_task"])
+
+        assert mock_hass.async_create_background_task.call_count == 2
+        assert mock_hass.async_create_background_task.call_args.kwargs["name"]
+        assert mock_coordinator.async_request_refresh.await_count == 2
+
     @pytest.mark.asyncio
     async def test_handle_enable_area_clears_safety_alert(self, mock_hass, mock_area_manager):
         """Test enabling area clears safety alert."""
+        mock_area_manager.get_area.return_value.enabled = False
         mock_area_manager.is_safety_alert_active.return_value = True
         mock_safety = MagicMock()
         mock_hass.data[DOMAIN]["safety_monitor"] = mock_safety
@@ -313,12 +490,27 @@ class TestAreaHandlers:
 
         response = await handle_enable_area(mock_hass, mock_area_manager, "living_room")
 
-        assert response.status == 200
+        assert response.status == 204
         mock_area_manager.set_safety_alert_active.assert_called_once_with(False)
 
+    @pytest.mark.asyncio
+    async def test_handle_enable_area_already_enabled(self, mock_hass, mock_area_manager):
+        """Test enabling an enabled area skips save, control and refresh."""
+        mock_climate = AsyncMock()
+        mock_hass.data[DOMAIN]["climate_controller"] = mock_climate
+
+        response = await handle_enable_area(mock_hass, mock_area_manager, "living_room")
+
+        assert response.status == 204
+        mock_area_manager.enable_area.assert_not_called()
+        mock_area_manager.async_save_soon.assert_not_called()
+        mock_climate.async_control_heating.assert_not_called()
+        assert "refresh_task" not in mock_hass.data[DOMAIN]
+
     @pytest.mark.asyncio
     async def test_handle_enable_area_error(self, mock_hass, mock_area_manager):
         """Test enable area with error."""
+        mock_area_manager.get_area.return_value = None
         mock_area_manager.enable_area.side_effect = ValueError("Area not found")
 
         response = await handle_enable_area(mock_hass, mock_area_manager, "nonexistent")
@@ -339,12 +531,10 @@ class TestAreaHandlers:
 
         response = await handle_disable_area(mock_hass, mock_area_manager, "living_room")
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         mock_area_manager.disable_area.assert_called_once_with("living_room")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_climate.async_control_heating.assert_called_once()
 
     @pytest.mark.asyncio
@@ -368,12 +558,10 @@ class TestAreaHandlers:
 
         response = await handle_hide_area(mock_hass, mock_area_manager, "living_room")
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert mock_area_manager.get_area.return_value.hidden
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_hide_area_new(self, mock_hass, mock_area_registry):
@@ -381,6 +569,9 @@ class TestAreaHandlers:
         area_manager = MagicMock()
         area_manager.get_area.return_value = None  # Area doesn't exist
         area_manager.areas = {}
+        area_manager.add_area.side_effect = lambda area: area_manager.areas.update(
+            {area.area_id: area}
+        )
         area_manager.async_save = AsyncMock()
 
         mock_coordinator = MagicMock()
@@ -393,11 +584,12 @@ class TestAreaHandlers:
             patch("smart_heating.api_handlers.areas.Area") as mock_area_class,
         ):
             mock_new_area = MagicMock()
+            mock_new_area.area_id = "living_room"
             mock_area_class.return_value = mock_new_area
 
             response = await handle_hide_area(mock_hass, area_manager, "living_room")
 
-            assert response.status == 200
+            assert response.status == 204
             assert mock_new_area.hidden
             assert "living_room" in area_manager.areas
 
@@ -429,12 +621,10 @@ class TestAreaHandlers:
 
         response = await handle_unhide_area(mock_hass, mock_area_manager, "living_room")
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert not mock_area_manager.get_area.return_value.hidden
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_unhide_area_new(self, mock_hass, mock_area_registry):
@@ -458,9 +648,25 @@ class TestAreaHandlers:
 
             response = await handle_unhide_area(mock_hass, area_manager, "living_room")
 
-            assert response.status == 200
+            assert response.status == 204
             assert not mock_new_area.hidden
 
+    @pytest.mark.asyncio
+    async def test_handle_unhide_area_not_in_ha(self, mock_hass):
+        """Test unhiding area not in Home Assistant."""
+        area_manager = MagicMock()
+        area_manager.get_area.return_value = None
+        area_manager.async_save = AsyncMock()
+
+        registry = MagicMock()
+        registry.async_get_area.return_value = None  # Not in HA
+
+        with patch("smart_heating.api_handlers.areas.ar.async_get", return_value=registry):
+            response = await handle_unhide_area(mock_hass, area_manager, "nonexistent")
+
+            assert response.status == 404
+            area_manager.async_save_soon.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_set_switch_shutdown_success(self, mock_hass, mock_area_manager):
         """Test setting switch shutdown setting."""
@@ -474,12 +680,10 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert not mock_area_manager.get_area.return_value.shutdown_switches_when_idle
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_switch_shutdown_default(self, mock_hass, mock_area_manager):
@@ -494,7 +698,7 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         # Default is True
         assert mock_area_manager.get_area.return_value.shutdown_switches_when_idle
 
@@ -524,12 +728,10 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert mock_area_manager.get_area.return_value.hysteresis_override is None
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_area_hysteresis_custom(self, mock_hass, mock_area_manager):
@@ -544,12 +746,10 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert mock_area_manager.get_area.return_value.hysteresis_override == 0.5
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_area_hysteresis_missing_value(self, mock_hass, mock_area_manager):
@@ -574,11 +774,9 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
         assert mock_area_manager.get_area.return_value.heating_curve_coefficient is None
-        mock_area_manager.async_save.assert_called()
+        mock_area_manager.async_save_soon.assert_called()
 
     @pytest.mark.asyncio
     async def test_handle_set_area_heating_curve_set_coefficient(
@@ -591,13 +789,11 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
         assert mock_area_manager.get_area.return_value.heating_curve_coefficient == pytest.approx(
             1.8
         )
-        mock_area_manager.async_save.assert_called()
+        mock_area_manager.async_save_soon.assert_called()
 
     @pytest.mark.asyncio
     async def test_handle_set_area_hysteresis_out_of_range(self, mock_hass, mock_area_manager):
@@ -635,12 +831,10 @@ class TestAreaHandlers:
         data = {"auto_preset_enabled": True}
         response = await handle_set_auto_preset(mock_hass, mock_area_manager, "living_room", data)
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert mock_area_manager.get_area.return_value.auto_preset_enabled
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_auto_preset_not_found(self, mock_hass):
@@ -668,15 +862,13 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         area = mock_area_manager.get_area.return_value
         assert not area.use_global_away
         assert area.use_global_eco
         assert not area.use_global_comfort
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_area_preset_config_all_flags(self, mock_hass, mock_area_manager):
@@ -699,7 +891,7 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         area = mock_area_manager.get_area.return_value
         assert area.use_global_away
         assert not area.use_global_eco
@@ -709,6 +901,40 @@ class TestAreaHandlers:
         assert not area.use_global_activity
         assert area.use_global_presence
 
+    @pytest.mark.asyncio
+    async def test_handle_set_area_preset_config_temps(self, mock_hass, mock_area_manager):
+        """Test preset temperatures are set and unrelated keys ignored."""
+        area = mock_area_manager.get_area.return_value
+        area.boost_temp = 25.0
+
+        data = {"comfort_temp": "22", "eco_temp": 18, "boost_temp": 30.0}
+        response = await handle_set_area_preset_config(
+            mock_hass, mock_area_manager, "living_room", data
+        )
+
+        assert response.status == 204
+        assert area.comfort_temp == 22.0
+        assert area.eco_temp == 18.0
+        assert area.boost_temp == 25.0
+
+    @pytest.mark.asyncio
+    async def test_handle_set_area_preset_config_unchanged(self, mock_hass, mock_area_manager):
+        """Test resending the current configuration skips save and refresh."""
+        mock_coordinator = MagicMock()
+        mock_coordinator.data = {}
+        mock_coordinator.async_request_refresh = AsyncMock()
+        mock_hass.data[DOMAIN]["test_coordinator"] = mock_coordinator
+        mock_area_manager.get_area.return_value.comfort_temp = 21.0
+
+        data = {"use_global_away": True, "comfort_temp": 21.0}
+        response = await handle_set_area_preset_config(
+            mock_hass, mock_area_manager, "living_room", data
+        )
+
+        assert response.status == 204
+        mock_area_manager.async_save_soon.assert_not_called()
+        mock_coordinator.async_request_refresh.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_set_area_preset_config_not_found(self, mock_hass):
         """Test setting preset config for non-existent area."""
@@ -735,14 +961,24 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         assert mock_area_manager.get_area.return_value.manual_override
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_climate.async_control_heating.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_handle_set_manual_override_unchanged(self, mock_hass, mock_area_manager):
+        """Test setting the current manual override state is a no-op."""
+        mock_area_manager.get_area.return_value.manual_override = True
+
+        response = await handle_set_manual_override(
+            mock_hass, mock_area_manager, "living_room", {"enabled": True}
+        )
+
+        assert response.status == 204
+        mock_area_manager.async_save_soon.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_set_manual_override_disable_with_preset(
         self, mock_hass, mock_area_manager
@@ -764,7 +1000,7 @@ class TestAreaHandlers:
             mock_hass, mock_area_manager, "living_room", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         assert not mock_area.manual_override
         assert mock_area.target_temperature == pytest.approx(18.0)  # Updated to preset temp
 
@@ -833,9 +1069,9 @@ class TestHandleSetPrimaryTemperatureSensor:
             mock_hass, mock_area_manager, "area1", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         assert area.primary_temperature_sensor == "sensor.temp1"
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         climate_controller.async_update_area_temperatures.assert_called_once()
         climate_controller.async_control_heating.assert_called_once()
 
@@ -875,7 +1111,7 @@ class TestHandleSetPrimaryTemperatureSensor:
             mock_hass, mock_area_manager, "area1", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         assert area.primary_temperature_sensor == "climate.thermo1"
 
     @pytest.mark.asyncio
@@ -913,7 +1149,7 @@ class TestHandleSetPrimaryTemperatureSensor:
             mock_hass, mock_area_manager, "area1", data
         )
 
-        assert response.status == 200
+        assert response.status == 204
         assert area.primary_temperature_sensor is None
 
     @pytest.mark.asyncio
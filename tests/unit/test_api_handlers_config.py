@@ -117,6 +117,29 @@ async def test_handle_set_opentherm_gateway_updates_config_entry(hass: HomeAssis
     hass.config_entries.async_update_entry.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_handle_set_opentherm_gateway_unchanged_skips_entry_update(
+    hass: HomeAssistant,
+):
+    """Verify an unchanged gateway does not rewrite the config entry."""
+    area_manager = MagicMock(spec=AreaManager)
+    area_manager.set_opentherm_gateway = AsyncMock()
+
+    coordinator = MagicMock()
+    coordinator.config_entry = MagicMock()
+    coordinator.config_entry.options = {"opentherm_gateway_id": "gateway1"}
+    coordinator.hass = hass
+    hass.config_entries.async_update_entry = MagicMock()
+
+    response = await handle_set_opentherm_gateway(
+        area_manager, coordinator, {"gateway_id": "gateway1"}
+    )
+
+    assert response.status == 200
+    area_manager.set_opentherm_gateway.assert_called_once_with("gateway1")
+    hass.config_entries.async_update_entry.assert_not_called()
+
+
 class TestConfigHandlers:
     """Test configuration API handlers."""
 
@@ -148,6 +171,45 @@ class TestConfigHandlers:
         assert body["sleep_temp"] == pytest.approx(17.0)
         assert body["activity_temp"] == pytest.approx(21.0)
 
+    @pytest.mark.asyncio
+    async def test_handle_get_config_cached_until_version_changes(
+        self, mock_hass, mock_area_manager
+    ):
+        """Test config body is reused until the area manager is saved."""
+        mock_area_manager.version = 1
+        mock_area_manager.config_response_cache = None
+
+        first = await handle_get_config(mock_hass, mock_area_manager)
+        mock_area_manager.get_safety_sensors.reset_mock()
+        second = await handle_get_config(mock_hass, mock_area_manager)
+
+        assert second.body is first.body
+        mock_area_manager.get_safety_sensors.assert_not_called()
+
+        mock_area_manager.is_safety_alert_active.return_value = True
+        third = await handle_get_config(mock_hass, mock_area_manager)
+        assert json.loads(third.body)["safety_alert_active"] is True
+
+        mock_area_manager.version = 2
+        mock_area_manager.trv_heating_temp = 24.0
+        fourth = await handle_get_config(mock_hass, mock_area_manager)
+        assert json.loads(fourth.body)["trv_heating_temp"] == pytest.approx(24.0)
+
+    @pytest.mark.asyncio
+    async def test_handle_get_global_presets_cached_until_version_changes(self, mock_area_manager):
+        """Test global presets body is reused until the area manager is saved."""
+        mock_area_manager.version = 1
+        mock_area_manager.presets_response_cache = None
+
+        first = await handle_get_global_presets(mock_area_manager)
+        mock_area_manager.global_away_temp = 12.0
+        second = await handle_get_global_presets(mock_area_manager)
+        assert second.body is first.body
+
+        mock_area_manager.version = 2
+        third = await handle_get_global_presets(mock_area_manager)
+        assert json.loads(third.body)["away_temp"] == pytest.approx(12.0)
+
     @pytest.mark.asyncio
     async def test_handle_set_global_presets_all(self, mock_area_manager):
         """Test setting all global preset temperatures."""
@@ -172,7 +234,7 @@ class TestConfigHandlers:
         assert mock_area_manager.global_home_temp == pytest.approx(19.0)
         assert mock_area_manager.global_sleep_temp == pytest.approx(16.0)
         assert mock_area_manager.global_activity_temp == pytest.approx(22.0)
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_global_presets_partial(self, mock_area_manager):
@@ -212,7 +274,21 @@ class TestConfigHandlers:
         assert body["success"] is True
 
         assert mock_area_manager.hysteresis == pytest.approx(0.8)
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
+        mock_coordinator.async_request_refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_set_hysteresis_value_refreshes_once(
+        self, mock_hass, mock_area_manager, mock_coordinator
+    ):
+        """Test coordinator is refreshed once regardless of area count."""
+        mock_area_manager.areas = {f"area_{i}": MagicMock() for i in range(3)}
+
+        response = await handle_set_hysteresis_value(
+            mock_hass, mock_area_manager, mock_coordinator, {"hysteresis": 2.0}
+        )
+
+        assert response.status == 200
         mock_coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -229,7 +305,7 @@ class TestConfigHandlers:
         assert body["success"] is True
 
         assert mock_area_manager.hide_devices_panel is True
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_hide_devices_panel_false(self, mock_area_manager):
@@ -245,7 +321,7 @@ class TestConfigHandlers:
         assert body["success"] is True
 
         assert mock_area_manager.hide_devices_panel is False
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_hide_devices_panel_missing_value(self, mock_area_manager):
@@ -327,7 +403,7 @@ class TestConfigHandlers:
         assert mock_area_manager.pid_enabled
         assert mock_area_manager.overshoot_protection_enabled
         assert mock_area_manager.default_heating_curve_coefficient == pytest.approx(1.25)
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_advanced_control_config_invalid_coefficient(self, mock_area_manager):
@@ -335,6 +411,40 @@ class TestConfigHandlers:
         response = await handle_set_advanced_control_config(mock_area_manager, data)
         assert response.status == 400
 
+    @pytest.mark.asyncio
+    async def test_handle_set_advanced_control_config_invalid_applies_nothing(
+        self, mock_area_manager
+    ):
+        """Test a bad value rejects the whole update."""
+        mock_area_manager.pwm_enabled = False
+        data = {"pwm_enabled": True, "default_heating_curve_coefficient": "bad"}
+
+        response = await handle_set_advanced_control_config(mock_area_manager, data)
+
+        assert response.status == 400
+        assert mock_area_manager.pwm_enabled is False
+        mock_area_manager.async_save_soon.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_set_advanced_control_config_partial(self, mock_area_manager):
+        """Test only fields present in the request are applied."""
+        data = {"pwm_enabled": 1, "unknown": True}
+
+        response = await handle_set_advanced_control_config(mock_area_manager, data)
+
+        assert response.status == 200
+        assert mock_area_manager.pwm_enabled is True
+        assert mock_area_manager.pid_enabled is False
+        assert mock_area_manager.default_heating_curve_coefficient == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_handle_set_advanced_control_config_no_fields(self, mock_area_manager):
+        """Test a request without recognized fields is rejected."""
+        response = await handle_set_advanced_control_config(mock_area_manager, {"unknown": True})
+
+        assert response.status == 400
+        mock_area_manager.async_save_soon.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_get_global_presence(self, mock_area_manager):
         """Test getting global presence sensors."""
@@ -356,7 +466,7 @@ class TestConfigHandlers:
         assert body["success"] is True
 
         assert len(mock_area_manager.global_presence_sensors) == 2
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_frost_protection_both(self, mock_area_manager):
@@ -373,7 +483,7 @@ class TestConfigHandlers:
 
         assert mock_area_manager.frost_protection_enabled is True
         assert mock_area_manager.frost_protection_temp == pytest.approx(7.0)
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_frost_protection_enabled_only(self, mock_area_manager):
@@ -402,7 +512,7 @@ class TestConfigHandlers:
     @pytest.mark.asyncio
     async def test_handle_set_frost_protection_error(self, mock_area_manager):
         """Test frost protection with ValueError."""
-        mock_area_manager.async_save.side_effect = ValueError("Invalid value")
+        mock_area_manager.async_save_soon.side_effect = ValueError("Invalid value")
 
         data = {"enabled": True}
         response = await handle_set_frost_protection(mock_area_manager, data)
@@ -572,7 +682,7 @@ class TestConfigHandlers:
             alert_value="on",
             enabled=True,
         )
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_safety.async_reconfigure.assert_called_once()
         mock_hass.bus.async_fire.assert_called_once()
 
@@ -600,7 +710,7 @@ class TestConfigHandlers:
         assert body["success"] is True
 
         mock_area_manager.clear_safety_sensors.assert_called_once()
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_safety.async_reconfigure.assert_called_once()
         mock_hass.bus.async_fire.assert_called_once()
 
@@ -621,7 +731,7 @@ class TestConfigHandlers:
         assert body["hvac_mode"] == "cool"
 
         assert mock_area_manager.get_area.return_value.hvac_mode == "cool"
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -634,6 +744,25 @@ class TestConfigHandlers:
         body = json.loads(response.body.decode())
         assert "error" in body
 
+    @pytest.mark.asyncio
+    async def test_handle_set_hvac_mode_invalid_mode(self, mock_hass, mock_area_manager):
+        """Test setting an unknown HVAC mode is rejected before touching the area."""
+        data = {"hvac_mode": "turbo"}
+        response = await handle_set_hvac_mode(mock_hass, mock_area_manager, "living_room", data)
+
+        assert response.status == 400
+        mock_area_manager.get_area.assert_not_called()
+        mock_area_manager.async_save_soon.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_set_hvac_mode_non_string_mode(self, mock_hass, mock_area_manager):
+        """Test a non-string HVAC mode is rejected with 400 instead of raising."""
+        data = {"hvac_mode": ["heat"]}
+        response = await handle_set_hvac_mode(mock_hass, mock_area_manager, "living_room", data)
+
+        assert response.status == 400
+        mock_area_manager.get_area.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_set_hvac_mode_area_not_found(self, mock_hass, mock_area_manager):
         """Test setting HVAC mode for non-existent area."""
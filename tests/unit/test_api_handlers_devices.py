@@ -1,12 +1,15 @@
 """Tests for device API handlers."""
 
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp.test_utils import make_mocked_request
 from smart_heating.api_handlers import devices as devices_module
 from smart_heating.api_handlers.devices import (
     _discover_devices,
+    async_track_device_cache_invalidation,
     handle_add_device,
     handle_get_devices,
     handle_refresh_devices,
@@ -112,11 +115,9 @@ def mock_area_registry():
 @pytest.fixture(autouse=True)
 def clear_device_cache():
     """Clear device cache before each test."""
-    devices_module._devices_cache = None
-    devices_module._cache_timestamp = None
+    devices_module.invalidate_device_cache()
     yield
-    devices_module._devices_cache = None
-    devices_module._cache_timestamp = None
+    devices_module.invalidate_device_cache()
 
 
 class TestDeviceHandlers:
@@ -129,6 +130,7 @@ class TestDeviceHandlers:
         devices_module._devices_cache = [
             {"id": "climate.heater", "name": "Heater", "type": "climate"}
         ]
+        devices_module._cache_timestamp = time.monotonic()
 
         response = await handle_get_devices(mock_hass, mock_area_manager)
 
@@ -138,6 +140,169 @@ class TestDeviceHandlers:
         assert len(body["devices"]) == 1
         assert body["devices"][0]["id"] == "climate.heater"
 
+    @pytest.mark.asyncio
+    async def test_handle_get_devices_etag(self, mock_hass, mock_area_manager):
+        """Test a matching If-None-Match gets a 304 without a body."""
+        devices_module._devices_cache = [{"id": "climate.heater"}]
+        devices_module._cache_timestamp = time.monotonic()
+
+        first = await handle_get_devices(mock_hass, mock_area_manager)
+        etag = first.headers["ETag"]
+
+        request = make_mocked_request(
+            "GET", "/api/smart_heating/devices", headers={"If-None-Match": etag}
+        )
+        response = await handle_get_devices(mock_hass, mock_area_manager, request)
+        assert response.status == 304
+        assert response.body is None
+        assert response.headers["ETag"] == etag
+
+        request = make_mocked_request(
+            "GET", "/api/smart_heating/devices", headers={"If-None-Match": '"stale"'}
+        )
+        response = await handle_get_devices(mock_hass, mock_area_manager, request)
+        assert response.status == 200
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_handle_get_devices_reuses_encoded_body(self, mock_hass, mock_area_manager):
+        """Test cached devices are encoded once and re-encoded after replacement."""
+        devices_module._devices_cache = [{"id": "climate.heater"}]
+        devices_module._cache_timestamp = time.monotonic()
+
+        first = await handle_get_devices(mock_hass, mock_area_manager)
+        second = await handle_get_devices(mock_hass, mock_area_manager)
+        assert second.body is first.body
+
+        devices_module._devices_cache = [{"id": "climate.other"}]
+        third = await handle_get_devices(mock_hass, mock_area_manager)
+        assert json.loads(third.body)["devices"] == [{"id": "climate.other"}]
+
+    @pytest.mark.asyncio
+    async def test_handle_get_devices_expired_cache(self, mock_hass, mock_area_manager):
+        """Test an expired cache triggers rediscovery."""
+        devices_module._devices_cache = [{"id": "climate.old"}]
+        devices_module._cache_timestamp = time.monotonic() - devices_module.DEVICE_CACHE_TTL - 1
+
+        with patch(
+            "smart_heating.api_handlers.devices._discover_devices",
+            AsyncMock(return_value="rediscovered"),
+        ) as mock_discover:
+            response = await handle_get_devices(mock_hass, mock_area_manager)
+
+        assert response == "rediscovered"
+        mock_discover.assert_awaited_once_with(mock_hass, mock_area_manager, None)
+
+    def test_registry_update_invalidates_cache(self, mock_hass):
+        """Test registry update events drop the cache and unsubscribe cleans up."""
+        unsubs = [MagicMock() for _ in range(3)]
+        mock_hass.bus.async_listen.side_effect = unsubs
+
+        unsubscribe = async_track_device_cache_invalidation(mock_hass)
+
+        events = [c.args[0] for c in mock_hass.bus.async_listen.call_args_list]
+        assert events == [
+            "entity_registry_updated",
+            "device_registry_updated",
+            "area_registry_updated",
+        ]
+
+        devices_module._devices_cache = [{"id": "climate.heater"}]
+        devices_module._cache_timestamp = time.monotonic()
+        listener = mock_hass.bus.async_listen.call_args_list[0].args[1]
+        listener(MagicMock())
+        assert devices_module._devices_cache is None
+
+        unsubscribe()
+        for unsub in unsubs:
+            unsub.assert_called_once()
+
+    def test_discoverable_entities_temperature_sensors_only(self, mock_hass):
+        """Test only registry sensors with a temperature state are discovered."""
+        entries = []
+        for entity_id in ("sensor.temp", "sensor.humidity", "sensor.no_state"):
+            entry = MagicMock(entity_id=entity_id, domain="sensor")
+            entries.append(entry)
+        registry = MagicMock()
+        registry.entities.values.return_value = entries
+
+        temp_state = MagicMock(entity_id="sensor.temp")
+        temp_state.attributes = {"device_class": "temperature"}
+        humidity_state = MagicMock(entity_id="sensor.humidity")
+        humidity_state.attributes = {"device_class": "humidity"}
+        mock_hass.states.async_all.return_value = [temp_state, humidity_state]
+
+        result = devices_module._get_discoverable_entities(registry, mock_hass)
+
+        assert result == [(entries[0], temp_state)]
+        mock_hass.states.async_all.assert_called_once_with("sensor")
+        mock_hass.states.get.assert_not_called()
+
+    def test_device_info_index_looks_up_shared_device_once(self):
+        """Test entities of one device share a single registry lookup."""
+        climate_entry = MagicMock(device_id="device_123")
+        sensor_entry = MagicMock(device_id="device_123")
+        orphan_entry = MagicMock(device_id=None)
+        device = MagicMock(name_by_user=None, area_id="living_room")
+        device.name = "Thermostat"
+        device_reg = MagicMock()
+        device_reg.async_get.return_value = device
+        area_registry = MagicMock()
+        area_registry.async_get_area.return_value = MagicMock()
+        area_registry.async_get_area.return_value.name = "Living Room"
+
+        index = devices_module._build_device_info_index(
+            [(climate_entry, None), (sensor_entry, None), (orphan_entry, None)],
+            device_reg,
+            area_registry,
+        )
+
+        assert index == {"device_123": ("Thermostat", "living_room", "Living Room")}
+        device_reg.async_get.assert_called_once_with("device_123")
+        area_registry.async_get_area.assert_called_once_with("living_room")
+
+    def test_discoverable_entry_index(self, mock_hass, mock_entity_registry):
+        """Test the entry index is kept until the entity registry changes."""
+        mock_hass.bus.async_listen.side_effect = [MagicMock() for _ in range(3)]
+        unsubscribe = async_track_device_cache_invalidation(mock_hass)
+        entity_listener, device_listener, _ = (
+            c.args[1] for c in mock_hass.bus.async_listen.call_args_list
+        )
+
+        try:
+            devices_module._get_discoverable_entities(mock_entity_registry, mock_hass)
+            devices_module._get_discoverable_entities(mock_entity_registry, mock_hass)
+            assert mock_entity_registry.entities.values.call_count == 1
+
+            device_listener(MagicMock(event_type="device_registry_updated"))
+            devices_module._get_discoverable_entities(mock_entity_registry, mock_hass)
+            assert mock_entity_registry.entities.values.call_count == 1
+
+            entity_listener(
+                MagicMock(
+                    event_type="entity_registry_updated",
+                    data={"action": "update", "entity_id": "light.kitchen"},
+                )
+            )
+            devices_module._get_discoverable_entities(mock_entity_registry, mock_hass)
+            assert mock_entity_registry.entities.values.call_count == 1
+
+            entity_listener(
+                MagicMock(
+                    event_type="entity_registry_updated",
+                    data={
+                        "action": "update",
+                        "entity_id": "light.heater",
+                        "old_entity_id": "switch.heater",
+                    },
+                )
+            )
+            devices_module._get_discoverable_entities(mock_entity_registry, mock_hass)
+            assert mock_entity_registry.entities.values.call_count == 2
+        finally:
+            unsubscribe()
+        assert devices_module._discoverable_entries is None
+
     @pytest.mark.asyncio
     async def test_handle_get_devices_without_cache(
         self,
@@ -227,6 +392,10 @@ class TestDeviceHandlers:
             assert response.status == 200
             body = json.loads(response.body.decode())
             assert len(body["devices"]) == 2
+            assert {d["id"]: d["assigned_to_area"] for d in body["devices"]} == {
+                "climate.heater": "living_room",
+                "switch.pump": "living_room",
+            }
 
             # Verify cache was set
             assert devices_module._devices_cache is not None
@@ -274,7 +443,7 @@ class TestDeviceHandlers:
     async def test_handle_refresh_devices_error(self, mock_hass, mock_area_manager):
         """Test refreshing devices with error."""
         with patch(
-            "smart_heating.api_handlers.devices._discover_devices",
+            "smart_heating.api_handlers.devices._discover_devices_list",
             side_effect=Exception("Discovery failed"),
         ):
             response = await handle_refresh_devices(mock_hass, mock_area_manager)
@@ -286,18 +455,20 @@ class TestDeviceHandlers:
     @pytest.mark.asyncio
     async def test_handle_add_device_success(self, mock_hass, mock_area_manager):
         """Test adding a device to area."""
+        devices_module._devices_cache = [{"id": "climate.new_heater"}]
+        devices_module._cache_timestamp = time.monotonic()
         data = {"device_id": "climate.new_heater", "device_type": "climate"}
 
         response = await handle_add_device(mock_hass, mock_area_manager, "living_room", data)
 
-        assert response.status == 200
-        body = json.loads(response.body.decode())
-        assert body["success"]
+        assert response.status == 204
 
         mock_area_manager.add_device_to_area.assert_called_once_with(
             "living_room", "climate.new_heater", "climate", None
         )
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
+        # Cached payloads carry assigned_to_area, so the cache is dropped
+        assert devices_module._devices_cache is None
 
     @pytest.mark.asyncio
     async def test_handle_add_device_with_mqtt(self, mock_hass, mock_area_manager):
@@ -310,7 +481,7 @@ class TestDeviceHandlers:
 
         response = await handle_add_device(mock_hass, mock_area_manager, "living_room", data)
 
-        assert response.status == 200
+        assert response.status == 204
         mock_area_manager.add_device_to_area.assert_called_once_with(
             "living_room", "climate.mqtt_heater", "climate", "heating/control"
         )
@@ -352,6 +523,9 @@ class TestDeviceHandlers:
         area_manager = MagicMock()
         area_manager.get_area.return_value = None  # Area doesn't exist in storage
         area_manager.areas = {}
+        area_manager.add_area.side_effect = lambda area: area_manager.areas.update(
+            {area.area_id: area}
+        )
         area_manager.async_save = AsyncMock()
 
         data = {"device_id": "climate.heater", "device_type": "climate"}
@@ -363,11 +537,12 @@ class TestDeviceHandlers:
             patch("smart_heating.api_handlers.devices.Area") as mock_area_class,
         ):
             mock_new_area = MagicMock()
+            mock_new_area.area_id = "living_room"
             mock_area_class.return_value = mock_new_area
 
             response = await handle_add_device(mock_hass, area_manager, "living_room", data)
 
-            assert response.status == 200
+            assert response.status == 204
             # Verify area was created
             mock_area_class.assert_called_once_with("living_room", "Living Room")
             assert "living_room" in area_manager.areas
@@ -397,7 +572,7 @@ class TestDeviceHandlers:
         mock_area_manager.remove_device_from_area.assert_called_once_with(
             "living_room", "climate.heater"
         )
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_remove_device_error(self, mock_area_manager):
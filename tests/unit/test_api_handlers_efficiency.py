@@ -1,5 +1,6 @@
 """Tests for efficiency API handlers."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -140,6 +141,27 @@ async def test_handle_get_efficiency_report_all_areas(
     )
 
 
+@pytest.mark.asyncio
+async def test_handle_get_efficiency_report_area_names(
+    mock_hass, mock_area_manager, mock_efficiency_calculator
+):
+    """Test area reports use the area name, falling back to the area id."""
+    area = MagicMock()
+    area.name = "Living Room"
+    mock_area_manager.get_all_areas.return_value = {"area_1": area}
+    request = make_mocked_request(
+        "GET",
+        "/api/smart_heating/efficiency/all_areas?period=week",
+    )
+
+    response = await handle_get_efficiency_report(
+        mock_hass, mock_area_manager, mock_efficiency_calculator, request
+    )
+
+    reports = json.loads(response.body.decode())["area_reports"]
+    assert [r["area_name"] for r in reports] == ["Living Room", "area_2"]
+
+
 @pytest.mark.asyncio
 async def test_handle_get_efficiency_report_default_period(
     mock_hass, mock_area_manager, mock_efficiency_calculator
@@ -328,6 +350,32 @@ async def test_handle_get_area_efficiency_history(mock_hass, mock_efficiency_cal
     assert mock_efficiency_calculator.calculate_area_efficiency.call_count == 7
 
 
+@pytest.mark.asyncio
+async def test_handle_get_area_efficiency_history_oldest_first(
+    mock_hass, mock_efficiency_calculator
+):
+    """Test history periods are contiguous and returned oldest first."""
+
+    async def _metrics(area_id, period, start, end):
+        return {"start": start.isoformat(), "end": end.isoformat()}
+
+    mock_efficiency_calculator.calculate_area_efficiency = AsyncMock(side_effect=_metrics)
+    request = make_mocked_request(
+        "GET",
+        "/api/smart_heating/efficiency/history/test_area?periods=3&period_type=week",
+    )
+
+    response = await handle_get_area_efficiency_history(
+        mock_hass, mock_efficiency_calculator, request, "test_area"
+    )
+
+    history = json.loads(response.body.decode())["history"]
+    assert len(history) == 3
+    assert history[0]["end"] == history[1]["start"]
+    assert history[1]["end"] == history[2]["start"]
+    assert history[0]["start"] < history[2]["start"]
+
+
 @pytest.mark.asyncio
 async def test_handle_get_area_efficiency_history_default_params(
     mock_hass, mock_efficiency_calculator
@@ -33,6 +33,7 @@ def mock_history_tracker():
     tracker.set_retention_days = MagicMock()
     tracker.async_save = AsyncMock()
     tracker._async_cleanup_old_entries = AsyncMock()
+    tracker.get_cached_response = MagicMock(return_value=None)
     return tracker
 
 
@@ -91,6 +92,31 @@ class TestHistoryHandlers:
         # Verify history tracker was called with 24 hours
         mock_history_tracker.get_history.assert_called_once_with("living_room", hours=24)
 
+    @pytest.mark.asyncio
+    async def test_handle_get_history_cached(self, mock_hass, mock_history_tracker, mock_request):
+        """Test a cached response is served without querying the tracker."""
+        mock_history_tracker.get_cached_response.return_value = b'{"cached":true}'
+
+        response = await handle_get_history(mock_hass, "living_room", mock_request)
+
+        assert response.body == b'{"cached":true}'
+        mock_history_tracker.get_cached_response.assert_called_once_with(
+            ("living_room", None, None, None)
+        )
+        mock_history_tracker.get_history.assert_not_called()
+        mock_history_tracker.cache_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_get_history_populates_cache(
+        self, mock_hass, mock_history_tracker, mock_request
+    ):
+        """Test a fresh response is stored in the tracker's cache."""
+        response = await handle_get_history(mock_hass, "living_room", mock_request)
+
+        mock_history_tracker.cache_response.assert_called_once_with(
+            ("living_room", None, None, None), response.body
+        )
+
     @pytest.mark.asyncio
     async def test_handle_get_history_custom_hours(
         self, mock_hass, mock_history_tracker, mock_request
@@ -215,6 +241,22 @@ class TestHistoryHandlers:
         assert "record_interval_seconds" in body
         assert "record_interval_minutes" in body
 
+    @pytest.mark.asyncio
+    async def test_handle_get_history_config_tracks_retention_change(
+        self, mock_hass, mock_history_tracker
+    ):
+        """Test cached history config is refreshed when retention changes."""
+        import json
+
+        first = await handle_get_history_config(mock_hass)
+        again = await handle_get_history_config(mock_hass)
+        assert again.body == first.body
+
+        mock_history_tracker.get_retention_days.return_value = 60
+        response = await handle_get_history_config(mock_hass)
+
+        assert json.loads(response.body.decode())["retention_days"] == 60
+
     @pytest.mark.asyncio
     async def test_handle_get_history_config_no_tracker(self, mock_hass):
         """Test getting history config when tracker not available."""
@@ -1,7 +1,7 @@
 """Tests for import/export API handlers - Basic smoke tests."""
 
 import json
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from smart_heating.api_handlers.import_export import (
@@ -18,6 +18,7 @@ def mock_hass():
     """Create mock Home Assistant instance."""
     hass = MagicMock()
     hass.data = {"smart_heating": {"vacation_manager": MagicMock()}}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
     return hass
 
 
@@ -181,79 +182,75 @@ class TestBackupHandlers:
 
         assert response.status == 200
 
-    async def test_list_backups_with_files(self, mock_hass, mock_config_manager):
+    async def test_list_backups_with_files(self, mock_hass, mock_config_manager, tmp_path):
         """Test listing backups when files exist."""
-        from pathlib import Path
         from unittest.mock import PropertyMock
 
-        # Mock backup directory with files
-        backup_dir = MagicMock(spec=Path)
-        backup_dir.exists.return_value = True
-
-        # Mock backup file
-        mock_file = MagicMock(spec=Path)
-        mock_file.name = "backup_20240115_120000.json"
-        mock_stat = MagicMock()
-        mock_stat.st_size = 1024
-        mock_stat.st_mtime = 1705320000.0
-        mock_file.stat.return_value = mock_stat
-
-        backup_dir.glob.return_value = [mock_file]
-        type(mock_config_manager).backup_dir = PropertyMock(return_value=backup_dir)
+        (tmp_path / "backup_20240115_120000.json").write_text("{}")
+        (tmp_path / "backup_20240116_120000.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("ignored")
+        type(mock_config_manager).backup_dir = PropertyMock(return_value=tmp_path)
 
         response = await handle_list_backups(mock_hass, mock_config_manager)
 
         assert response.status == 200
         data = json.loads(response.body)
-        assert "backups" in data
-        assert len(data["backups"]) == 1
-        assert data["backups"][0]["filename"] == "backup_20240115_120000.json"
-
-    async def test_restore_backup_not_found(self, mock_hass, mock_config_manager):
+        assert [b["filename"] for b in data["backups"]] == [
+            "backup_20240116_120000.json",
+            "backup_20240115_120000.json",
+        ]
+        assert data["backups"][0]["size"] == 2
+        mock_hass.async_add_executor_job.assert_awaited_once()
+
+    async def test_restore_backup_not_found(self, mock_hass, mock_config_manager, tmp_path):
         """Test restoring non-existent backup."""
-        from pathlib import Path
         from unittest.mock import PropertyMock
 
-        # Mock backup directory
-        backup_dir = MagicMock(spec=Path)
-        backup_file = MagicMock(spec=Path)
-        backup_file.exists.return_value = False
-        backup_dir.__truediv__.return_value = backup_file
-        type(mock_config_manager).backup_dir = PropertyMock(return_value=backup_dir)
+        type(mock_config_manager).backup_dir = PropertyMock(return_value=tmp_path)
 
         response = await handle_restore_backup(mock_hass, mock_config_manager, "nonexistent.json")
 
         assert response.status == 404
 
-    async def test_restore_backup_success(self, mock_hass, mock_config_manager):
+    async def test_restore_backup_success(self, mock_hass, mock_config_manager, tmp_path):
         """Test successful backup restore."""
-        from pathlib import Path
         from unittest.mock import PropertyMock
 
-        # Mock backup directory and file
-        backup_dir = MagicMock(spec=Path)
-        backup_file = MagicMock(spec=Path)
-        backup_file.exists.return_value = True
-        backup_file.__str__.return_value = "/path/to/backup.json"
-        backup_dir.__truediv__.return_value = backup_file
-        type(mock_config_manager).backup_dir = PropertyMock(return_value=backup_dir)
-
-        # Mock file content
-        backup_content = json.dumps(
-            {
-                "version": "0.6.0",
-                "areas": {},
-                "global_settings": {},
-            }
-        )
+        backup_data = {"version": "0.6.0", "areas": {}, "global_settings": {}}
+        (tmp_path / "backup.json").write_text(json.dumps(backup_data))
+        type(mock_config_manager).backup_dir = PropertyMock(return_value=tmp_path)
 
-        with patch("builtins.open", mock_open(read_data=backup_content)):
-            response = await handle_restore_backup(mock_hass, mock_config_manager, "backup.json")
+        response = await handle_restore_backup(mock_hass, mock_config_manager, "backup.json")
 
         assert response.status == 200
         data = json.loads(response.body)
         assert data["success"] is True
+        mock_config_manager.async_import_config.assert_awaited_once_with(
+            backup_data, create_backup=True
+        )
+        mock_hass.async_add_executor_job.assert_awaited_once()
+
+    async def test_restore_backup_invalid_json(self, mock_hass, mock_config_manager, tmp_path):
+        """Test a corrupt backup file is rejected."""
+        from unittest.mock import PropertyMock
+
+        (tmp_path / "backup.json").write_text("{not json")
+        type(mock_config_manager).backup_dir = PropertyMock(return_value=tmp_path)
+
         response = await handle_restore_backup(mock_hass, mock_config_manager, "backup.json")
 
-        # Any response is fine for smoke test
-        assert response is not None
+        assert response.status == 400
+        mock_config_manager.async_import_config.assert_not_called()
+
+    async def test_restore_backup_too_large(self, mock_hass, mock_config_manager, tmp_path):
+        """Test an oversized backup file is rejected before parsing."""
+        from unittest.mock import PropertyMock
+
+        (tmp_path / "backup.json").write_text("{}")
+        type(mock_config_manager).backup_dir = PropertyMock(return_value=tmp_path)
+
+        with patch("smart_heating.api_handlers.import_export.MAX_BACKUP_SIZE", 1):
+            response = await handle_restore_backup(mock_hass, mock_config_manager, "backup.json")
+
+        assert response.status == 400
+        mock_config_manager.async_import_config.assert_not_called()
@@ -95,7 +95,7 @@ class TestScheduleHandlers:
             assert "schedule" in body
 
             mock_area_manager.get_area.return_value.add_schedule.assert_called_once()
-            mock_area_manager.async_save.assert_called_once()
+            mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_add_schedule_with_preset_mode(self, mock_hass, mock_area_manager):
@@ -180,6 +180,9 @@ class TestScheduleHandlers:
         area_manager = MagicMock()
         area_manager.get_area.return_value = None  # Area doesn't exist
         area_manager.areas = {}
+        area_manager.add_area.side_effect = lambda area: area_manager.areas.update(
+            {area.area_id: area}
+        )
         area_manager.async_save = AsyncMock()
 
         data = {"temperature": 22.0, "time": "08:00"}
@@ -199,6 +202,7 @@ class TestScheduleHandlers:
             patch("smart_heating.api_handlers.schedules.Schedule") as mock_schedule_class,
         ):
             mock_new_area = MagicMock()
+            mock_new_area.area_id = "living_room"
             mock_area_class.return_value = mock_new_area
 
             mock_schedule = MagicMock()
@@ -306,7 +310,7 @@ class TestScheduleHandlers:
         mock_area_manager.remove_schedule_from_area.assert_called_once_with(
             "living_room", "sched_123"
         )
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_executor.clear_schedule_cache.assert_called_once_with("living_room")
 
     @pytest.mark.asyncio
@@ -352,7 +356,7 @@ class TestScheduleHandlers:
         assert body["preset_mode"] == "eco"
 
         mock_area_manager.get_area.return_value.set_preset_mode.assert_called_once_with("eco")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_climate.async_control_heating.assert_called_once()
 
     @pytest.mark.asyncio
@@ -415,7 +419,7 @@ class TestScheduleHandlers:
         assert body["duration"] == 120
 
         mock_area_manager.get_area.return_value.set_boost_mode.assert_called_once_with(120, 25.0)
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_set_boost_mode_default_duration(self, mock_hass, mock_area_manager):
@@ -460,7 +464,7 @@ class TestScheduleHandlers:
         assert not body["boost_active"]
 
         mock_area_manager.get_area.return_value.cancel_boost_mode.assert_called_once()
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handle_cancel_boost_area_not_found(self, mock_hass, mock_area_manager):
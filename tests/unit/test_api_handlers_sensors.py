@@ -72,7 +72,7 @@ class TestAddWindowSensor:
         mock_area.add_window_sensor.assert_called_once_with(
             "binary_sensor.living_room_window", "turn_off", 2.0
         )
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_hass.data["smart_heating"]["entry_id_123"].async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -149,7 +149,7 @@ class TestRemoveWindowSensor:
         assert body["success"] is True
 
         mock_area.remove_window_sensor.assert_called_once_with("binary_sensor.living_room_window")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_hass.data["smart_heating"]["entry_id_123"].async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -200,7 +200,7 @@ class TestAddPresenceSensor:
         assert body["entity_id"] == "person.john"
 
         mock_area.add_presence_sensor.assert_called_once_with("person.john")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_hass.data["smart_heating"]["entry_id_123"].async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -265,7 +265,7 @@ class TestRemovePresenceSensor:
         assert body["success"] is True
 
         mock_area.remove_presence_sensor.assert_called_once_with("person.john")
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
         mock_hass.data["smart_heating"]["entry_id_123"].async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
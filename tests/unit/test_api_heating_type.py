@@ -1,5 +1,6 @@
 """Unit tests for heating type API handler."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,6 +12,9 @@ def mock_hass():
     """Create a mock Home Assistant instance."""
     hass = MagicMock()
     hass.data = {"smart_heating": {}}
+    hass.async_create_background_task = MagicMock(
+        side_effect=lambda coro, name: asyncio.ensure_future(coro)
+    )
     return hass
 
 
@@ -42,9 +46,9 @@ class TestHandleSetHeatingType:
         data = {"heating_type": "floor_heating"}
         response = await handle_set_heating_type(mock_hass, mock_area_manager, "test_area", data)
 
-        assert response.status == 200
+        assert response.status == 204
         assert mock_area.heating_type == "floor_heating"
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_radiator_type(self, mock_hass, mock_area_manager, mock_area):
@@ -54,9 +58,9 @@ class TestHandleSetHeatingType:
         data = {"heating_type": "radiator"}
         response = await handle_set_heating_type(mock_hass, mock_area_manager, "test_area", data)
 
-        assert response.status == 200
+        assert response.status == 204
         assert mock_area.heating_type == "radiator"
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_custom_overhead_temp(self, mock_hass, mock_area_manager, mock_area):
@@ -66,8 +70,8 @@ class TestHandleSetHeatingType:
         data = {"custom_overhead_temp": 8.0}
         response = await handle_set_heating_type(mock_hass, mock_area_manager, "test_area", data)
 
-        assert response.status == 200
-        mock_area_manager.async_save.assert_called_once()
+        assert response.status == 204
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_both_type_and_overhead(self, mock_hass, mock_area_manager, mock_area):
@@ -77,9 +81,9 @@ class TestHandleSetHeatingType:
         data = {"heating_type": "floor_heating", "custom_overhead_temp": 8.0}
         response = await handle_set_heating_type(mock_hass, mock_area_manager, "test_area", data)
 
-        assert response.status == 200
+        assert response.status == 204
         assert mock_area.heating_type == "floor_heating"
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_clear_custom_overhead(self, mock_hass, mock_area_manager, mock_area):
@@ -90,9 +94,9 @@ class TestHandleSetHeatingType:
         data = {"custom_overhead_temp": None}
         response = await handle_set_heating_type(mock_hass, mock_area_manager, "test_area", data)
 
-        assert response.status == 200
+        assert response.status == 204
         assert mock_area.custom_overhead_temp is None
-        mock_area_manager.async_save.assert_called_once()
+        mock_area_manager.async_save_soon.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_invalid_heating_type(self, mock_hass, mock_area_manager, mock_area):
@@ -170,5 +174,6 @@ class TestHandleSetHeatingType:
                 mock_hass, mock_area_manager, "test_area", data
             )
 
-        assert response.status == 200
+        assert response.status == 204
+        await mock_hass.data["smart_heating"]["refresh_task"]
         mock_coordinator.async_request_refresh.assert_called_once()
@@ -3,7 +3,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
-from smart_heating.api import SmartHeatingAPIView, SmartHeatingStaticView, SmartHeatingUIView
+from smart_heating.api import (
+    _AREA_DATA_POST_HANDLERS,
+    SmartHeatingAPIView,
+    SmartHeatingStaticView,
+    SmartHeatingUIView,
+)
 from smart_heating.const import DOMAIN
 
 
@@ -17,17 +22,17 @@ async def test_api_view_post_more_endpoints(hass, mock_area_manager):
     api_view = SmartHeatingAPIView(hass, mock_area_manager)
 
     with (
-        patch(
-            "smart_heating.api.handle_set_temperature",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"temperature": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
-        patch(
-            "smart_heating.api.handle_set_preset_mode",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"preset_mode": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
-        patch(
-            "smart_heating.api.handle_set_area_heating_curve",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"heating_curve": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
         patch(
             "smart_heating.api.handle_set_hysteresis_value",
@@ -41,17 +46,17 @@ async def test_api_view_post_more_endpoints(hass, mock_area_manager):
             "smart_heating.api.handle_set_advanced_control_config",
             AsyncMock(return_value=web.json_response({"ok": True})),
         ),
-        patch(
-            "smart_heating.api.handle_set_switch_shutdown",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"switch_shutdown": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
-        patch(
-            "smart_heating.api.handle_set_heating_type",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"heating_type": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
-        patch(
-            "smart_heating.api.handle_set_manual_override",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"manual_override": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
         patch(
             "smart_heating.api.handle_set_focus",
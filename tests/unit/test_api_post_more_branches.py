@@ -3,7 +3,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
-from smart_heating.api import SmartHeatingAPIView
+from smart_heating.api import (
+    _AREA_ACTION_POST_HANDLERS,
+    _AREA_DATA_POST_HANDLERS,
+    SmartHeatingAPIView,
+)
 from smart_heating.const import DOMAIN
 
 
@@ -20,24 +24,6 @@ async def test_api_view_post_many_branches(hass, mock_area_manager):
     from contextlib import ExitStack
 
     all_handlers = [
-        "smart_heating.api.handle_disable_area",
-        "smart_heating.api.handle_hide_area",
-        "smart_heating.api.handle_unhide_area",
-        "smart_heating.api.handle_cancel_boost",
-        "smart_heating.api.handle_add_schedule",
-        "smart_heating.api.handle_set_preset_mode",
-        "smart_heating.api.handle_set_boost_mode",
-        "smart_heating.api.handle_add_window_sensor",
-        "smart_heating.api.handle_add_presence_sensor",
-        "smart_heating.api.handle_set_hvac_mode",
-        "smart_heating.api.handle_set_area_heating_curve",
-        "smart_heating.api.handle_set_switch_shutdown",
-        "smart_heating.api.handle_set_area_hysteresis",
-        "smart_heating.api.handle_set_heating_type",
-        "smart_heating.api.handle_set_auto_preset",
-        "smart_heating.api.handle_set_area_preset_config",
-        "smart_heating.api.handle_set_manual_override",
-        "smart_heating.api.handle_set_primary_temperature_sensor",
         "smart_heating.api.handle_set_history_config",
         "smart_heating.api.handle_migrate_history_storage",
         "smart_heating.api.handle_set_global_presence",
@@ -60,6 +46,10 @@ async def test_api_view_post_many_branches(hass, mock_area_manager):
             stack.enter_context(
                 patch(h, AsyncMock(return_value=web.json_response({"ok": True})), create=True)
             )
+        # Area POST handlers are referenced directly by the dispatch tables
+        for table in (_AREA_ACTION_POST_HANDLERS, _AREA_DATA_POST_HANDLERS):
+            mock_handler = AsyncMock(return_value=web.json_response({"ok": True}))
+            stack.enter_context(patch.dict(table, dict.fromkeys(table, mock_handler)))
 
         # call many endpoints with JSON bodies as needed
         endpoints_with_json = [
@@ -1,5 +1,6 @@
 """Tests for safety sensor API handlers."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -43,9 +44,9 @@ async def test_get_safety_sensor_empty(mock_area_manager):
     response = await handle_get_safety_sensor(mock_area_manager)
 
     assert response.status == 200
-    data = response.body
-    assert b'"sensors": []' in data
-    assert b'"alert_active": false' in data
+    data = json.loads(response.body)
+    assert data["sensors"] == []
+    assert data["alert_active"] is False
 
 
 @pytest.mark.asyncio
@@ -70,9 +71,9 @@ async def test_get_safety_sensor_with_sensors(mock_area_manager):
     response = await handle_get_safety_sensor(mock_area_manager)
 
     assert response.status == 200
-    data = response.body
-    assert b'"alert_active": true' in data
-    assert b'"sensor_id": "binary_sensor.smoke_detector"' in data
+    data = json.loads(response.body)
+    assert data["alert_active"] is True
+    assert data["sensor_id"] == "binary_sensor.smoke_detector"
 
 
 @pytest.mark.asyncio
@@ -110,7 +111,7 @@ async def test_set_safety_sensor_success(mock_hass, mock_area_manager):
     response = await handle_set_safety_sensor(mock_hass, mock_area_manager, data)
 
     assert response.status == 200
-    assert b'"success": true' in response.body
+    assert json.loads(response.body)["success"] is True
 
     # Verify add_safety_sensor was called with correct parameters
     mock_area_manager.add_safety_sensor.assert_called_once_with(
@@ -121,7 +122,7 @@ async def test_set_safety_sensor_success(mock_hass, mock_area_manager):
     )
 
     # Verify save was called
-    mock_area_manager.async_save.assert_called_once()
+    mock_area_manager.async_save_soon.assert_called_once()
 
     # Verify safety monitor reconfigure was called
     safety_monitor = mock_hass.data["smart_heating"]["safety_monitor"]
@@ -160,13 +161,13 @@ async def test_remove_safety_sensor_success(mock_hass, mock_area_manager):
     response = await handle_remove_safety_sensor(mock_hass, mock_area_manager, sensor_id)
 
     assert response.status == 200
-    assert b'"success": true' in response.body
+    assert json.loads(response.body)["success"] is True
 
     # Verify remove_safety_sensor was called
     mock_area_manager.remove_safety_sensor.assert_called_once_with(sensor_id)
 
     # Verify save was called
-    mock_area_manager.async_save.assert_called_once()
+    mock_area_manager.async_save_soon.assert_called_once()
 
     # Verify safety monitor reconfigure was called
     safety_monitor = mock_hass.data["smart_heating"]["safety_monitor"]
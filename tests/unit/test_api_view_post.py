@@ -3,7 +3,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from aiohttp import web
 from aiohttp.test_utils import make_mocked_request
-from smart_heating.api import SmartHeatingAPIView
+from smart_heating.api import (
+    _AREA_ACTION_POST_HANDLERS,
+    _AREA_DATA_POST_HANDLERS,
+    SmartHeatingAPIView,
+)
 from smart_heating.const import DOMAIN
 
 
@@ -18,13 +22,13 @@ async def test_api_view_post_endpoints(hass, mock_area_manager):
 
     # Patch handlers used in POST
     with (
-        patch(
-            "smart_heating.api.handle_enable_area",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_ACTION_POST_HANDLERS,
+            {"enable": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
-        patch(
-            "smart_heating.api.handle_add_device",
-            AsyncMock(return_value=web.json_response({"ok": True})),
+        patch.dict(
+            _AREA_DATA_POST_HANDLERS,
+            {"devices": AsyncMock(return_value=web.json_response({"ok": True}))},
         ),
         patch(
             "smart_heating.api.handle_set_frost_protection",
@@ -13,6 +13,7 @@ from smart_heating.const import (
     DEFAULT_COMFORT_TEMP,
     DEFAULT_ECO_TEMP,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
 from smart_heating.models import Area
@@ -158,6 +159,27 @@ class TestAreaManagerSaving:
             saved_data = mock_save.call_args[0][0]
             assert saved_data["areas"] == []
 
+    async def test_async_save_soon_coalesces_writes(self, area_manager: AreaManager):
+        """Test debounced saves schedule a single delayed write."""
+        area_manager.safety_sensors = []
+
+        with patch.object(area_manager._store, "async_delay_save") as mock_delay_save:
+            area_manager.async_save_soon()
+            area_manager.async_save_soon()
+
+            assert area_manager.version == 2
+            assert mock_delay_save.call_count == 2
+            data_func, delay = mock_delay_save.call_args[0]
+            assert delay == STORAGE_SAVE_DELAY
+            assert data_func()["areas"] == []
+
+    def test_mark_live_state_changed(self, area_manager: AreaManager):
+        """Test runtime state changes bump only the live version."""
+        area_manager.mark_live_state_changed()
+
+        assert area_manager.live_version == 1
+        assert area_manager.version == 0
+
 
 class TestAreaRetrieval:
     """Test area retrieval operations."""
@@ -172,6 +194,15 @@ class TestAreaRetrieval:
         assert result == area
         assert result.name == TEST_AREA_NAME
 
+    def test_add_area(self, area_manager: AreaManager):
+        """Test registering an area links it to the manager."""
+        area = Area(TEST_AREA_ID, TEST_AREA_NAME)
+
+        area_manager.add_area(area)
+
+        assert area_manager.get_area(TEST_AREA_ID) is area
+        assert area.area_manager is area_manager
+
     def test_get_area_not_exists(self, area_manager: AreaManager):
         """Test getting a non-existent area."""
         result = area_manager.get_area("nonexistent")
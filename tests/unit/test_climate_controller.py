@@ -49,6 +49,7 @@ async def test_async_control_heating_disabled_and_manual_override(mock_hass, moc
     cc.protection_handler.async_handle_disabled_area = AsyncMock()
     await cc.async_control_heating()
     cc.protection_handler.async_handle_disabled_area.assert_called()
+    mock_area_manager.mark_live_state_changed.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -117,6 +118,7 @@ def mock_area_manager(mock_hass):
     manager.frost_protection_enabled = True
     manager.frost_protection_temp = DEFAULT_FROST_PROTECTION_TEMP
     manager.opentherm_gateway_id = None
+    manager.hysteresis = 0.5
     return manager
 
 
@@ -207,6 +209,22 @@ class TestClimateControllerInit:
 
         assert controller._hysteresis == pytest.approx(0.5)
 
+    def test_hysteresis_follows_area_manager(
+        self, mock_hass, mock_area_manager, mock_learning_engine
+    ):
+        """Test hysteresis is read from and written to the area manager."""
+        controller = ClimateController(
+            hass=mock_hass,
+            area_manager=mock_area_manager,
+            learning_engine=mock_learning_engine,
+        )
+
+        mock_area_manager.hysteresis = 1.2
+        assert controller._hysteresis == pytest.approx(1.2)
+
+        controller._hysteresis = 0.8
+        assert mock_area_manager.hysteresis == pytest.approx(0.8)
+
 
 class TestTemperatureConversion:
     """Test temperature conversion methods."""
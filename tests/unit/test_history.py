@@ -364,6 +364,43 @@ class TestHistoryTrackerGet:
         assert len(result) == 2
 
 
+class TestHistoryTrackerResponseCache:
+    """Test the encoded response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_response_cleared_on_record(self, history_tracker):
+        """Test a new history entry drops cached responses."""
+        key = ("living_room", None, None, None)
+        history_tracker.cache_response(key, b"{}")
+        assert history_tracker.get_cached_response(key) == b"{}"
+
+        await history_tracker.async_record_temperature("living_room", 20.0, 21.0, "idle")
+
+        assert history_tracker.get_cached_response(key) is None
+
+    def test_cached_response_expires(self, history_tracker):
+        """Test cached responses expire after one record interval."""
+        key = ("living_room", "24", None, None)
+        with patch("smart_heating.history.time.monotonic", return_value=1000.0):
+            history_tracker.cache_response(key, b"{}")
+        with patch("smart_heating.history.time.monotonic", return_value=1299.0):
+            assert history_tracker.get_cached_response(key) == b"{}"
+        with patch("smart_heating.history.time.monotonic", return_value=1300.0):
+            assert history_tracker.get_cached_response(key) is None
+
+    def test_cached_response_evicts_least_recently_used(self, history_tracker):
+        """Test the cache is bounded and evicts the oldest unused entry."""
+        with patch("smart_heating.history.HISTORY_RESPONSE_CACHE_SIZE", 2):
+            history_tracker.cache_response(("a",), b"a")
+            history_tracker.cache_response(("b",), b"b")
+            history_tracker.get_cached_response(("a",))
+            history_tracker.cache_response(("c",), b"c")
+
+        assert history_tracker.get_cached_response(("a",)) == b"a"
+        assert history_tracker.get_cached_response(("b",)) is None
+        assert history_tracker.get_cached_response(("c",)) == b"c"
+
+
 class TestHistoryTrackerRetention:
     """Test retention settings."""
 
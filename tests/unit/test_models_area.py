@@ -208,6 +208,17 @@ class TestAreaModel:
         area.set_preset_mode(PRESET_COMFORT)
         assert area.preset_mode == PRESET_COMFORT
 
+    def test_area_set_target_temperature(self):
+        """Test setting the base target temperature."""
+        area = Area(
+            area_id=TEST_AREA_ID,
+            name=TEST_AREA_NAME,
+            target_temperature=TEST_TEMPERATURE,
+        )
+
+        area.set_target_temperature(22.5)
+        assert area.target_temperature == pytest.approx(22.5)
+
     def test_area_current_temperature_property(self):
         """Test current temperature property."""
         area = Area(
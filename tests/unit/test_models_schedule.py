@@ -167,6 +167,16 @@ class TestToDict:
         assert result["enabled"] is True
         assert result["days"] == [0, 2]
 
+    def test_to_dict_float_days(self):
+        """Test float day indices are stored and returned as ints."""
+        schedule = Schedule("schedule1", "08:00", temperature=21.0, days=[1.0, 3.0])
+
+        result = schedule.to_dict()
+
+        assert result["days"] == [1, 3]
+        assert all(type(d) is int for d in result["days"])
+        assert type(result["day"]) is int
+
     def test_to_dict_with_preset_mode(self):
         """Test to_dict with preset mode."""
         schedule = Schedule("schedule1", "08:00", preset_mode="comfort", days=[0])
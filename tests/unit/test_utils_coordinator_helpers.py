@@ -2,13 +2,86 @@
 
 from unittest.mock import MagicMock, Mock
 
+import pytest
 from smart_heating.utils.coordinator_helpers import (
+    get_climate_controller,
     get_coordinator,
     get_coordinator_devices,
+    get_coordinator_devices_by_area,
+    get_domain_data,
+    get_entry_coordinator,
     safe_coordinator_data,
 )
 
 
+class TestGetDomainData:
+    """Tests for get_domain_data function."""
+
+    def test_get_domain_data_found(self):
+        """Test getting domain data when the integration is set up."""
+        hass = MagicMock()
+        domain_data = {"climate_controller": Mock()}
+        hass.data = {"smart_heating": domain_data}
+
+        assert get_domain_data(hass) is domain_data
+
+    def test_get_domain_data_missing_is_shared_and_read_only(self):
+        """Test the fallback is a shared, immutable empty mapping."""
+        hass = MagicMock()
+        hass.data = {}
+
+        first = get_domain_data(hass)
+        assert first.get("climate_controller") is None
+        assert first is get_domain_data(hass)
+        with pytest.raises(TypeError):
+            first["climate_controller"] = Mock()
+
+
+class TestGetClimateController:
+    """Tests for get_climate_controller function."""
+
+    def test_get_climate_controller_found(self):
+        """Test getting the climate controller when set up."""
+        hass = MagicMock()
+        controller = Mock()
+        hass.data = {"smart_heating": {"climate_controller": controller}}
+
+        assert get_climate_controller(hass) is controller
+
+    def test_get_climate_controller_not_set_up(self):
+        """Test None is returned before the integration is set up."""
+        hass = MagicMock()
+        hass.data = {}
+
+        assert get_climate_controller(hass) is None
+
+
+class TestGetEntryCoordinator:
+    """Tests for get_entry_coordinator function."""
+
+    def test_get_entry_coordinator_skips_service_keys(self):
+        """Test that shared service entries are never returned."""
+        hass = MagicMock()
+        coordinator = Mock()
+        hass.data = {
+            "smart_heating": {
+                "area_manager": Mock(),
+                "history": Mock(),
+                "efficiency_calculator": Mock(),
+                "test_entry_id": coordinator,
+            }
+        }
+
+        assert get_entry_coordinator(hass) is coordinator
+
+    def test_get_entry_coordinator_only_services(self):
+        """Test that None is returned when no config entry is stored."""
+        hass = MagicMock()
+        hass.data = {"smart_heating": {"area_manager": Mock(), "history": Mock()}}
+
+        assert get_entry_coordinator(hass) is None
+
+
 class TestGetCoordinator:
     """Tests for get_coordinator function."""
 
@@ -132,6 +205,39 @@ class TestGetCoordinatorDevices:
         assert result == {}
 
 
+class TestGetCoordinatorDevicesByArea:
+    """Tests for get_coordinator_devices_by_area function."""
+
+    def test_get_coordinator_devices_by_area_success(self):
+        """Test indexing devices for all areas at once."""
+        hass = MagicMock()
+
+        coordinator = Mock()
+        coordinator.data = {
+            "areas": {
+                "living_room": {"devices": [{"id": "device1"}, {"id": "device2"}]},
+                "kitchen": {"devices": [{"id": "device3"}]},
+                "hall": {},
+            }
+        }
+        coordinator.async_request_refresh = Mock()
+        hass.data = {"smart_heating": {"config_entry_id": coordinator}}
+
+        result = get_coordinator_devices_by_area(hass)
+
+        assert set(result["living_room"]) == {"device1", "device2"}
+        assert result["kitchen"]["device3"] == {"id": "device3"}
+        assert result["hall"] == {}
+        assert result["kitchen"] == get_coordinator_devices(hass, "kitchen")
+
+    def test_get_coordinator_devices_by_area_no_coordinator(self):
+        """Test indexing devices when coordinator not found."""
+        hass = MagicMock()
+        hass.data = {}
+
+        assert get_coordinator_devices_by_area(hass) == {}
+
+
 class TestSafeCoordinatorData:
     """Tests for safe_coordinator_data function."""
 
@@ -1,10 +1,17 @@
 """Tests for response builder utilities."""
 
+import json
 from unittest.mock import MagicMock, Mock
 
+import orjson
+from aiohttp.test_utils import make_mocked_request
+from smart_heating.models import Area, Schedule
 from smart_heating.utils.response_builders import (
     build_area_response,
     build_device_info,
+    etag_for,
+    etag_matches,
+    json_response,
 )
 
 
@@ -80,6 +87,40 @@ class TestBuildDeviceInfo:
 class TestBuildAreaResponse:
     """Tests for build_area_response function."""
 
+    def test_build_area_response_real_area_defaults(self):
+        """Test a freshly created Area yields defaults and JSON-native values."""
+        area = Area("living_room", "Living Room")
+
+        result = build_area_response(area)
+
+        assert result["manual_override"] is False
+        assert result["auto_preset_home"] == "home"
+        assert result["auto_preset_away"] == "away"
+        assert result["shutdown_switches_when_idle"] is True
+        assert result["heating_type"] == "radiator"
+        assert result["shutdown_switch_entities"] == []
+        assert json.loads(json.dumps(result)) == result
+
+    def test_build_area_response_encodes_without_default_hook(self):
+        """Test area payloads only hold types orjson encodes natively."""
+        area = Area("living_room", "Living Room")
+        area.add_schedule(
+            Schedule(
+                "s1",
+                start_time="07:00",
+                end_time="09:00",
+                days=["mon", "tue"],
+                temperature=21.0,
+            )
+        )
+        area.add_window_sensor("binary_sensor.window", "reduce_temperature", 3.0)
+
+        result = build_area_response(area, [{"id": "climate.heater", "type": "thermostat"}])
+
+        # No default= callback: any non-native value would raise here
+        assert orjson.loads(orjson.dumps(result)) == result
+        assert result["schedules"][0]["days"] == [0, 1]
+
     def test_build_area_response_minimal(self):
         """Test building area response with minimal data."""
         area = MagicMock()
@@ -289,3 +330,53 @@ class TestBuildAreaResponse:
 
         # Legacy attribute is ignored; default is True
         assert result["shutdown_switches_when_idle"] is True
+
+
+class TestJsonResponse:
+    """Tests for json_response function."""
+
+    def test_json_response_default_status(self):
+        """Test payload is encoded as JSON with status 200."""
+        response = json_response({"success": True, "areas": [{"id": "a1"}]})
+
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        assert json.loads(response.body) == {"success": True, "areas": [{"id": "a1"}]}
+
+    def test_json_response_error_status(self):
+        """Test error payloads keep their status code."""
+        response = json_response({"error": "Area x not found"}, status=404)
+
+        assert response.status == 404
+        assert json.loads(response.text) == {"error": "Area x not found"}
+
+    def test_json_response_pre_encoded_body(self):
+        """Test already-encoded bytes are sent unchanged."""
+        body = b'{"error":"enabled field is required"}'
+        response = json_response(body, status=400)
+
+        assert response.status == 400
+        assert response.body is body
+
+
+class TestEtag:
+    """Tests for etag_for and etag_matches functions."""
+
+    def test_etag_for_is_stable(self):
+        """Test equal bodies share an ETag and different bodies do not."""
+        assert etag_for(b'{"a":1}') == etag_for(b'{"a":1}')
+        assert etag_for(b'{"a":1}') != etag_for(b'{"a":2}')
+
+    def test_etag_matches(self):
+        """Test If-None-Match matching against the current ETag."""
+        etag = etag_for(b"{}")
+
+        def request(header):
+            return make_mocked_request("GET", "/", headers={"If-None-Match": header})
+
+        assert etag_matches(request(f'"{etag}"'), etag)
+        assert etag_matches(request(f'"stale", "{etag}"'), etag)
+        assert etag_matches(request("*"), etag)
+        assert not etag_matches(request('"stale"'), etag)
+        assert not etag_matches(make_mocked_request("GET", "/"), etag)
+        assert not etag_matches(None, etag)
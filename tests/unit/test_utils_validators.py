@@ -55,6 +55,12 @@ class TestValidateTemperature:
         assert is_valid is True
         assert error is None
 
+    def test_validate_temperature_just_above_max(self):
+        """Test values just above the bound are not rounded into range."""
+        is_valid, error = validate_temperature(35.04)
+        assert is_valid is False
+        assert "between" in error
+
 
 class TestValidateAreaId:
     """Tests for area ID validation."""